@@ -0,0 +1,3 @@
+"""
+Micro-benchmarks for the game solvers (run from the repository root: ``python -m benchmarks.run``)
+"""
@@ -0,0 +1,98 @@
+"""
+Frame benchmarks: one update() + draw() of every game screen, timed through PerformanceMonitor
+
+Needs pygame; the screens render to SDL's dummy video driver. Without pygame
+nothing is registered and the solver/logic benchmarks still run.
+"""
+
+import importlib
+import os
+import random
+
+from benchmarks.harness import Benchmark, register
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+GAME_CLASSES = {
+    'card_nim': ('games.card_nim.game', 'CardNimGame'),
+    'take_coins': ('games.take_coins.game', 'TakeCoinsGame'),
+    'split_cards': ('games.split_cards.game', 'SplitCardsGame'),
+    'dawson_kayles': ('games.dawson_kayles.game', 'DawsonKaylesGame'),
+    'subtract_factor': ('games.subtract_factor.game', 'SubtractFactorGame'),
+}
+
+FRAMES = 120
+DIFFICULTY = 2
+SEED = 2024
+
+
+def _init_display():
+    """Headless display the game screens can draw on"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    from utils.helpers import FontManager
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font_manager = FontManager(SCREEN_HEIGHT)
+    font_manager.initialize_fonts()
+    return screen, font_manager
+
+
+def _headless_game_class(game_class):
+    """The game with the blocking mode/difficulty dialogs replaced by a fixed PvE start"""
+
+    class HeadlessGame(game_class):
+        def initialize_game_settings(self):
+            self.should_return_to_menu = False
+            self.logic.initialize_game("PVE", DIFFICULTY)
+
+    return HeadlessGame
+
+
+class FrameBenchmark:
+    """Lazily builds one game screen and steps it a frame per call"""
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.game = None
+        self.monitor = None
+
+    def setup(self):
+        if self.game is None:
+            from utils.performance_monitor import PerformanceMonitor
+
+            screen, font_manager = _init_display()
+            module_name, class_name = GAME_CLASSES[self.game_id]
+            game_class = getattr(importlib.import_module(module_name), class_name)
+            random.seed(SEED)
+            self.game = _headless_game_class(game_class)(screen, font_manager)
+            self.monitor = PerformanceMonitor(max_samples=FRAMES)
+        return self
+
+    def frame(self):
+        from utils.performance_monitor import PerformanceProfiler
+
+        self.monitor.start_frame()
+        pygame.event.pump()
+        with PerformanceProfiler("update", self.monitor):
+            self.game.update()
+        with PerformanceProfiler("draw", self.monitor):
+            self.game.draw()
+        self.monitor.end_frame()
+
+    def stats(self):
+        """PerformanceMonitor's frame numbers for the timed frames"""
+        return self.monitor.get_performance_stats() if self.monitor else {}
+
+
+if pygame is not None:
+    for game_id in GAME_CLASSES:
+        frames = FrameBenchmark(game_id)
+        register(Benchmark(f"{game_id}.frame[update+draw]", lambda bench: bench.frame(),
+                           setup=frames.setup, repeats=FRAMES, group="frames",
+                           stats=frames.stats))
@@ -0,0 +1,63 @@
+"""
+Game-logic benchmarks: PvE setup and full AI-vs-AI games for every games/*/logic.py
+
+Solver caches stay warm here, as they are for a player starting a second game.
+"""
+
+import random
+
+from benchmarks.harness import Benchmark, register
+
+from core.engine import ENGINES, create_engine
+from games.card_nim.logic import CardNimLogic
+from games.dawson_kayles.logic import DawsonKaylesLogic
+from games.split_cards.logic import SplitCardsLogic
+from games.subtract_factor.logic import SubtractFactorLogic
+from games.take_coins.logic import TakeCoinsLogic
+
+LOGIC_CLASSES = {
+    'card_nim': CardNimLogic,
+    'take_coins': TakeCoinsLogic,
+    'split_cards': SplitCardsLogic,
+    'dawson_kayles': DawsonKaylesLogic,
+    'subtract_factor': SubtractFactorLogic,
+}
+
+SEED = 2024
+
+
+def _initialize(game_id, difficulty):
+    logic_class = LOGIC_CLASSES[game_id]
+
+    def setup():
+        random.seed(SEED + difficulty)
+        return logic_class()
+
+    def func(logic):
+        logic.initialize_game("PVE", difficulty)
+    return setup, func
+
+
+def _self_play(logic_difficulty):
+    def func(engine):
+        while not engine.is_terminal():
+            move = engine.ai_move(logic_difficulty)
+            if move is None or not engine.apply(move):
+                break
+    return func
+
+
+def _self_play_setup(game_id, difficulty):
+    def setup():
+        random.seed(SEED + difficulty)
+        return create_engine(game_id, difficulty, "PVE")
+    return setup
+
+
+for game_id in sorted(ENGINES):
+    for difficulty in (1, 4):
+        setup, func = _initialize(game_id, difficulty)
+        register(Benchmark(f"{game_id}.initialize_game[PVE,difficulty={difficulty}]",
+                           func, setup=setup, repeats=500, group=game_id))
+    register(Benchmark(f"{game_id}.self_play[difficulty=3]", _self_play(3),
+                       setup=_self_play_setup(game_id, 3), repeats=200, group=game_id))
@@ -0,0 +1,160 @@
+"""
+Solver hot-path benchmarks for every game
+
+Positions come from fixed seeds so runs stay comparable. Benchmarks named
+"cold" clear the shared solver caches before every repeat.
+"""
+
+import math
+import random
+
+from benchmarks.harness import Benchmark, register
+
+from games.card_nim import nim_analysis
+from games.card_nim.logic import AutoPlayer
+from games.dawson_kayles import bitboard
+from games.dawson_kayles.logic import DawsonKaylesLogic
+from games.dawson_kayles.solver import transposition_table
+from games.split_cards.logic import SplitCardsLogic
+from games.subtract_factor.logic import SubtractFactorLogic
+from games.subtract_factor.solver import subtract_factor_solver
+from games.take_coins.logic import TakeCoinsLogic
+from games.take_coins.solver import take_coins_solver
+
+# Same boards as TakeCoinsLogic.initialize_game (longest board per difficulty)
+TAKE_COINS_LENGTHS = {1: 10, 2: 11, 3: 12, 4: 14}
+
+
+# ---------- Dawson-Kayles ----------
+
+def _dawson_kayles_setup(num_towers):
+    rng = random.Random(num_towers)
+    board = bitboard.full_board(num_towers)
+    # A few connections so the board has several runs
+    for _ in range(num_towers // 6):
+        moves = bitboard.available_moves(board)
+        if moves:
+            board = bitboard.make_move(board, rng.choice(moves))
+
+    def setup():
+        transposition_table.clear()
+        logic = DawsonKaylesLogic()
+        logic.num_towers = num_towers
+        logic.board = board
+        return logic
+    return setup
+
+
+for towers in (10, 20, 30, 40):
+    register(Benchmark(f"dawson_kayles.judge_win[towers={towers},cold]",
+                       lambda logic: logic.judge_win(),
+                       setup=_dawson_kayles_setup(towers), repeats=1000,
+                       group="dawson_kayles"))
+
+
+# ---------- Take Coins ----------
+
+def _take_coins_setup(length):
+    rng = random.Random(length)
+    coins = [rng.randint(1, 3) for _ in range(length)]
+
+    def setup():
+        # The shipped retrograde table stays loaded; only the search caches are cold
+        take_coins_solver.grundy_cache.clear()
+        take_coins_solver.outcome_cache.clear()
+        logic = TakeCoinsLogic()
+        logic.coins = list(coins)
+        return logic
+    return setup
+
+
+for difficulty, length in TAKE_COINS_LENGTHS.items():
+    register(Benchmark(f"take_coins.judge_win[difficulty={difficulty},positions={length},cold]",
+                       lambda logic: logic.judge_win(),
+                       setup=_take_coins_setup(length), repeats=5,
+                       # 11 个位置的冷启动求解在不同进程间稳定地落在约 140us 或 240us 两档
+                       tolerance=100.0 if length == 11 else None,
+                       group="take_coins"))
+
+
+# ---------- Subtract Factor ----------
+
+def _subtract_factor_setup(n):
+    def setup():
+        subtract_factor_solver.tables.clear()
+        logic = SubtractFactorLogic()
+        logic.initial_n = n
+        logic.threshold_k = int(math.sqrt(n) * 1.5)
+        return logic
+    return setup
+
+
+for exponent in (3, 4, 5, 6):
+    n = 10 ** exponent
+    register(Benchmark(f"subtract_factor.calculate_winning_positions[n=10^{exponent},cold]",
+                       lambda logic: logic.calculate_winning_positions(),
+                       setup=_subtract_factor_setup(n), repeats=3 if exponent >= 6 else 10,
+                       group="subtract_factor"))
+
+
+# ---------- Split Cards ----------
+
+def _split_cards_setup(num_piles, total):
+    rng = random.Random(num_piles * 1000 + total)
+    cuts = sorted(rng.sample(range(1, total), num_piles - 1))
+    piles = [b - a for a, b in zip([0] + cuts, cuts + [total])]
+    logic = SplitCardsLogic()
+    logic.card_piles = piles
+    logic.max_take = max(piles)
+    return lambda: logic
+
+
+for num_piles, total in ((6, 50), (10, 400)):
+    register(Benchmark(f"split_cards.get_valid_moves[piles={num_piles},cards={total}]",
+                       lambda logic: logic.get_valid_moves(),
+                       setup=_split_cards_setup(num_piles, total), repeats=20, number=50,
+                       group="split_cards"))
+    register(Benchmark(f"split_cards.find_winning_move[piles={num_piles},cards={total}]",
+                       lambda logic: logic.find_winning_move(),
+                       setup=_split_cards_setup(num_piles, total), repeats=20, number=2000,
+                       group="split_cards"))
+
+
+# ---------- Card Nim ----------
+
+def _card_nim_setup(num_positions):
+    rng = random.Random(num_positions)
+    positions = [rng.randint(1, 10) for _ in range(num_positions)]
+    if not any(positions) or _nim_sum(positions) == 0:
+        positions[0] += 1
+    player = AutoPlayer(positions)
+    return lambda: player
+
+
+def _nim_sum(positions):
+    total = 0
+    for count in positions:
+        total ^= count
+    return total
+
+
+for positions in (6, 12):
+    register(Benchmark(f"card_nim.AutoPlayer.find_winning_move[positions={positions}]",
+                       lambda player: player.find_winning_move(),
+                       setup=_card_nim_setup(positions), repeats=20, number=5000,
+                       group="card_nim"))
+
+
+def _card_nim_batch_setup(num_boards):
+    rng = random.Random(num_boards)
+    boards = [[rng.randint(1, 10) for _ in range(8)] for _ in range(num_boards)]
+    if nim_analysis.HAS_NUMPY:
+        boards = nim_analysis.np.array(boards)
+    return lambda: boards
+
+
+for boards in (1000,):
+    register(Benchmark(f"card_nim.batch_winning_moves[boards={boards}]",
+                       nim_analysis.batch_winning_moves,
+                       setup=_card_nim_batch_setup(boards), repeats=20, number=20,
+                       group="card_nim"))
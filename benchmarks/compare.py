@@ -0,0 +1,234 @@
+"""
+Benchmark regression gate: rerun the suite and compare it with a stored baseline
+
+    python -m benchmarks.compare                     # against benchmarks/baseline.json
+    python -m benchmarks.compare --threshold 15 --filter take_coins
+    python -m benchmarks.compare --update            # record a new baseline
+
+Exits with status 1 and prints a diff table when a median or peak memory grows
+by more than the threshold. p95 and frame-time stats are reported (--all) but
+never fail the gate: on microsecond-scale calls they swing by more than any
+useful threshold between runs of identical code. A benchmark whose median is
+itself bimodal across processes sets its own `tolerance` in the suite. Before
+failing, benchmarks with a regressed median are rerun in a fresh interpreter
+(--retries) and keep their best median: some medians are bimodal across
+processes, and a real regression reproduces on every rerun while noise does not.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from benchmarks.harness import (format_bytes, format_row, format_seconds, load_results,
+                                results_document, run_suite, save_results)
+from benchmarks.suite import BENCHMARKS
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'benchmarks', 'baseline.json')
+
+TIMING_METRICS = ['median', 'p95']
+# Every timing field of a results entry, replaced together when a benchmark is rerun
+TIMING_FIELDS = ['min', 'median', 'mean', 'p95', 'max']
+MEMORY_METRIC = 'peak_memory'
+# PerformanceMonitor.get_performance_stats keys compared for frame benchmarks
+FRAME_STATS = ['frame_time_ms', 'update_time_ms', 'draw_time_ms']
+# Only these can be a REGRESSION; the rest are informational
+GATED_METRICS = {'median', MEMORY_METRIC}
+
+
+@dataclass
+class Comparison:
+    """One metric of one benchmark, baseline vs current"""
+    name: str
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    kind: str  # 'seconds', 'bytes' or 'ms'
+    status: str = "ok"
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change in percent (positive = slower / bigger)"""
+        if self.baseline is None or self.current is None or self.baseline == 0:
+            return None
+        return (self.current - self.baseline) / self.baseline * 100
+
+
+def _format_value(value: Optional[float], kind: str) -> str:
+    if value is None:
+        return "-"
+    if kind == 'bytes':
+        return format_bytes(value)
+    if kind == 'ms':
+        return f"{value:.3f}ms"
+    return format_seconds(value)
+
+
+def _metrics(entry: Dict[str, Any]) -> Dict[str, tuple]:
+    """metric name -> (value, kind) for one benchmark entry of a results document"""
+    metrics = {metric: (entry.get(metric), 'seconds') for metric in TIMING_METRICS}
+    metrics[MEMORY_METRIC] = (entry.get(MEMORY_METRIC), 'bytes')
+    stats = entry.get('stats') or {}
+    for key in FRAME_STATS:
+        if key in stats:
+            metrics[f"stats.{key}"] = (stats[key], 'ms')
+    return metrics
+
+
+def compare_documents(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+                      memory_threshold: float, min_time: float, min_memory: int) -> List[Comparison]:
+    """Compare every metric present in either document"""
+    comparisons = []
+    base_entries = baseline.get('benchmarks', {})
+    current_entries = current.get('benchmarks', {})
+
+    for name in sorted(set(base_entries) | set(current_entries)):
+        if name not in current_entries:
+            comparisons.append(Comparison(name, "-", None, None, 'seconds', "not run"))
+            continue
+        if name not in base_entries:
+            comparisons.append(Comparison(name, "-", None, None, 'seconds', "new"))
+            continue
+
+        base_metrics = _metrics(base_entries[name])
+        tolerance = current_entries[name].get('tolerance')
+        for metric, (value, kind) in _metrics(current_entries[name]).items():
+            base_value = base_metrics.get(metric, (None, kind))[0]
+            comparison = Comparison(name, metric, base_value, value, kind)
+            change = comparison.change
+            if change is not None:
+                # 绝对差值低于噪声下限时不算回退
+                floor = min_memory if kind == 'bytes' else min_time * (1000 if kind == 'ms' else 1)
+                limit = memory_threshold if kind == 'bytes' else threshold
+                if metric == 'median' and tolerance is not None:
+                    limit = tolerance
+                gated = metric in GATED_METRICS
+                if abs(value - base_value) <= floor:
+                    pass
+                elif change > limit:
+                    comparison.status = "REGRESSION" if gated else "slower"
+                elif change < -limit:
+                    comparison.status = "improved" if gated else "faster"
+            comparisons.append(comparison)
+    return comparisons
+
+
+def rerun_benchmark(name: str) -> Optional[Dict[str, Any]]:
+    """Run one benchmark again in a fresh interpreter; its results entry, or None if that failed"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rerun.json')
+        completed = subprocess.run([sys.executable, '-m', 'benchmarks.run', '--filter', name, '--output', path],
+                                   cwd=ROOT_DIR, capture_output=True, text=True)
+        if completed.returncode != 0 or not os.path.exists(path):
+            return None
+        return load_results(path)['benchmarks'].get(name)
+
+
+def format_table(comparisons: List[Comparison], show_all: bool = False) -> str:
+    """Diff table; by default only gated rows that are not plain 'ok'"""
+    rows = [c for c in comparisons
+            if show_all or (c.status != "ok" and (c.metric == "-" or c.metric in GATED_METRICS))]
+    if not rows:
+        return "No differences beyond the threshold."
+
+    header = f"{'benchmark':<60} {'metric':<22} {'baseline':>11} {'current':>11} {'change':>9}  status"
+    lines = [header, "-" * len(header)]
+    for c in rows:
+        change = c.change
+        change_text = f"{change:+.1f}%" if change is not None else "-"
+        lines.append(f"{c.name:<60} {c.metric:<22} {_format_value(c.baseline, c.kind):>11} "
+                     f"{_format_value(c.current, c.kind):>11} {change_text:>9}  {c.status}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare",
+                                     description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline results JSON")
+    parser.add_argument('--threshold', type=float, default=25.0,
+                        help="allowed slowdown of the median in percent")
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help="allowed peak memory growth in percent (defaults to --threshold)")
+    parser.add_argument('--min-time', type=float, default=5e-6,
+                        help="ignore timing changes smaller than this many seconds")
+    parser.add_argument('--min-memory', type=int, default=16384,
+                        help="ignore peak memory changes smaller than this many bytes")
+    parser.add_argument('--retries', type=int, default=3,
+                        help="rerun benchmarks with a regressed median this many times before failing")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--current', help="compare this results JSON instead of rerunning the suite")
+    parser.add_argument('--output', help="also write the current results to this JSON file")
+    parser.add_argument('--update', action='store_true', help="write the current results as the new baseline")
+    parser.add_argument('--all', action='store_true', help="show unchanged metrics too")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.current:
+        current = load_results(args.current)
+    else:
+        results = run_suite(BENCHMARKS, args.filter)
+        if not results:
+            print(f"No benchmarks match '{args.filter}'")
+            return 1
+        current = results_document(results)
+
+    if args.update:
+        if args.output:
+            save_results(current, args.output)
+        if args.filter and os.path.exists(args.baseline):
+            # 只重跑了部分基准时，合并进已有基线而不是覆盖
+            merged = load_results(args.baseline)
+            merged['benchmarks'].update(current['benchmarks'])
+            current = dict(current, benchmarks=merged['benchmarks'])
+        save_results(current, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline not found: {args.baseline} (create one with --update)")
+        return 1
+    baseline = load_results(args.baseline)
+    if args.filter:
+        baseline['benchmarks'] = {name: entry for name, entry in baseline.get('benchmarks', {}).items()
+                                  if args.filter in name}
+
+    memory_threshold = args.threshold if args.memory_threshold is None else args.memory_threshold
+    comparisons = compare_documents(baseline, current, args.threshold, memory_threshold,
+                                    args.min_time, args.min_memory)
+    for _ in range(0 if args.current else args.retries):
+        flagged = {c.name for c in comparisons if c.status == "REGRESSION" and c.metric == 'median'}
+        if not flagged:
+            break
+        # 真实的回退每次重跑都会复现，噪声不会
+        print(f"\nRe-running {len(flagged)} benchmark(s) with a regressed median")
+        for name in sorted(flagged):
+            entry, previous = rerun_benchmark(name), current['benchmarks'][name]
+            if entry is not None and entry['median'] < previous['median']:
+                # 只换计时；单独重跑时缓存状态不同，峰值内存不可比
+                previous.update({key: entry[key] for key in TIMING_FIELDS})
+            print(format_row(previous), flush=True)
+        comparisons = compare_documents(baseline, current, args.threshold, memory_threshold,
+                                        args.min_time, args.min_memory)
+    if args.output:
+        save_results(current, args.output)
+    print()
+    print(format_table(comparisons, args.all))
+
+    regressions = [c for c in comparisons if c.status == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:g}% "
+              f"(baseline from {baseline.get('created', 'unknown')}, {baseline.get('platform', '')})")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Plain timing harness for the solver benchmarks
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Benchmarks import the game logic straight from src/, like main.py does
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@dataclass
+class Benchmark:
+    """One timed call. `setup` runs (untimed) before every repeat and returns the call's argument"""
+    name: str
+    func: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+    repeats: int = 20
+    number: int = 1  # Calls per repeat, for hot paths that finish in microseconds
+    group: str = ""
+    stats: Optional[Callable[[], Dict[str, float]]] = None  # Extra numbers collected after the run
+    tolerance: Optional[float] = None  # Allowed median growth in percent, overrides the compare threshold
+
+
+@dataclass
+class BenchmarkResult:
+    """Per-call timings (seconds) of one benchmark"""
+    name: str
+    group: str
+    repeats: int
+    number: int
+    timings: List[float] = field(default_factory=list)
+    peak_memory: int = 0  # tracemalloc peak (bytes) of one call
+    stats: Dict[str, float] = field(default_factory=dict)
+    tolerance: Optional[float] = None
+
+    def percentile(self, fraction: float) -> float:
+        """Nearest-rank percentile of the per-call timings"""
+        ordered = sorted(self.timings)
+        index = max(0, math.ceil(fraction * len(ordered)) - 1)
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'group': self.group,
+            'repeats': self.repeats,
+            'number': self.number,
+            'min': min(self.timings),
+            'median': statistics.median(self.timings),
+            'mean': statistics.fmean(self.timings),
+            'p95': self.percentile(0.95),
+            'max': max(self.timings),
+            'peak_memory': self.peak_memory,
+            'stats': self.stats,
+            'tolerance': self.tolerance,
+        }
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def register(benchmark: Benchmark) -> Benchmark:
+    """Add a benchmark to the suite"""
+    BENCHMARKS.append(benchmark)
+    return benchmark
+
+
+def measure_peak_memory(benchmark: Benchmark) -> int:
+    """tracemalloc peak of a single call; runs untimed, so it also warms the code path"""
+    argument = benchmark.setup()
+    tracemalloc.start()
+    try:
+        benchmark.func(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(benchmark: Benchmark) -> BenchmarkResult:
+    """Time `benchmark.repeats` rounds of `benchmark.number` calls each"""
+    result = BenchmarkResult(benchmark.name, benchmark.group, benchmark.repeats, benchmark.number,
+                             tolerance=benchmark.tolerance)
+    result.peak_memory = measure_peak_memory(benchmark)
+    for _ in range(benchmark.repeats):
+        argument = benchmark.setup()
+        started = time.perf_counter()
+        for _ in range(benchmark.number):
+            benchmark.func(argument)
+        result.timings.append((time.perf_counter() - started) / benchmark.number)
+    if benchmark.stats is not None:
+        result.stats = benchmark.stats()
+    return result
+
+
+def run_suite(benchmarks: List[Benchmark], pattern: Optional[str] = None,
+              progress: bool = True) -> List[BenchmarkResult]:
+    """Run every benchmark whose name contains `pattern`"""
+    results = []
+    for benchmark in benchmarks:
+        if pattern and pattern not in benchmark.name:
+            continue
+        result = run_benchmark(benchmark)
+        if progress:
+            print(format_row(result.to_dict()), flush=True)
+        results.append(result)
+    return results
+
+
+def format_seconds(seconds: float) -> str:
+    """Readable duration with a fitting unit"""
+    if seconds >= 1:
+        return f"{seconds:.3f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    return f"{seconds * 1e6:.2f}us"
+
+
+def format_bytes(size: float) -> str:
+    """Readable memory size"""
+    if abs(size) >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f}MB"
+    if abs(size) >= 1024:
+        return f"{size / 1024:.1f}KB"
+    return f"{size:.0f}B"
+
+
+def format_row(stats: Dict[str, Any]) -> str:
+    """One line of the results table"""
+    return (f"{stats['name']:<60} median {format_seconds(stats['median']):>10}"
+            f"  p95 {format_seconds(stats['p95']):>10}  min {format_seconds(stats['min']):>10}"
+            f"  peak {format_bytes(stats.get('peak_memory', 0)):>9}")
+
+
+def results_document(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """JSON document for a run, with enough environment info to compare runs"""
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'benchmarks': {result.name: result.to_dict() for result in results},
+    }
+
+
+def save_results(document: Dict[str, Any], path: str):
+    """Write a results document as JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read a results document written by save_results"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,43 @@
+"""
+Run the benchmarks and write the results as JSON
+
+    python -m benchmarks.run --output benchmarks/results/latest.json
+    python -m benchmarks.run --filter subtract_factor
+"""
+
+import argparse
+import sys
+
+from benchmarks.harness import results_document, run_suite, save_results
+from benchmarks.suite import BENCHMARKS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--output', help="write the results document to this JSON file")
+    parser.add_argument('--list', action='store_true', help="list benchmark names and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        for benchmark in BENCHMARKS:
+            if not args.filter or args.filter in benchmark.name:
+                print(benchmark.name)
+        return 0
+
+    results = run_suite(BENCHMARKS, args.filter)
+    if not results:
+        print(f"No benchmarks match '{args.filter}'")
+        return 1
+
+    if args.output:
+        save_results(results_document(results), args.output)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
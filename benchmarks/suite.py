@@ -0,0 +1,8 @@
+"""
+Every registered benchmark (importing a bench_* module registers its benchmarks)
+"""
+
+from benchmarks.harness import BENCHMARKS
+from benchmarks import bench_solvers, bench_logic, bench_frames  # noqa: F401
+
+__all__ = ['BENCHMARKS']
@@ -2,11 +2,17 @@
 Core modules for ICG Games framework
 """
 
-from .base_game import BaseGame
-from .game_manager import GameManager
 from .game_registry import GameRegistry, game_registry
 from .event_system import EventType, Event, EventManager
 from .state_machine import State, StateMachine
+from utils.lazy_imports import install
+
+# BaseGame and GameManager need pygame; they are imported on first access
+# (PEP 562) so that core.engine stays headless
+install(globals(), {
+    'BaseGame': '.base_game',
+    'GameManager': '.game_manager',
+})
 
 __all__ = [
     'BaseGame', 'GameManager', 'GameRegistry', 'game_registry',
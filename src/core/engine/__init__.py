@@ -0,0 +1,20 @@
+"""
+Headless game engine API
+
+Uniform legal_moves / apply / undo / is_terminal / outcome / clone access to
+every game's logic class. Importing this package never loads pygame.
+"""
+
+from .base import GameEngine
+from .games import (
+    CardNimEngine, TakeCoinsEngine, SplitCardsEngine,
+    DawsonKaylesEngine, SubtractFactorEngine,
+    ENGINES, create_engine
+)
+from .replay import ReplayLog, ReplayResult, iter_log_files, read_logs, replay_log
+
+__all__ = [
+    'GameEngine', 'CardNimEngine', 'TakeCoinsEngine', 'SplitCardsEngine',
+    'DawsonKaylesEngine', 'SubtractFactorEngine', 'ENGINES', 'create_engine',
+    'ReplayLog', 'ReplayResult', 'iter_log_files', 'read_logs', 'replay_log'
+]
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Headless engine base - uniform move interface over the game logic classes
+"""
+
+import copy
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+
+class GameEngine:
+    """
+    Wraps one *Logic instance behind legal_moves / apply / undo / is_terminal /
+    outcome / clone. Nothing here touches pygame, so engines can run in batch
+    simulations, benchmarks and servers.
+
+    Seats are 0 for the player who moves first ("Player 1") and 1 for the
+    other side ("Player 2" or "AI"). Subclasses name the logic class, the
+    fields that make up a position and how a move is played.
+    """
+
+    game_id = ""
+    logic_class = None
+    state_fields = ()  # Logic attributes snapshotted for undo/clone
+    setup_fields = ('game_mode', 'difficulty')  # Fixed for a whole game, needed to rebuild it
+
+    def __init__(self, logic=None):
+        self.logic = logic if logic is not None else self.logic_class()
+        self._history: List[Dict[str, Any]] = []
+
+    # ---------- Setup ----------
+
+    def new_game(self, difficulty: int = 2, game_mode: str = "PVE", seed: Optional[int] = None):
+        """Start a fresh game through the logic's own initialize_game"""
+        if seed is not None:
+            random.seed(seed)
+        self.logic.initialize_game(game_mode, difficulty)
+        self._history = []
+        return self
+
+    def export_state(self) -> Dict[str, Any]:
+        """JSON-friendly description of the current position, enough for load_state"""
+        state = {field: getattr(self.logic, field) for field in self.setup_fields}
+        state.update(self._snapshot())
+        del state['message']
+        return json.loads(json.dumps(state))
+
+    def load_state(self, state: Dict[str, Any]):
+        """Set the logic up at a position written by export_state"""
+        for field in self.setup_fields:
+            setattr(self.logic, field, state.get(field))
+        self._prepare_position()
+        self._restore({field: self.decode_state_field(field, value)
+                       for field, value in state.items() if field not in self.setup_fields})
+        self._history = []
+        return self
+
+    def _prepare_position(self):
+        """Rebuild per-game data that depends only on the setup fields"""
+        pass
+
+    def decode_state_field(self, field: str, value: Any) -> Any:
+        """Undo what JSON did to a state field (tuples come back as lists)"""
+        return value
+
+    def decode_move(self, data: Any) -> Any:
+        """Move from its JSON form (lists back to tuples)"""
+        return tuple(data) if isinstance(data, list) else data
+
+    # ---------- Move interface ----------
+
+    def legal_moves(self) -> List[Any]:
+        """All legal moves for the side to move (empty once the game is over)"""
+        raise NotImplementedError
+
+    def _play(self, move) -> bool:
+        """Play a move on the logic object; returns the logic's success flag"""
+        raise NotImplementedError
+
+    def apply(self, move) -> bool:
+        """Play a move; returns False (and changes nothing) if it is illegal"""
+        if self.is_terminal():
+            return False
+        snapshot = self._snapshot()
+        if not self._play(move):
+            self._restore(snapshot)
+            return False
+        self._history.append(snapshot)
+        return True
+
+    def undo(self) -> bool:
+        """Take back the last applied move"""
+        if not self._history:
+            return False
+        self._restore(self._history.pop())
+        return True
+
+    def is_terminal(self) -> bool:
+        """True once the game is over"""
+        return bool(self.logic.game_over)
+
+    def outcome(self) -> Optional[int]:
+        """Winning seat (0 = first player, 1 = second) or None while the game is running"""
+        if not self.is_terminal() or self.logic.winner is None:
+            return None
+        return 0 if self.logic.winner == "Player 1" else 1
+
+    def to_move(self) -> int:
+        """Seat of the player to move"""
+        return self.seat(self.logic.current_player)
+
+    @staticmethod
+    def seat(player: Optional[str]) -> int:
+        """Seat of a logic player name"""
+        return 0 if player == "Player 1" else 1
+
+    def ply(self) -> int:
+        """Number of moves applied since new_game"""
+        return len(self._history)
+
+    def clone(self) -> "GameEngine":
+        """Independent copy that shares no mutable position state"""
+        other = self.__class__(copy.copy(self.logic))
+        other._restore(self._snapshot())
+        other._history = list(self._history)
+        return other
+
+    # ---------- AI ----------
+
+    def ai_move(self, difficulty: int) -> Any:
+        """The move the game's own AI would pick for the side to move"""
+        raise NotImplementedError
+
+    def random_move(self) -> Any:
+        """Uniformly random legal move, or None"""
+        moves = self.legal_moves()
+        return random.choice(moves) if moves else None
+
+    # ---------- Position state ----------
+
+    def position(self) -> Any:
+        """Hashable description of the current position"""
+        raise NotImplementedError
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copy of every field that a move can change"""
+        state = {field: copy.copy(getattr(self.logic, field)) for field in self.state_fields}
+        state['current_player'] = self.logic.current_player
+        state['game_over'] = self.logic.game_over
+        state['winner'] = self.logic.winner
+        state['message'] = self.logic.message
+        return state
+
+    def _restore(self, state: Dict[str, Any]):
+        """Put a snapshot back (copying it again, since moves mutate lists in place)"""
+        for field, value in state.items():
+            setattr(self.logic, field, copy.copy(value))
+        self._sync_ai()
+
+    def _sync_ai(self):
+        """Point the logic's AI helper (PvE only) at the restored position"""
+        pass
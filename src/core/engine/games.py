@@ -0,0 +1,197 @@
+"""
+Headless engines for the five games
+"""
+
+from typing import Any, List, Optional
+
+from core.engine.base import GameEngine
+from games.card_nim.logic import AutoPlayer, CardNimLogic
+from games.dawson_kayles.logic import DawsonKaylesAutoPlayer, DawsonKaylesLogic
+from games.split_cards.logic import SplitCardsAI, SplitCardsLogic
+from games.split_cards.moves import Move, iter_moves
+from games.subtract_factor.logic import SubtractFactorAutoPlayer, SubtractFactorLogic
+from games.take_coins.logic import TakeCoinsAutoPlayer, TakeCoinsLogic
+from utils.error_handler import LogicError
+
+
+class CardNimEngine(GameEngine):
+    """Moves are (position index, count) pairs"""
+
+    game_id = "card_nim"
+    logic_class = CardNimLogic
+    state_fields = ('positions', 'selected_position_index', 'selected_count')
+
+    def legal_moves(self) -> List[Any]:
+        if self.is_terminal():
+            return []
+        return [(i, count) for i, cards in enumerate(self.logic.positions)
+                for count in range(1, cards + 1)]
+
+    def _play(self, move) -> bool:
+        position_idx, count = move
+        return self.logic.make_move(position_idx, count)
+
+    def ai_move(self, difficulty: int) -> Any:
+        if self.is_terminal():
+            return None
+        return AutoPlayer(list(self.logic.positions)).move_instruction(difficulty)
+
+    def position(self) -> Any:
+        return tuple(self.logic.positions)
+
+    def _sync_ai(self):
+        if self.logic.game_mode == "PVE":
+            self.logic.auto_player = AutoPlayer(self.logic.positions)
+
+
+class TakeCoinsEngine(GameEngine):
+    """Moves are the index of the position that gains a coin"""
+
+    game_id = "take_coins"
+    logic_class = TakeCoinsLogic
+    state_fields = ('coins', 'valid_positions', 'selected_position')
+
+    def legal_moves(self) -> List[Any]:
+        if self.is_terminal():
+            return []
+        return self.logic.get_valid_positions()
+
+    def _play(self, move) -> bool:
+        return self.logic.select_position(move) and self.logic.make_move()
+
+    def ai_move(self, difficulty: int) -> Any:
+        if self.is_terminal():
+            return None
+        return TakeCoinsAutoPlayer(list(self.logic.coins)).move_instruction(difficulty)
+
+    def position(self) -> Any:
+        return tuple(self.logic.coins)
+
+    def _sync_ai(self):
+        if self.logic.game_mode == "PVE":
+            self.logic.auto_player = TakeCoinsAutoPlayer(self.logic.coins)
+
+
+class SplitCardsEngine(GameEngine):
+    """Moves are games.split_cards.moves.Move tuples"""
+
+    game_id = "split_cards"
+    logic_class = SplitCardsLogic
+    state_fields = ('card_piles', 'max_take')
+
+    def legal_moves(self) -> List[Any]:
+        if self.is_terminal():
+            return []
+        return list(iter_moves(self.logic.card_piles))
+
+    def _play(self, move) -> bool:
+        return self.logic.make_move(move)
+
+    def decode_move(self, data: Any) -> Any:
+        return Move(*data) if isinstance(data, list) else data
+
+    def ai_move(self, difficulty: int) -> Any:
+        if self.is_terminal():
+            return None
+        ai = SplitCardsAI(self.logic)
+        ai.difficulty = difficulty
+        return ai.get_move()
+
+    def position(self) -> Any:
+        return tuple(self.logic.card_piles)
+
+    def _sync_ai(self):
+        if self.logic.game_mode == "PVE":
+            self.logic.auto_player = SplitCardsAI(self.logic)
+
+
+class DawsonKaylesEngine(GameEngine):
+    """Moves are the left tower index of the connected pair"""
+
+    game_id = "dawson_kayles"
+    logic_class = DawsonKaylesLogic
+    state_fields = ('board', 'towers', 'lasers')
+    setup_fields = ('game_mode', 'difficulty', 'num_towers')
+
+    def legal_moves(self) -> List[Any]:
+        if self.is_terminal():
+            return []
+        return self.logic.get_available_moves()
+
+    def _play(self, move) -> bool:
+        return self.logic.make_move(move)
+
+    def ai_move(self, difficulty: int) -> Any:
+        if self.is_terminal():
+            return None
+        return DawsonKaylesAutoPlayer(self.logic.board).move_instruction(difficulty)
+
+    def position(self) -> Any:
+        return (self.logic.num_towers, self.logic.board)
+
+    def decode_state_field(self, field: str, value: Any) -> Any:
+        if field == 'lasers':
+            return [tuple(laser) for laser in value]
+        return value
+
+    def _sync_ai(self):
+        if self.logic.game_mode == "PVE":
+            self.logic.auto_player = DawsonKaylesAutoPlayer(self.logic.board)
+
+
+class SubtractFactorEngine(GameEngine):
+    """Moves are the factor to subtract"""
+
+    game_id = "subtract_factor"
+    logic_class = SubtractFactorLogic
+    state_fields = ('current_value', 'valid_factors', 'selected_factor')
+    setup_fields = ('game_mode', 'difficulty', 'initial_n', 'threshold_k')
+
+    def legal_moves(self) -> List[Any]:
+        if self.is_terminal():
+            return []
+        return list(self.logic.valid_factors)
+
+    def _play(self, move) -> bool:
+        return self.logic.make_move(move)
+
+    def ai_move(self, difficulty: int) -> Any:
+        if self.is_terminal():
+            return None
+        logic = self.logic
+        factor = SubtractFactorAutoPlayer(
+            logic.current_value, logic.threshold_k, logic.winning_positions
+        ).move_instruction(difficulty)
+        # Same fallback as SubtractFactorLogic.ai_make_move
+        if factor not in logic.valid_factors and logic.valid_factors:
+            factor = logic.valid_factors[0]
+        return factor
+
+    def position(self) -> Any:
+        return (self.logic.current_value, self.logic.threshold_k)
+
+    def _prepare_position(self):
+        self.logic.calculate_winning_positions()
+
+    def _sync_ai(self):
+        logic = self.logic
+        if logic.game_mode == "PVE":
+            logic.auto_player = SubtractFactorAutoPlayer(
+                logic.current_value, logic.threshold_k, logic.winning_positions
+            )
+
+
+ENGINES = {
+    engine.game_id: engine
+    for engine in (CardNimEngine, TakeCoinsEngine, SplitCardsEngine,
+                   DawsonKaylesEngine, SubtractFactorEngine)
+}
+
+
+def create_engine(game_id: str, difficulty: Optional[int] = 2, game_mode: str = "PVE",
+                  seed: Optional[int] = None) -> GameEngine:
+    """New engine for `game_id` with a freshly initialised game"""
+    engine_class = ENGINES.get(game_id)
+    if engine_class is None:
+        raise LogicError(f"Unknown game: {game_id} (expected one of {sorted(ENGINES)})")
+    return engine_class().new_game(difficulty, game_mode, seed)
@@ -0,0 +1,137 @@
+"""
+Headless replayer for the logs written by utils.replay_recorder
+"""
+
+import glob
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.engine.games import ENGINES
+from utils.replay_recorder import REPLAY_FORMAT_VERSION, ai_seed
+
+
+@dataclass
+class ReplayLog:
+    """One recorded game"""
+    game: str
+    seed: int
+    state: Dict[str, Any]
+    moves: List[Dict[str, Any]] = field(default_factory=list)
+    winner: Optional[int] = None
+    finished: bool = False
+    source: str = ""  # "file:line" of the start record
+
+    @property
+    def difficulty(self) -> Optional[int]:
+        return self.state.get('difficulty')
+
+
+@dataclass
+class ReplayResult:
+    """What happened when a log was replayed"""
+    log: ReplayLog
+    plies: int = 0
+    ai_checked: int = 0
+    # (ply, recorded move, position the AI reached instead)
+    ai_mismatches: List[Tuple[int, Any, Any]] = field(default_factory=list)
+    illegal_ply: Optional[int] = None
+    winner: Optional[int] = None
+    # (seconds, ply, position) of every replayed AI decision
+    ai_timings: List[Tuple[float, int, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return (self.illegal_ply is None and not self.ai_mismatches
+                and (not self.log.finished or self.winner == self.log.winner))
+
+
+def iter_log_files(paths: List[str]) -> Iterator[str]:
+    """Expand directories into their *.jsonl files"""
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.glob(os.path.join(path, '*.jsonl')))
+        else:
+            yield path
+
+
+def read_logs(path: str) -> Iterator[ReplayLog]:
+    """Yield every game of a session file (a game runs from one start record to the next)"""
+    log = None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 崩溃时最后一行可能只写了一半
+                print(f"⚠️ Skipping unreadable replay line {path}:{line_number}")
+                continue
+
+            kind = record.get('type')
+            if kind == 'start':
+                if log is not None:
+                    yield log
+                if record.get('version', REPLAY_FORMAT_VERSION) > REPLAY_FORMAT_VERSION:
+                    print(f"⚠️ {path}:{line_number} uses a newer replay format, skipped")
+                    log = None
+                    continue
+                log = ReplayLog(record['game'], record['seed'], record['state'],
+                                source=f"{path}:{line_number}")
+            elif log is None:
+                continue
+            elif kind == 'move':
+                log.moves.append(record)
+            elif kind == 'end':
+                log.winner = record.get('winner')
+                log.finished = True
+    if log is not None:
+        yield log
+
+
+def replay_log(log: ReplayLog, verify_ai: bool = True) -> ReplayResult:
+    """
+    Re-execute a log on a fresh engine
+
+    With verify_ai, every move recorded from an AI turn is replayed through the
+    logic's own ai_make_move under the recorded seed and compared with the log.
+    """
+    result = ReplayResult(log)
+    engine_class = ENGINES.get(log.game)
+    if engine_class is None:
+        result.illegal_ply = 0
+        return result
+
+    engine = engine_class().load_state(log.state)
+    for record in log.moves:
+        ply = record['ply']
+        move = engine.decode_move(record['move'])
+
+        if verify_ai and record.get('ai'):
+            position = engine.position()
+            snapshot = engine._snapshot()
+            random.seed(ai_seed(log.seed, ply))
+            started = time.perf_counter()
+            engine.logic.ai_make_move()
+            result.ai_timings.append((time.perf_counter() - started, ply, position))
+            ai_position = engine.position()
+            engine._restore(snapshot)
+            result.ai_checked += 1
+
+            if not engine.apply(move):
+                result.illegal_ply = ply
+                break
+            if engine.position() != ai_position:
+                result.ai_mismatches.append((ply, record['move'], ai_position))
+        elif not engine.apply(move):
+            result.illegal_ply = ply
+            break
+        result.plies += 1
+
+    result.winner = engine.outcome()
+    return result
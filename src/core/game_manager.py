@@ -13,6 +13,8 @@ from utils.config_manager import config_manager
 from utils.error_handler import handle_game_errors, log_logic_error
 from utils.resource_cache import resource_cache
 from utils.performance_monitor import performance_monitor, PerformanceProfiler
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class GameManager(BaseGame):
     """Universal Game Manager - contains common functionality for all games"""
@@ -43,12 +45,26 @@ class GameManager(BaseGame):
         self.show_perf_overlay = False
         self.perf_update_timer = 0
         
+        # 空闲时装饰性背景的重绘间隔（毫秒），None表示空闲时完全不重绘
+        self.ambient_redraw_ms = None
+        
+        # 上一帧用于构建按钮的状态（逻辑版本、滚动位置等），None表示需要重建
+        self.widget_state = None
+        
         # Ensure fonts are initialized
         self.font_manager.initialize_fonts()
         
         # Game instructions (to be set by specific games)
         self.game_instructions = ""
     
+    def widgets_changed(self, *state):
+        """True when the state the widgets are built from differs from the last call (the screen is then redrawn)"""
+        if state == self.widget_state:
+            return False
+        self.widget_state = state
+        render_optimizer.mark_dirty()
+        return True
+    
     def set_game_instructions(self, instructions):
         """Set game instructions for the info dialog"""
         self.game_instructions = instructions
@@ -248,6 +264,24 @@ class GameManager(BaseGame):
         if self.show_perf_overlay:
             performance_monitor.draw_performance_overlay(self.screen, self.font_manager.small)
     
+    def is_animating(self):
+        """True while the screen changes without input: AI turn pending, sidebar sliding, keys or buttons held"""
+        logic = self.logic
+        if (logic is not None and getattr(logic, 'game_mode', None) == "PVE" and
+                getattr(logic, 'current_player', None) == "AI" and not getattr(logic, 'game_over', False)):
+            return True
+        if self.sidebar.is_animating or self.show_perf_overlay:
+            return True
+        return any(pygame.key.get_pressed()) or any(pygame.mouse.get_pressed())
+    
+    def tracks_pointer(self):
+        """True while an overlay draws its hover straight from the mouse position: dialogs, panels, hint tooltip or window"""
+        sidebar = self.sidebar
+        if self.info_dialog.visible or sidebar.settings_panel.visible or sidebar.music_panel.visible:
+            return True
+        return bool(getattr(self.ui, 'hint_window_visible', False) or
+                    getattr(self.ui, 'is_hint_tooltip_visible', False))
+    
     def _draw_game_content(self, offset):
         """Draw game-specific content - to be overridden by subclasses"""
         pass
@@ -259,11 +293,16 @@ class GameManager(BaseGame):
             return
         
         self.running = True
+        render_optimizer.mark_dirty()
         while self.running:
             # Start frame timing
             performance_monitor.start_frame()
             
             try:
+                # Keys, clicks and window events redraw the screen; pointer motion
+                # only damages the components whose hover it changes
+                render_optimizer.mark_input(self.tracks_pointer())
+                
                 # Handle events with timing
                 with PerformanceProfiler("event_processing", performance_monitor):
                     result = self.handle_events()
@@ -272,12 +311,14 @@ class GameManager(BaseGame):
                         break
                     elif result == "back":
                         self.initialize_game_settings()
+                        render_optimizer.mark_dirty()
                         continue
                     elif result == "home":
                         break
                     elif result == "refresh":
                         # Recreate components for refresh
                         self.create_components()
+                        render_optimizer.mark_dirty()
                         continue
                 
                 # Update game state with timing
@@ -288,7 +329,14 @@ class GameManager(BaseGame):
                 if self.key_repeat_enabled:
                     self.update_key_repeat()
                 
+                # Idle screens skip drawing and sleep until input arrives
+                if not render_optimizer.needs_redraw(self.is_animating(), self.ambient_redraw_ms):
+                    performance_monitor.end_frame()
+                    render_optimizer.wait_for_input()
+                    continue
+                
                 # Draw with timing
+                render_optimizer.begin_frame(self.screen)
                 with PerformanceProfiler("game_draw", performance_monitor):
                     self.draw()
                 
@@ -302,7 +350,7 @@ class GameManager(BaseGame):
                 log_logic_error(f"Error in game loop: {e}", str(self.__class__))
                 # Try to recover
                 self.screen.fill((50, 0, 0))
-                error_text = self.font_manager.medium.render("Game Error - Trying to recover...", 
+                error_text = text_cache.render(self.font_manager.medium, "Game Error - Trying to recover...", 
                                                            True, (255, 255, 255))
                 self.screen.blit(error_text, (SCREEN_WIDTH//2 - error_text.get_width()//2, 
                                            SCREEN_HEIGHT//2))
@@ -2,7 +2,13 @@
 Card Nim Game Package
 """
 
-from .game import CardNimGame
-from .input_handler import CardNimInputHandler
+from utils.lazy_imports import install
+
+# The game classes need pygame; importing them on first access (PEP 562)
+# keeps the logic modules usable headless
+install(globals(), {
+    'CardNimGame': '.game',
+    'CardNimInputHandler': '.input_handler',
+})
 
 __all__ = ['CardNimGame', 'CardNimInputHandler']
\ No newline at end of file
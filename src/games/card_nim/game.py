@@ -9,6 +9,8 @@ from games.card_nim.ui import CardNimUI
 from utils.constants import CARD_GAME_FPS, SCREEN_WIDTH, SCREEN_HEIGHT, ACCENT_COLOR, TEXT_COLOR
 from ui.components.sidebar import Sidebar
 from utils.config_manager import config_manager  # 新增导入
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class CardNimGame(GameManager):
     """Card Nim Game implementation"""
@@ -408,7 +410,7 @@ Good luck and have fun!
         # 如果显示说明，绘制说明页面
         if self.showing_instructions:
             self.draw_instructions()
-            pygame.display.flip()
+            render_optimizer.present()
             return
         
         # Draw game information
@@ -434,7 +436,7 @@ Good luck and have fun!
         # 最后绘制侧边栏，使其在最上层
         self.sidebar.draw()
         
-        pygame.display.flip()
+        render_optimizer.present()
     
     def draw_instructions(self):
         """Draw game instructions overlay"""
@@ -454,12 +456,12 @@ Good luck and have fun!
         pygame.draw.rect(self.screen, ACCENT_COLOR, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Card Nim Game - Instructions", True, TEXT_COLOR)
+        title = text_cache.render(self.font_manager.large, "Card Nim Game - Instructions", True, TEXT_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, panel_y + 40))
         self.screen.blit(title, title_rect)
         
         # Close hint
-        close_hint = self.font_manager.small.render("Click anywhere or press ESC/I to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Click anywhere or press ESC/I to close", True, (180, 200, 220))
         close_rect = close_hint.get_rect(center=(SCREEN_WIDTH//2, panel_y + panel_height - 30))
         self.screen.blit(close_hint, close_rect)
         
@@ -507,7 +509,7 @@ Good luck and have fun!
             # Draw each line
             for text_line in lines:
                 if y_pos < panel_y + panel_height - 60:
-                    text_surface = font.render(text_line, True, color)
+                    text_surface = text_cache.render(font, text_line, True, color)
                     text_rect = text_surface.get_rect(left=panel_x + 40, top=y_pos)
                     self.screen.blit(text_surface, text_rect)
                     y_pos += font.get_linesize() + 2
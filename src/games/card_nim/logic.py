@@ -3,7 +3,31 @@ Card Nim Game Logic
 """
 
 import random
+from games.card_nim import nim_analysis
+from games.card_nim.positions import winning_position, zero_sum_position
 from utils.constants import *
+from utils.position_sampler import NimPositionSampler
+from utils.replay_recorder import record_ai_turn, record_game_start, record_move
+
+# Cards per pile at the start of a game
+MAX_CARDS = 10
+
+# Largest sampler table (piles x nim-sums x cards) worth building; bigger
+# stress configs use the constructive generators instead
+SAMPLER_MAX_WORK = 1 << 20
+
+# One sampler per (min piles, max piles, max cards), shared by every game
+_samplers = {}
+
+
+def position_sampler(min_pos, max_pos, max_cards=MAX_CARDS):
+    """Shared NimPositionSampler for a pile-count range, or None if its table would be too large"""
+    key = (min_pos, max_pos, max_cards)
+    if max_pos * (2 << max_cards.bit_length()) * max_cards > SAMPLER_MAX_WORK:
+        return None
+    if key not in _samplers:
+        _samplers[key] = NimPositionSampler(min_pos, max_pos, max_cards)
+    return _samplers[key]
 
 
 class AutoPlayer:
@@ -18,33 +42,15 @@ class AutoPlayer:
 
     def calculate_nim_sum(self, positions):
         """Calculate the XOR (nim-sum) of all positions"""
-        nim_sum = 0
-        for count in positions:
-            nim_sum ^= count
-        return nim_sum
+        return nim_analysis.nim_sum(positions)
 
     def find_winning_move(self, positions=None):
         """Find a move that makes the nim-sum zero (winning move)"""
         if positions is None:
             positions = self.positions
-            
-        current_nim_sum = self.calculate_nim_sum(positions)
-
-        # If nim-sum is already 0, any move will make it non-zero (losing position)
-        if current_nim_sum == 0:
-            return None
-
-        # Find a move that makes nim-sum zero
-        for i in range(len(positions)):
-            if positions[i] > 0:
-                # We need to find count such that: positions[i] XOR count = current_nim_sum XOR positions[i]
-                # This means: count = positions[i] - (current_nim_sum XOR positions[i])
-                target = current_nim_sum ^ positions[i]
-                if target < positions[i]:
-                    count = positions[i] - target
-                    if 1 <= count <= positions[i]:
-                        return i, count
-        return None
+        # Taking positions[i] - (nim_sum ^ positions[i]) cards zeroes the nim-sum;
+        # None if the nim-sum is already 0 (every move loses)
+        return nim_analysis.first_winning_move(positions)
 
     def move_instruction(self, difficulty):
         """Generate move instruction for AI"""
@@ -55,6 +61,12 @@ class AutoPlayer:
         if winning_move and not self.this_turn_random(difficulty):
             return winning_move
         else:
+            if not winning_move and difficulty >= 4:
+                # 必败局面：最佳防守，留给对手最少的必胜走法
+                best = nim_analysis.analyze_position(self.positions).best()
+                if best:
+                    return best.move
+
             # Make a random move
             available_moves = []
             for i in range(len(self.positions)):
@@ -92,37 +104,48 @@ class CardNimLogic:
 
     def calculate_nim_sum(self):
         """Calculate the XOR (nim-sum) of all positions"""
-        nim_sum = 0
-        for count in self.positions:
-            nim_sum ^= count
-        return nim_sum
+        return nim_analysis.nim_sum(self.positions)
 
     def judge_win(self):
         """Determine if current position is winning using XOR (nim-sum)"""
         return self.calculate_nim_sum() != 0
 
-    def generate_winning_position(self, min_pos, max_pos):
+    def generate_winning_position(self, min_pos, max_pos, max_cards=MAX_CARDS, winning_moves=None):
         """Generate a position where nim-sum != 0 (winning position for first player)"""
-        while True:
-            n = random.randint(min_pos, max_pos)
-            self.positions = [random.randint(1, 10) for _ in range(n)]
-            
-            # Ensure it's a winning position (nim-sum != 0)
-            if self.calculate_nim_sum() != 0:
-                return
+        sampler = position_sampler(min_pos, max_pos, max_cards)
+        if sampler is not None and winning_moves is None:
+            # 按结果直接构造，不再反复随机试错
+            self.positions = sampler.sample(winning=True)
+        else:
+            self.positions = winning_position(random.randint(min_pos, max_pos), max_cards, winning_moves)
+        if self.positions is None:
+            print(f"Warning: no winning Card Nim position with {winning_moves} winning moves "
+                  f"for {min_pos}-{max_pos} piles of up to {max_cards} cards")
+            self.positions = winning_position(random.randint(min_pos, max_pos), max_cards)
 
-    def generate_losing_position(self, min_pos, max_pos):
+    def generate_losing_position(self, min_pos, max_pos, max_cards=MAX_CARDS):
         """Generate a position where nim-sum == 0 (losing position for first player)"""
-        while True:
-            n = random.randint(min_pos, max_pos)
-            self.positions = [random.randint(1, 10) for _ in range(n)]
-            
-            # Ensure it's a losing position (nim-sum == 0)
-            if self.calculate_nim_sum() == 0:
-                return
+        sampler = position_sampler(min_pos, max_pos, max_cards)
+        if sampler is not None:
+            self.positions = sampler.sample(winning=False)
+        else:
+            # 先随意放 n-1 堆，最后一堆取它们的异或
+            self.positions = zero_sum_position(random.randint(min_pos, max_pos), max_cards)
+        if self.positions is None:
+            print(f"Warning: no losing Card Nim position for {min_pos}-{max_pos} piles "
+                  f"of up to {max_cards} cards, starting from a winning one")
+            self.generate_winning_position(min_pos, max_pos, max_cards)
+
+    @record_game_start("card_nim")
+    def initialize_game(self, game_mode, difficulty=None, winning_hints=False,
+                        num_piles=None, max_cards=MAX_CARDS, winning_moves=None):
+        """
+        Initialize a new game with difficulty-based position count
 
-    def initialize_game(self, game_mode, difficulty=None, winning_hints=False):
-        """Initialize a new game with difficulty-based position count"""
+        num_piles and max_cards override the pile count and the cards per
+        pile (e.g. for stress configs); winning_moves fixes how many winning
+        moves a winning start offers (an odd number).
+        """
         self.game_mode = game_mode
         self.difficulty = difficulty
         self.winning_hints_enabled = winning_hints  # New: Store hints setting
@@ -130,17 +153,20 @@ class CardNimLogic:
         # Set position count based on game mode and difficulty
         if self.game_mode == "PVP":
             # PvP mode: fixed medium difficulty
-            min_pos, max_pos = (4, 6)
+            min_pos, max_pos = (num_piles, num_piles) if num_piles else (4, 6)
             # PvP mode: randomly choose winning or losing position
             if random.choice([True, False]):
-                self.generate_winning_position(min_pos, max_pos)
+                self.generate_winning_position(min_pos, max_pos, max_cards, winning_moves)
             else:
-                self.generate_losing_position(min_pos, max_pos)
+                self.generate_losing_position(min_pos, max_pos, max_cards)
         else:
             # PvE mode: use difficulty-based ranges
-            min_pos, max_pos = DIFFICULTY_POSITION_RANGES.get(self.difficulty, (4, 6))
+            if num_piles:
+                min_pos, max_pos = num_piles, num_piles
+            else:
+                min_pos, max_pos = DIFFICULTY_POSITION_RANGES.get(self.difficulty, (4, 6))
             # PvE mode: ALWAYS generate winning position for player
-            self.generate_winning_position(min_pos, max_pos)
+            self.generate_winning_position(min_pos, max_pos, max_cards, winning_moves)
 
         self.selected_position_index = None
         self.selected_count = 1
@@ -170,6 +196,7 @@ class CardNimLogic:
         #if self.winning_hints_enabled:
         #    self.message += " [Winning Hints: ON - Click on the hint button for guidance]"
 
+    @record_move(lambda logic, position_idx, count: [position_idx, count])
     def make_move(self, position_idx, count):
         """Execute a move and return success status"""
         if (0 <= position_idx < len(self.positions) and
@@ -236,6 +263,7 @@ class CardNimLogic:
                 self.current_player = "Player 1"
                 self.message += f" {self.current_player}'s turn."
 
+    @record_ai_turn
     def ai_make_move(self):
         """Let AI make a move (only in PvE mode)"""
         if self.game_mode == "PVE" and self.current_player == "AI" and not self.game_over:
@@ -278,16 +306,17 @@ class CardNimLogic:
             # Losing position - no winning move exists
             hint = "You are in a LOSING position. "
             hint += "There is no guaranteed winning move. "
-            hint += "Try to take just 1 card from any position and hope AI makes a mistake."
+            hint += "Stall for time and hope AI makes a mistake."
             
-            # Still suggest a reasonable move
-            for i in range(len(self.positions)):
-                if self.positions[i] > 0:
-                    if self.positions[i] > 1:
-                        hint += f"\n\nSuggestion: Take 1 card from position {i+1} (has {self.positions[i]} cards)."
-                    else:
-                        hint += f"\n\nSuggestion: Take the last card from position {i+1}."
-                    break
+            # Best defense: leave the opponent as few winning replies as possible
+            best = nim_analysis.analyze_position(self.positions).best()
+            if best:
+                position_idx, count = best.move
+                hint += f"\n\nSuggestion: Take {count} card"
+                hint += "s" if count > 1 else ""
+                hint += f" from position {position_idx + 1} (has {self.positions[position_idx]} cards). "
+                hint += f"Opponent keeps {best.opponent_winning_replies} winning "
+                hint += "reply." if best.opponent_winning_replies == 1 else "replies."
         else:
             # Winning position - find the winning move
             if self.auto_player:
@@ -309,12 +338,9 @@ class CardNimLogic:
                 # Add explanation
                 new_positions = self.positions.copy()
                 new_positions[position_idx] -= count
-                new_nim_sum = 0
-                for pos in new_positions:
-                    new_nim_sum ^= pos
-                
-                if new_nim_sum == 0:
+                if nim_analysis.nim_sum(new_positions) == 0:
                     hint += " (Nim-sum will become 0)"
+                hint += f"\nWith perfect play the game ends in {nim_analysis.depth_to_end(self.positions)} more moves."
             else:
                 # Should not happen if nim_sum != 0, but as fallback
                 hint = "You are in a winning position. "
@@ -350,6 +376,8 @@ class CardNimLogic:
         # Non-empty positions
         non_empty = [i for i, count in enumerate(self.positions) if count > 0]
         analysis += f"• Non-empty positions: {[pos+1 for pos in non_empty]}\n"
+        analysis += f"• Winning moves: {len(nim_analysis.winning_moves(self.positions))}\n"
+        analysis += f"• Moves left with perfect play: {nim_analysis.depth_to_end(self.positions)}\n"
         
         # If in losing position, suggest strategy
         if nim_sum == 0:
@@ -0,0 +1,145 @@
+"""
+Card Nim Analysis - nim-sums and winning moves, vectorized with NumPy when available
+
+Single boards below NUMPY_MIN_PILES piles stay on the pure Python path, where
+converting to an array would cost more than the loop. Batches are 2-D: one
+board per row, shorter boards padded with empty piles (which change neither
+the nim-sum nor the winning moves).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from utils.position_analysis import MoveAnalysis, PositionAnalysis, analysis_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Piles from which a single board is analysed with NumPy
+NUMPY_MIN_PILES = 256
+
+_analyses = analysis_cache()
+
+
+def nim_sum(positions: Sequence[int]) -> int:
+    """XOR of all pile sizes"""
+    if HAS_NUMPY and len(positions) >= NUMPY_MIN_PILES:
+        return int(np.bitwise_xor.reduce(np.asarray(positions, dtype=np.int64)))
+    total = 0
+    for count in positions:
+        total ^= count
+    return total
+
+
+def winning_moves(positions: Sequence[int]) -> List[Tuple[int, int]]:
+    """Every (position index, count) move that leaves a zero nim-sum"""
+    if HAS_NUMPY and len(positions) >= NUMPY_MIN_PILES:
+        piles = np.asarray(positions, dtype=np.int64)
+        targets = piles ^ np.bitwise_xor.reduce(piles)
+        indexes = np.flatnonzero(targets < piles)
+        return list(zip(indexes.tolist(), (piles[indexes] - targets[indexes]).tolist()))
+
+    total = nim_sum(positions)
+    if not total:
+        return []
+    # Only piles holding the nim-sum's top bit shrink when XORed with it
+    return [(i, count - (count ^ total)) for i, count in enumerate(positions)
+            if (count ^ total) < count]
+
+
+def first_winning_move(positions: Sequence[int]) -> Optional[Tuple[int, int]]:
+    """The winning move on the lowest position index, or None in a losing position"""
+    if HAS_NUMPY and len(positions) >= NUMPY_MIN_PILES:
+        moves = winning_moves(positions)
+        return moves[0] if moves else None
+
+    total = nim_sum(positions)
+    if not total:
+        return None
+    for i, count in enumerate(positions):
+        target = count ^ total
+        if target < count:
+            return i, count - target
+    return None
+
+
+def depth_to_end(positions: Sequence[int]) -> int:
+    """
+    Moves left under perfect play. A losing player can only stall one card
+    per move, so a losing position lasts exactly as many moves as it has
+    cards; a winning player takes the winning move that removes the most.
+    """
+    total = sum(positions)
+    moves = winning_moves(positions)
+    if not moves:
+        return total
+    return 1 + total - max(count for _, count in moves)
+
+
+def analyze_position(positions: Sequence[int]) -> PositionAnalysis:
+    """Every (position index, count) move, with the opponent's replies and the depth left"""
+    key = tuple(positions)
+    analysis = _analyses.get(key)
+    if analysis is not None:
+        return analysis
+
+    results = []
+    child = list(positions)
+    for i, count in enumerate(positions):
+        for take in range(1, count + 1):
+            child[i] = count - take
+            replies = len(winning_moves(child))
+            results.append(MoveAnalysis((i, take), replies == 0, replies, depth_to_end(child)))
+        child[i] = count
+    analysis = PositionAnalysis(tuple(results))
+    _analyses.put(key, analysis)
+    return analysis
+
+
+def _as_board_array(boards):
+    """2-D int64 array of boards, padding ragged rows with empty piles"""
+    if isinstance(boards, np.ndarray):
+        return boards.astype(np.int64, copy=False)
+    boards = [list(board) for board in boards]
+    try:
+        return np.array(boards, dtype=np.int64).reshape(len(boards), -1)
+    except ValueError:
+        pass  # ragged rows
+    width = max((len(board) for board in boards), default=0)
+    array = np.zeros((len(boards), width), dtype=np.int64)
+    for row, board in enumerate(boards):
+        array[row, :len(board)] = board
+    return array
+
+
+def batch_nim_sums(boards):
+    """Nim-sum of every board (a NumPy array when NumPy is available, else a list)"""
+    if HAS_NUMPY:
+        return np.bitwise_xor.reduce(_as_board_array(boards), axis=1)
+    return [nim_sum(board) for board in boards]
+
+
+def batch_winning_moves(boards):
+    """
+    Every winning move of every board in one pass, as three parallel
+    sequences (board index, position index, count). Losing boards contribute
+    nothing.
+    """
+    if HAS_NUMPY:
+        piles = _as_board_array(boards)
+        if not piles.size:
+            return piles.reshape(0), piles.reshape(0), piles.reshape(0)
+        targets = piles ^ np.bitwise_xor.reduce(piles, axis=1, keepdims=True)
+        rows, columns = np.nonzero(targets < piles)
+        return rows, columns, piles[rows, columns] - targets[rows, columns]
+
+    rows, columns, counts = [], [], []
+    for row, board in enumerate(boards):
+        for column, count in winning_moves(board):
+            rows.append(row)
+            columns.append(column)
+            counts.append(count)
+    return rows, columns, counts
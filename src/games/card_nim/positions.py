@@ -0,0 +1,95 @@
+"""
+Card Nim Position Generators - constructive, for any pile count and card cap
+"""
+
+import random
+from typing import List, Optional
+from games.card_nim.nim_analysis import nim_sum
+
+# Redraws allowed before a (pile count, card cap) combination is given up as
+# impossible, e.g. three piles of 1-2 cards can never have a zero nim-sum
+MAX_ATTEMPTS = 1000
+
+
+def winning_move_count(positions) -> int:
+    """
+    Number of winning moves: one per pile holding the highest bit of the
+    nim-sum (always odd, 0 for a losing position)
+    """
+    total = nim_sum(positions)
+    if not total:
+        return 0
+    top = 1 << (total.bit_length() - 1)
+    return sum(1 for count in positions if count & top)
+
+
+def _pile_with_bit(bit: int, has_bit: bool, max_cards: int, rng) -> int:
+    """Random 1..max_cards pile whose `bit` is set (or clear)"""
+    while True:
+        high = rng.randint(0, max_cards >> (bit + 1))
+        count = (high << (bit + 1)) | (int(has_bit) << bit) | rng.randrange(1 << bit)
+        if 1 <= count <= max_cards:
+            return count
+
+
+def zero_sum_position(piles: int, max_cards: int, rng=random) -> Optional[List[int]]:
+    """
+    Losing position (nim-sum 0): piles - 1 free piles and a last pile equal
+    to their nim-sum, redrawn only while that falls outside 1..max_cards.
+    None if no such position is found.
+    """
+    if piles < 2 or max_cards < 1 or (max_cards == 1 and piles % 2):
+        return None
+    for _ in range(MAX_ATTEMPTS):
+        positions = [rng.randint(1, max_cards) for _ in range(piles - 1)]
+        last = nim_sum(positions)
+        if 1 <= last <= max_cards:
+            positions.append(last)
+            rng.shuffle(positions)
+            return positions
+    return None
+
+
+def winning_position(piles: int, max_cards: int, winning_moves: Optional[int] = None,
+                     rng=random) -> Optional[List[int]]:
+    """
+    Winning position (nonzero nim-sum), optionally with exactly
+    `winning_moves` winning moves. None if no such position is found; in Nim
+    the number of winning moves is always odd.
+    """
+    if piles < 1 or max_cards < 1:
+        return None
+
+    if winning_moves is None:
+        # 最后一堆只需避开使异或为0的那一个值
+        positions = [rng.randint(1, max_cards) for _ in range(piles - 1)]
+        forbidden = nim_sum(positions)
+        choices = max_cards - (1 if 1 <= forbidden <= max_cards else 0)
+        if not choices:
+            return None
+        last = rng.randint(1, choices)
+        if 1 <= forbidden <= last:
+            last += 1
+        positions.append(last)
+        rng.shuffle(positions)
+        return positions
+
+    if winning_moves % 2 == 0 or not 1 <= winning_moves <= piles:
+        return None
+    # The nim-sum's top bit: winning_moves piles carry it, the rest must not
+    bits = [bit for bit in range(max_cards.bit_length())
+            if winning_moves == piles or bit > 0 or max_cards >= 2]
+    if not bits:
+        return None
+
+    for _ in range(MAX_ATTEMPTS):
+        bit = rng.choice(bits)
+        positions = [_pile_with_bit(bit, True, max_cards, rng) for _ in range(winning_moves - 1)]
+        positions += [_pile_with_bit(bit, False, max_cards, rng) for _ in range(piles - winning_moves)]
+        # The last pile cancels every bit above `bit`, so `bit` is the top of the nim-sum
+        base = ((nim_sum(positions) >> (bit + 1)) << (bit + 1)) | (1 << bit)
+        if base <= max_cards:
+            positions.append(base | rng.randint(0, min((1 << bit) - 1, max_cards - base)))
+            rng.shuffle(positions)
+            return positions
+    return None
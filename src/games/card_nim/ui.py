@@ -4,11 +4,65 @@ Card Nim Game UI Components
 
 import pygame
 from utils.constants import *
+from utils.background_layers import background_layers
 from utils.helpers import wrap_text
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.sprite_atlas import sprite_atlas
+from utils.optimization_tools import render_optimizer
 from ui.components.input_box import InputBox
 from ui.components.scrollables import ScrollablePanel
 from ui.components.scrollables import ScrollablePanel
 
+# Card stack sprites: at most MAX_VISIBLE_CARDS cards are drawn, each 4px above the last
+MAX_VISIBLE_CARDS = 10
+CARD_STACK_TOP = CARD_HEIGHT + (MAX_VISIBLE_CARDS - 1) * 4  # sprite top above the position's y
+
+
+def _build_card_stack_sprite(surface, visible, selected):
+    """Position base, cards and count background; the position's (x, y) is at (CARD_WIDTH//2, CARD_STACK_TOP)"""
+    x, y = CARD_WIDTH // 2, CARD_STACK_TOP
+    
+    # Draw position base with shadow
+    base_rect = pygame.Rect(x - CARD_WIDTH//2, y + 20, CARD_WIDTH, 20)
+    shadow_rect = base_rect.move(3, 3)
+    pygame.draw.rect(surface, SHADOW_COLOR, shadow_rect, border_radius=6)
+    pygame.draw.rect(surface, POSITION_COLOR, base_rect, border_radius=6)
+    
+    if visible == 0:
+        return
+    
+    # Draw card stack
+    for i in range(visible):
+        card_y = y - i * 4
+        card_rect = pygame.Rect(x - CARD_WIDTH//2, card_y - CARD_HEIGHT, CARD_WIDTH, CARD_HEIGHT)
+        
+        # Draw card shadow
+        shadow_rect = card_rect.move(2, 2)
+        pygame.draw.rect(surface, SHADOW_COLOR, shadow_rect, border_radius=10)
+        
+        # Draw card
+        color = HIGHLIGHT_COLOR if selected else CARD_COLOR
+        pygame.draw.rect(surface, color, card_rect, border_radius=10)
+        
+        # Draw card border
+        border_color = (255, 200, 50) if selected else CARD_BORDER_COLOR
+        pygame.draw.rect(surface, border_color, card_rect, 3, border_radius=10)
+    
+    # Card count background
+    count_bg = pygame.Rect(x - 20, y - CARD_HEIGHT//2 - 15, 40, 30)
+    pygame.draw.rect(surface, SHADOW_COLOR, count_bg.move(2, 2), border_radius=8)
+    pygame.draw.rect(surface, (40, 60, 80), count_bg, border_radius=8)
+    pygame.draw.rect(surface, ACCENT_COLOR, count_bg, 2, border_radius=8)
+
+
+def _build_label_sprite(surface, size):
+    """Position number background with its shadow"""
+    pos_bg = pygame.Rect((0, 0), size)
+    pygame.draw.rect(surface, SHADOW_COLOR, pos_bg.move(2, 2), border_radius=6)
+    pygame.draw.rect(surface, (40, 60, 80), pos_bg, border_radius=6)
+
+
 class CardNimUI:
     """Handles all UI rendering for Card Nim game"""
     
@@ -38,14 +92,9 @@ class CardNimUI:
     
     def draw_background(self):
         """Draw the background with gradient effect"""
-        self.screen.fill(BACKGROUND_COLOR)
-
-        sidebar_width = SIDEBAR_WIDTH
-
-        for x in range(sidebar_width, SCREEN_WIDTH, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (sidebar_width, y), (SCREEN_WIDTH, y), 1)
+        # Grid right of the sidebar, pre-rendered once as a static layer
+        self.screen.blit(background_layers.grid(self.screen.get_size(), 40, (35, 45, 55), BACKGROUND_COLOR,
+                                                left=SIDEBAR_WIDTH), (0, 0))
     
     def draw_game_info(self, game_logic):
         """Draw game information panel with enhanced styling"""
@@ -55,8 +104,8 @@ class CardNimUI:
         pygame.draw.line(self.screen, ACCENT_COLOR, (0, 180), (SCREEN_WIDTH, 180), 3)
         
         # Game title with shadow
-        title = self.font_manager.large.render("Card Taking Game", True, TEXT_COLOR)
-        title_shadow = self.font_manager.large.render("Card Taking Game", True, SHADOW_COLOR)
+        title = text_cache.render(self.font_manager.large, "Card Taking Game", True, TEXT_COLOR)
+        title_shadow = text_cache.render(self.font_manager.large, "Card Taking Game", True, SHADOW_COLOR)
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 2, 15))
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 13))
         
@@ -69,7 +118,7 @@ class CardNimUI:
         else:
             mode_text = f"Mode: Player vs AI - {difficulty_names[game_logic.difficulty-1]}"
         
-        mode_info = self.font_manager.small.render(
+        mode_info = text_cache.render(self.font_manager.small,
             f"{mode_text} | Positions: {position_count}", 
             True, ACCENT_COLOR)
         self.screen.blit(mode_info, (20, 120))
@@ -82,7 +131,7 @@ class CardNimUI:
         }
         player_color = player_colors.get(game_logic.current_player, TEXT_COLOR)
         
-        player_text = self.font_manager.small.render(
+        player_text = text_cache.render(self.font_manager.small,
             f"Current Player: {game_logic.current_player}", 
             True, player_color
         )
@@ -103,7 +152,7 @@ class CardNimUI:
         # Handle long messages with text wrapping
         message_lines = wrap_text(game_logic.message, self.font_manager.medium, SCREEN_WIDTH - 100)
         for i, line in enumerate(message_lines):
-            message_text = self.font_manager.medium.render(line, True, message_color)
+            message_text = text_cache.render(self.font_manager.medium, line, True, message_color)
             message_bg_width = message_text.get_width() + 30
             message_bg = pygame.Rect(SCREEN_WIDTH//2 - message_bg_width//2, 85 + i * 25, 
                                    message_bg_width, message_text.get_height() + 6)
@@ -117,7 +166,7 @@ class CardNimUI:
         
         # Current selection info
         if game_logic.selected_position_index is not None:
-            select_info = self.font_manager.small.render(
+            select_info = text_cache.render(self.font_manager.small,
                 f"Selected: Position {game_logic.selected_position_index + 1}, Count: {game_logic.selected_count}", 
                 True, ACCENT_COLOR)
             self.screen.blit(select_info, (SCREEN_WIDTH//2 - select_info.get_width()//2, 130))
@@ -126,7 +175,7 @@ class CardNimUI:
         if not game_logic.game_over:
             game_state = "Winning Position" if game_logic.judge_win() else "Losing Position"
             state_color = WIN_COLOR if game_logic.judge_win() else LOSE_COLOR
-            state_text = self.font_manager.small.render(game_state, True, state_color)
+            state_text = text_cache.render(self.font_manager.small, game_state, True, state_color)
             
             state_bg = pygame.Rect(SCREEN_WIDTH//2 - state_text.get_width()//2 - 10, 155, 
                                  state_text.get_width() + 20, state_text.get_height() + 6)
@@ -145,63 +194,49 @@ class CardNimUI:
         
         # Adjust vertical position for card stacks
         y = POSITION_HEIGHT + 20
+        batch = []
         
         for i, count in enumerate(positions):
             x = start_x + i * (CARD_WIDTH + MARGIN) + CARD_WIDTH // 2
             
-            # 内联绘制卡片位置
-            self._draw_single_card_position(x, y, i, count, i == selected_position_index)
+            # 内联绘制卡片位置 (整个牌桌一次 blits)
+            self._draw_single_card_position(x, y, i, count, i == selected_position_index, batch)
             
             # 存储点击区域
             card_rect = pygame.Rect(x - CARD_WIDTH//2 - 10, y - CARD_HEIGHT - 10, 
                                   CARD_WIDTH + 20, CARD_HEIGHT + 80)
             position_rects.append(card_rect)
         
+        self.screen.blits(batch, doreturn=False)
         return position_rects
     
-    def _draw_single_card_position(self, x, y, index, count, selected):
-        """绘制单个卡片位置"""
-        # Draw position base with shadow
-        base_rect = pygame.Rect(x - CARD_WIDTH//2, y + 20, CARD_WIDTH, 20)
-        shadow_rect = base_rect.move(3, 3)
-        pygame.draw.rect(self.screen, SHADOW_COLOR, shadow_rect, border_radius=6)
-        pygame.draw.rect(self.screen, POSITION_COLOR, base_rect, border_radius=6)
-        
-        # Draw card stack
+    def _draw_single_card_position(self, x, y, index, count, selected, batch=None):
+        """绘制单个卡片位置 (queued on `batch` if given)"""
+        items = [] if batch is None else batch
+        
+        # Position base, card stack and count background: one atlas sprite per look
+        visible = min(count, MAX_VISIBLE_CARDS)
+        items.append(sprite_atlas.item(
+            ('cn_stack', visible, selected), (CARD_WIDTH + 3, CARD_STACK_TOP + 43),
+            lambda surface: _build_card_stack_sprite(surface, visible, selected),
+            (x - CARD_WIDTH//2, y - CARD_STACK_TOP)))
+        
         if count > 0:
-            max_visible = min(count, 10)
-            
-            for i in range(max_visible):
-                card_y = y - i * 4
-                card_rect = pygame.Rect(x - CARD_WIDTH//2, card_y - CARD_HEIGHT, CARD_WIDTH, CARD_HEIGHT)
-                
-                # Draw card shadow
-                shadow_rect = card_rect.move(2, 2)
-                pygame.draw.rect(self.screen, SHADOW_COLOR, shadow_rect, border_radius=10)
-                
-                # Draw card
-                color = HIGHLIGHT_COLOR if selected else CARD_COLOR
-                pygame.draw.rect(self.screen, color, card_rect, border_radius=10)
-                
-                # Draw card border
-                border_color = (255, 200, 50) if selected else CARD_BORDER_COLOR
-                pygame.draw.rect(self.screen, border_color, card_rect, 3, border_radius=10)
-            
-            # Display card count with background
-            count_text = self.font_manager.medium.render(str(count), True, TEXT_COLOR)
-            count_bg = pygame.Rect(x - 20, y - CARD_HEIGHT//2 - 15, 40, 30)
-            pygame.draw.rect(self.screen, SHADOW_COLOR, count_bg.move(2, 2), border_radius=8)
-            pygame.draw.rect(self.screen, (40, 60, 80), count_bg, border_radius=8)
-            pygame.draw.rect(self.screen, ACCENT_COLOR, count_bg, 2, border_radius=8)
-            self.screen.blit(count_text, (x - count_text.get_width()//2, y - CARD_HEIGHT//2 - count_text.get_height()//2))
+            # Display card count
+            count_text = text_cache.render(self.font_manager.medium, str(count), True, TEXT_COLOR)
+            items.append((count_text, (x - count_text.get_width()//2, y - CARD_HEIGHT//2 - count_text.get_height()//2)))
         
         # Draw position number with background
-        pos_text = self.font_manager.small.render(f"Pos {index + 1}", True, TEXT_COLOR)
-        pos_bg = pygame.Rect(x - pos_text.get_width()//2 - 6, y + 45,
-                            pos_text.get_width() + 12, pos_text.get_height() + 6)
-        pygame.draw.rect(self.screen, SHADOW_COLOR, pos_bg.move(2, 2), border_radius=6)
-        pygame.draw.rect(self.screen, (40, 60, 80), pos_bg, border_radius=6)
-        self.screen.blit(pos_text, (x - pos_text.get_width()//2, y + 48))
+        pos_text = text_cache.render(self.font_manager.small, f"Pos {index + 1}", True, TEXT_COLOR)
+        label_size = (pos_text.get_width() + 12, pos_text.get_height() + 6)
+        items.append(sprite_atlas.item(
+            ('cn_label',) + label_size, (label_size[0] + 2, label_size[1] + 2),
+            lambda surface: _build_label_sprite(surface, label_size),
+            (x - pos_text.get_width()//2 - 6, y + 45)))
+        items.append((pos_text, (x - pos_text.get_width()//2, y + 48)))
+        
+        if batch is None:
+            self.screen.blits(items, doreturn=False)
     
     def draw_control_panel(self, buttons, selected_count, selected_position_index, game_logic):
         """Draw the control panel with enhanced styling"""
@@ -236,7 +271,7 @@ class CardNimUI:
         
         # 如果输入框激活，显示提示
         if self.input_box.active:
-            hint_text = self.font_manager.small.render("Input number, ENTER to confirm, ESC to cancel", True, (180, 200, 220))
+            hint_text = text_cache.render(self.font_manager.small, "Input number, ENTER to confirm, ESC to cancel", True, (180, 200, 220))
             self.screen.blit(hint_text, (control_x + control_width//2 - hint_text.get_width()//2, control_y + 70))
         
         # 新增：绘制Winning Hints按钮的悬停提示
@@ -267,7 +302,7 @@ class CardNimUI:
         pygame.draw.rect(self.screen, (100, 180, 255), self.hint_window_rect, 2, border_radius=10)
         
         # 绘制窗口标题
-        title_text = self.font_manager.medium.render("Winning Hint", True, (100, 200, 255))
+        title_text = text_cache.render(self.font_manager.medium, "Winning Hint", True, (100, 200, 255))
         title_rect = title_text.get_rect(center=(window_x + window_width//2, window_y + 25))
         self.screen.blit(title_text, title_rect)
         
@@ -296,15 +331,15 @@ class CardNimUI:
                     self.hovered = False
                 
                 def update_hover(self, mouse_pos):
-                    self.hovered = self.rect.collidepoint(mouse_pos)
+                    render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos))
                 
                 def draw(self, screen):
                     color = (255, 100, 100) if self.hovered else (200, 80, 80)
                     pygame.draw.rect(screen, color, self.rect, border_radius=4)
                     pygame.draw.rect(screen, (255, 200, 200), self.rect, 1, border_radius=4)
                     
-                    font = pygame.font.SysFont('Arial', 20, bold=True)
-                    text_surface = font.render(self.text, True, (255, 255, 255))
+                    font = resource_cache.get_sys_font('Arial', 20, bold=True)
+                    text_surface = text_cache.render(font, self.text, True, (255, 255, 255))
                     text_rect = text_surface.get_rect(center=self.rect.center)
                     screen.blit(text_surface, text_rect)
             
@@ -324,7 +359,7 @@ class CardNimUI:
         ]
         
         for i, hint in enumerate(hints):
-            hint_text = self.font_manager.small.render(hint, True, (150, 170, 190))
+            hint_text = text_cache.render(self.font_manager.small, hint, True, (150, 170, 190))
             self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 20))
     
     def create_buttons(self):
@@ -342,7 +377,7 @@ class CardNimUI:
                 self.corner_radius = 12
             
             def update_hover(self, mouse_pos):
-                self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+                render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
             
             def is_clicked(self, event):
                 return (event.type == pygame.MOUSEBUTTONDOWN and 
@@ -406,8 +441,8 @@ class CardNimUI:
                         (self.rect.centerx + 10, self.rect.centery + 2)
                     ])
                 elif self.icon == 'refresh':
-                    refresh_font = pygame.font.SysFont('Arial', 12, bold=True)
-                    refresh_text = refresh_font.render("Refresh", True, icon_color)
+                    refresh_font = resource_cache.get_sys_font('Arial', 12, bold=True)
+                    refresh_text = text_cache.render(refresh_font, "Refresh", True, icon_color)
                     refresh_rect = refresh_text.get_rect(center=self.rect.center)
                     surface.blit(refresh_text, refresh_rect)
                 
@@ -418,8 +453,8 @@ class CardNimUI:
                     # Draw circle
                     pygame.draw.circle(surface, icon_color, center, radius, 2)
                     # Draw i
-                    font = pygame.font.SysFont('Arial', 16, bold=True)
-                    info_text = font.render("i", True, icon_color)
+                    font = resource_cache.get_sys_font('Arial', 16, bold=True)
+                    info_text = text_cache.render(font, "i", True, icon_color)
                     text_rect = info_text.get_rect(center=center)
                     surface.blit(info_text, text_rect)
                 
@@ -441,8 +476,8 @@ class CardNimUI:
                         pygame.draw.line(surface, (255, 255, 150), (start_x, start_y), (end_x, end_y), 2)
                     
                     # Draw question mark inside
-                    font = pygame.font.SysFont('Arial', 14, bold=True)
-                    q_text = font.render("?", True, (50, 50, 50))
+                    font = resource_cache.get_sys_font('Arial', 14, bold=True)
+                    q_text = text_cache.render(font, "?", True, (50, 50, 50))
                     text_rect = q_text.get_rect(center=center)
                     surface.blit(q_text, text_rect)
                 
@@ -464,25 +499,25 @@ class CardNimUI:
                         pygame.draw.line(surface, (255, 255, 150), (start_x, start_y), (end_x, end_y), 2)
                     
                     # Draw question mark inside
-                    font = pygame.font.SysFont('Arial', 14, bold=True)
-                    q_text = font.render("?", True, (50, 50, 50))
+                    font = resource_cache.get_sys_font('Arial', 14, bold=True)
+                    q_text = text_cache.render(font, "?", True, (50, 50, 50))
                     text_rect = q_text.get_rect(center=center)
                     surface.blit(q_text, text_rect)
             
             def _draw_text(self, surface):
                 text_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-                text_surface = self.font_manager.medium.render(self.text, True, text_color)
+                text_surface = text_cache.render(self.font_manager.medium, self.text, True, text_color)
                 text_rect = text_surface.get_rect(center=self.rect.center)
                 
                 if self.enabled:
-                    shadow_surface = self.font_manager.medium.render(self.text, True, (0, 0, 0, 100))
+                    shadow_surface = text_cache.render(self.font_manager.medium, self.text, True, (0, 0, 0, 100))
                     shadow_rect = text_rect.move(2, 2)
                     surface.blit(shadow_surface, shadow_rect)
                 
                 surface.blit(text_surface, text_rect)
             
             def _draw_tooltip(self, surface):
-                tooltip_surface = self.font_manager.small.render(self.tooltip, True, (220, 240, 255))
+                tooltip_surface = text_cache.render(self.font_manager.small, self.tooltip, True, (220, 240, 255))
                 tooltip_rect = tooltip_surface.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
                 
                 # Draw tooltip background
@@ -493,7 +528,7 @@ class CardNimUI:
                 surface.blit(tooltip_surface, tooltip_rect)
             
             def _draw_tooltip(self, surface):
-                tooltip_surface = self.font_manager.small.render(self.tooltip, True, (220, 240, 255))
+                tooltip_surface = text_cache.render(self.font_manager.small, self.tooltip, True, (220, 240, 255))
                 tooltip_rect = tooltip_surface.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
                 
                 # Draw tooltip background
@@ -580,7 +615,7 @@ class CardNimUI:
         pygame.draw.rect(self.screen, (100, 180, 255), tooltip_rect, 2, border_radius=8)
         
         # 绘制标题
-        title = self.font_manager.medium.render("Winning Hint", True, (100, 200, 255))
+        title = text_cache.render(self.font_manager.medium, "Winning Hint", True, (100, 200, 255))
         title_x = tooltip_x + (tooltip_width - title.get_width()) // 2
         self.screen.blit(title, (title_x, tooltip_y + padding))
         
@@ -591,7 +626,7 @@ class CardNimUI:
         
         # 绘制文本行
         for i, line in enumerate(lines):
-            line_text = self.font_manager.small.render(line, True, (220, 240, 255))
+            line_text = text_cache.render(self.font_manager.small, line, True, (220, 240, 255))
             self.screen.blit(line_text, (tooltip_x + padding, 
                                        tooltip_y + padding + title.get_height() + 10 + i * line_height))
     
@@ -2,6 +2,12 @@
 Dawson-Kayles Game Package
 """
 
-from .game import DawsonKaylesGame
+from utils.lazy_imports import install
+
+# The game classes need pygame; importing them on first access (PEP 562)
+# keeps the logic modules usable headless
+install(globals(), {
+    'DawsonKaylesGame': '.game',
+})
 
 __all__ = ['DawsonKaylesGame']
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Dawson-Kayles Bitboard - integer bitmask positions
+
+Bit i of a board is set while tower i is still available. A move at index i
+connects towers i and i+1, so it is legal exactly when bit i of
+``board & (board >> 1)`` is set, and making or unmaking it is one XOR.
+"""
+
+from typing import List, Tuple
+
+
+def towers_to_board(towers) -> int:
+    """Convert a towers list (1 = available, 0 = connected) to a bitmask"""
+    board = 0
+    for i, tower in enumerate(towers):
+        if tower == 1:
+            board |= 1 << i
+    return board
+
+
+def board_to_towers(board: int, num_towers: int) -> List[int]:
+    """Convert a bitmask back to the towers list used by the UI"""
+    return [(board >> i) & 1 for i in range(num_towers)]
+
+
+def full_board(num_towers: int) -> int:
+    """Board with every tower available"""
+    return (1 << num_towers) - 1
+
+
+def move_mask(move: int) -> int:
+    """Bits touched by connecting towers `move` and `move + 1`"""
+    return 3 << move
+
+
+def make_move(board: int, move: int) -> int:
+    """Play a move; XOR-ing the same move again unmakes it"""
+    return board ^ (3 << move)
+
+
+def move_bits(board: int) -> int:
+    """Bitmask of legal moves: bit i is set when towers i and i+1 are available"""
+    return board & (board >> 1)
+
+
+def is_legal(board: int, move: int) -> bool:
+    """True if towers `move` and `move + 1` are both available"""
+    return move >= 0 and (board >> move) & 3 == 3
+
+
+def available_moves(board: int) -> List[int]:
+    """Legal moves in ascending order, one step per set bit"""
+    moves = []
+    pairs = board & (board >> 1)
+    while pairs:
+        low = pairs & -pairs
+        moves.append(low.bit_length() - 1)
+        pairs ^= low
+    return moves
+
+
+def count_moves(board: int) -> int:
+    """Number of legal moves"""
+    return bin(board & (board >> 1)).count("1")
+
+
+def split_runs(board: int) -> List[Tuple[int, int]]:
+    """Return (start, length) for every maximal run of available towers"""
+    runs = []
+    while board:
+        start = (board & -board).bit_length() - 1
+        shifted = board >> start
+        # Trailing ones of `shifted` form the run
+        length = (shifted ^ (shifted + 1)).bit_length() - 1
+        runs.append((start, length))
+        board ^= ((1 << length) - 1) << start
+    return runs
@@ -10,6 +10,8 @@ from utils.constants import CARD_GAME_FPS, SCREEN_WIDTH, SCREEN_HEIGHT
 from ui.components.sidebar import Sidebar  # 新增导入
 from ui.components.input_box import InputBox  # 新增导入
 from utils.config_manager import config_manager  # 新增导入
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class DawsonKaylesInputHandler:
     """Handles input for Dawson-Kayles game"""
@@ -201,6 +203,7 @@ class DawsonKaylesGame(GameManager):
         self.input_handler = DawsonKaylesInputHandler(self.logic, self.ui)
         self.sidebar = Sidebar(screen, font_manager)  # 新增侧边栏
         self.config_manager = config_manager  # 新增配置管理器
+        self.ambient_redraw_ms = 100  # 空闲时科技背景仍以低帧率动画
         
         # 游戏说明 - 更新以包含提示功能信息
         self.game_instructions = """
@@ -297,6 +300,7 @@ Good luck commander!
         self.game_over_buttons = {}
         self.tower_buttons = []
         self.scroll_buttons = []
+        self.widget_state = None  # 下一帧重建炮塔和滚动按钮
         self.ai_timer = 0
         self.connect_button_rect = None  # 新增：连接按钮区域
     
@@ -631,12 +635,6 @@ Good luck commander!
         # 更新输入框状态
         self.ui.update_input_box()
         
-        # Update tower buttons
-        self.tower_buttons = self.ui.create_tower_buttons(len(self.logic.towers))
-        
-        # Update scroll buttons
-        self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.towers))
-        
         # If game over, create game over buttons
         if self.logic.game_over and not self.game_over_buttons:
             self.game_over_buttons = self.ui.create_game_over_buttons()
@@ -653,12 +651,20 @@ Good luck commander!
                 self.input_handler.selected_position = None
                 self.ui.scroll_offset = 0
         
-        # Update highlighted towers
-        self.ui.update_highlighted_towers(self.logic.get_available_moves(), 
-                                         self.input_handler.selected_position)
-        
-        # 更新按钮状态
-        self.update_button_states()
+        # 控件只在局面、滚动、选择或提示设置变化时重建
+        if self.widgets_changed(self.logic.version, self.ui.scroll_offset,
+                                self.input_handler.selected_position,
+                                self.config_manager.get_user_preferences().winning_hints):
+            # Update tower and scroll buttons
+            self.tower_buttons = self.ui.create_tower_buttons(len(self.logic.towers))
+            self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.towers))
+            
+            # Update highlighted towers
+            self.ui.update_highlighted_towers(self.logic.get_available_moves(), 
+                                             self.input_handler.selected_position)
+            
+            # 更新按钮状态
+            self.update_button_states()
     
     def update_button_states(self):
         """更新按钮状态 - 新增提示按钮状态控制"""
@@ -703,7 +709,7 @@ Good luck commander!
             # 如果显示说明，绘制说明页面
             if self.showing_instructions:
                 self.draw_instructions()
-                pygame.display.flip()
+                render_optimizer.present()
                 return
             
             # Draw background
@@ -737,7 +743,7 @@ Good luck commander!
                 
                 hint_y = 630
                 for i, hint in enumerate(hints):
-                    hint_text = self.font_manager.small.render(hint, True, (180, 220, 255))
+                    hint_text = text_cache.render(self.font_manager.small, hint, True, (180, 220, 255))
                     self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 18))
                 
             else:
@@ -748,7 +754,7 @@ Good luck commander!
             # 最后绘制侧边栏，使其在最上层
             self.sidebar.draw()
             
-            pygame.display.flip()
+            render_optimizer.present()
             
         except Exception as e:
             print(f"Error in draw: {e}")
@@ -775,17 +781,17 @@ Good luck commander!
         pygame.draw.rect(self.screen, (0, 200, 255), (panel_x, panel_y, panel_width, panel_height), 3, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Laser Defense System - Instructions", True, (0, 255, 220))
+        title = text_cache.render(self.font_manager.large, "Laser Defense System - Instructions", True, (0, 255, 220))
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, panel_y + 40))
         self.screen.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.font_manager.medium.render("DAWSON-KAYLES PROTOCOL", True, (100, 200, 255))
+        subtitle = text_cache.render(self.font_manager.medium, "DAWSON-KAYLES PROTOCOL", True, (100, 200, 255))
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, panel_y + 70))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Close hint
-        close_hint = self.font_manager.small.render("Click anywhere or press ESC/I to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Click anywhere or press ESC/I to close", True, (180, 200, 220))
         close_rect = close_hint.get_rect(center=(SCREEN_WIDTH//2, panel_y + panel_height - 30))
         self.screen.blit(close_hint, close_rect)
         
@@ -833,7 +839,7 @@ Good luck commander!
             # Draw each line
             for text_line in lines:
                 if y_pos < panel_y + panel_height - 60:
-                    text_surface = font.render(text_line, True, color)
+                    text_surface = text_cache.render(font, text_line, True, color)
                     text_rect = text_surface.get_rect(left=panel_x + 40, top=y_pos)
                     self.screen.blit(text_surface, text_rect)
                     y_pos += font.get_linesize() + 2
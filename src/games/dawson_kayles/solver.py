@@ -0,0 +1,194 @@
+"""
+Dawson-Kayles Grundy Solver
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from games.dawson_kayles.bitboard import available_moves, full_board, make_move, split_runs
+from utils.bounded_cache import BoundedCache
+from utils.opening_book import get_book
+from utils.position_analysis import DepthSearch, MoveAnalysis, PositionAnalysis, analysis_cache
+from utils.position_sampler import PositionIndex
+
+# Opening book: one record per tower count - the first winning move, or NO_MOVE
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '..', '..', '..', 'assets', 'tables', 'dawson_kayles_book.bin')
+BOOK_FORMAT = '<B'
+NO_MOVE = 0xFF
+
+# Dawson-Kayles is the octal game 0.07: a move removes two adjacent towers
+# from a run, leaving two (possibly empty) runs. Its Grundy sequence is
+# ultimately periodic with period 34; the last value that breaks the period
+# is at n = 86, so G(n) == G(n - 34) for every n >= 87.
+OCTAL_PERIOD = 34
+OCTAL_PREPERIOD = 53
+GRUNDY_TABLE_SIZE = OCTAL_PREPERIOD + 4 * OCTAL_PERIOD
+
+
+def _build_grundy_table(size):
+    """Compute Grundy values of single runs 0..size-1 by mex over all splits"""
+    table = [0] * size
+    for n in range(2, size):
+        reachable = set()
+        remaining = n - 2
+        for left in range(remaining // 2 + 1):
+            reachable.add(table[left] ^ table[remaining - left])
+        mex = 0
+        while mex in reachable:
+            mex += 1
+        table[n] = mex
+    return table
+
+
+GRUNDY_TABLE = _build_grundy_table(GRUNDY_TABLE_SIZE)
+
+# Positions a depth-to-end search may expand (per analysed position)
+DEPTH_SEARCH_NODES = 10000
+
+
+# Number of start-position indexes (one per tower range) kept alive
+INDEX_CACHE_SIZE = 8
+
+# Shared by every DawsonKaylesLogic / DawsonKaylesAutoPlayer in the process
+transposition_table = BoundedCache(max_entries=4096)
+
+
+def _canonical_children(key: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+    """Canonical positions one move away from a canonical position"""
+    children = set()
+    for index, length in enumerate(key):
+        if index and key[index - 1] == length:
+            continue
+        rest = key[:index] + key[index + 1:]
+        for left in range((length - 2) // 2 + 1):
+            pieces = [piece for piece in (left, length - 2 - left) if piece >= 2]
+            children.add(tuple(sorted(rest + tuple(pieces))))
+    return list(children)
+
+
+class DawsonKaylesSolver:
+    """Sprague-Grundy solver that treats every run of available towers as an independent heap"""
+
+    def __init__(self):
+        self.analyses = analysis_cache()
+        self.start_indexes = BoundedCache(INDEX_CACHE_SIZE)
+        # Depth-to-end is not additive over runs, so it is searched on whole canonical positions
+        self.depths = DepthSearch(_canonical_children, max_nodes=DEPTH_SEARCH_NODES)
+
+    def run_grundy(self, length: int) -> int:
+        """Grundy value of a single run of `length` available towers"""
+        if length < GRUNDY_TABLE_SIZE:
+            return GRUNDY_TABLE[length]
+        # Past the preperiod the sequence repeats every OCTAL_PERIOD values
+        return GRUNDY_TABLE[OCTAL_PREPERIOD + (length - OCTAL_PREPERIOD) % OCTAL_PERIOD]
+
+    def canonical_position(self, runs) -> Tuple[int, ...]:
+        """
+        Transposition key for a position: the sorted lengths of the runs that
+        still hold a move. Runs are independent, so their order, the gaps
+        between them and the board's mirror image do not change the analysis.
+        """
+        return tuple(sorted(length for _, length in runs if length >= 2))
+
+    def _lookup(self, key: Tuple[int, ...]):
+        """Return (nim-sum, {run length: winning split offsets}) for a canonical key"""
+        entry = transposition_table.get(key)
+        if entry is not None:
+            return entry
+
+        total = 0
+        for length in key:
+            total ^= self.run_grundy(length)
+
+        splits = {}
+        if total:
+            for length in set(key):
+                # The move has to turn this run into pieces worth `target`
+                target = self.run_grundy(length) ^ total
+                remaining = length - 2
+                splits[length] = tuple(
+                    left for left in range(remaining + 1)
+                    if self.run_grundy(left) ^ self.run_grundy(remaining - left) == target
+                )
+
+        entry = (total, splits)
+        transposition_table.put(key, entry)
+        return entry
+
+    def position_grundy(self, board: int) -> int:
+        """Nim-sum of the Grundy values of all runs of a bitboard"""
+        return self._lookup(self.canonical_position(split_runs(board)))[0]
+
+    def is_winning(self, board: int) -> bool:
+        """True if the player to move can force a win"""
+        return self.position_grundy(board) != 0
+
+    def winning_moves(self, board: int) -> List[int]:
+        """All moves (left tower index) that leave a zero nim-sum"""
+        runs = split_runs(board)
+        total, splits = self._lookup(self.canonical_position(runs))
+        if total == 0:
+            return []
+
+        moves = []
+        for start, length in runs:
+            for left in splits.get(length, ()):
+                moves.append(start + left)
+        return moves
+
+    def depth_to_end(self, board: int) -> Optional[int]:
+        """Moves left with perfect play (fastest win, slowest loss), or None if too large to search"""
+        return self.depths.depth(self.canonical_position(split_runs(board)))
+
+    def analyze_position(self, board: int) -> PositionAnalysis:
+        """Outcome, opponent's winning replies and depth-to-end of every move (cached per board)"""
+        analysis = self.analyses.get(board)
+        if analysis is None:
+            moves = available_moves(board)
+            children = [make_move(board, move) for move in moves]
+            # One node budget for the whole position: long boards get None depths instead of stalling
+            depths = self.depths.depths(self.canonical_position(split_runs(child)) for child in children)
+            results = []
+            for move, child, depth in zip(moves, children, depths):
+                replies = len(self.winning_moves(child))
+                results.append(MoveAnalysis(move, replies == 0, replies, depth))
+            analysis = PositionAnalysis(tuple(results))
+            self.analyses.put(board, analysis)
+        return analysis
+
+    # ---------- Opening book ----------
+
+    def build_book(self, max_towers: int) -> Dict[int, tuple]:
+        """Book groups for full boards of 1..max_towers towers"""
+        groups = {}
+        for num_towers in range(1, max_towers + 1):
+            moves = self.winning_moves(full_board(num_towers))
+            groups[num_towers] = ([(moves[0],)], []) if moves else ([], [(NO_MOVE,)])
+        return groups
+
+    def start_index(self, min_towers: int, max_towers: int) -> PositionIndex:
+        """Full boards of min_towers..max_towers towers, indexed by outcome"""
+        key = (min_towers, max_towers)
+        index = self.start_indexes.get(key)
+        if index is None:
+            index = PositionIndex.build(range(min_towers, max_towers + 1), lambda n: (n,),
+                                        lambda n: self.is_winning(full_board(n)))
+            self.start_indexes.put(key, index)
+        return index
+
+    def sample_winning_start(self, min_towers: int, max_towers: int) -> Optional[int]:
+        """Random tower count in the range whose full board is a first-player win (None if there is none)"""
+        book = get_book(BOOK_PATH)
+        if book is not None:
+            hit = book.random_winning(range(min_towers, max_towers + 1))
+        else:
+            hit = self.start_index(min_towers, max_towers).sample(winning=True)
+        return hit[0] if hit else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the shared transposition table"""
+        return transposition_table.get_stats()
+
+
+# Global solver instance
+dawson_kayles_solver = DawsonKaylesSolver()
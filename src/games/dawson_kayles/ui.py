@@ -7,9 +7,61 @@ import math
 import random
 from utils.constants import *
 from utils.helpers import wrap_text
+from utils.background_layers import background_layers
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.sprite_atlas import sprite_atlas
+from utils.optimization_tools import render_optimizer
 from ui.components.input_box import InputBox  # 新增导入
 from ui.components.scrollables import ScrollablePanel  # 新增导入
 
+# 炮塔外观: (底座颜色, 霓虹颜色)
+TOWER_AVAILABLE = 'available'
+TOWER_P1 = 'p1'
+TOWER_P2 = 'p2'
+TOWER_CONNECTED = 'connected'
+TOWER_COLORS = {
+    TOWER_AVAILABLE: ((30, 35, 50), (0, 200, 255)),    # 可用炮塔基座 / 亮蓝色
+    TOWER_P1: ((0, 80, 120), (0, 255, 220)),           # 玩家1 - 深青色 / 青色霓虹
+    TOWER_P2: ((120, 60, 0), (255, 180, 50)),          # 玩家2/AI - 深橙色 / 橙色霓虹
+    TOWER_CONNECTED: ((50, 50, 65), (100, 100, 120)),  # 默认禁用颜色
+}
+# Room around a tower sprite for the highlight ring
+TOWER_SPRITE_MARGIN = 6
+
+
+def _build_tower_sprite(surface, width, height, look, highlighted):
+    """Draw one tower state into its atlas region (tower rect at TOWER_SPRITE_MARGIN)"""
+    base_color, accent_color = TOWER_COLORS[look]
+    rect = pygame.Rect(TOWER_SPRITE_MARGIN, TOWER_SPRITE_MARGIN, width, height)
+    
+    # 绘制炮塔底座
+    pygame.draw.rect(surface, base_color, rect, border_radius=8)
+    pygame.draw.rect(surface, accent_color, rect, 3, border_radius=8)
+    
+    # 炮塔主体
+    body_width = rect.width - 20
+    body_height = 40
+    body_rect = pygame.Rect(
+        rect.centerx - body_width // 2,
+        rect.top + 20,
+        body_width,
+        body_height
+    )
+    pygame.draw.rect(surface, base_color, body_rect)
+    pygame.draw.rect(surface, accent_color, body_rect, 2)
+    
+    # 炮塔顶部
+    top_radius = min(body_width, body_height) // 2 - 2  # 确保圆形适合矩形
+    top_center = (body_rect.centerx, body_rect.centery)
+    pygame.draw.circle(surface, accent_color, top_center, top_radius, 2)
+    
+    # 高亮显示可用移动
+    if highlighted:
+        highlight_rect = rect.inflate(12, 12)
+        pygame.draw.rect(surface, (0, 255, 200), highlight_rect, 3, border_radius=12)
+
+
 class TowerButton:
     """炮塔按钮类 - 完全兼容原始接口"""
     
@@ -24,59 +76,32 @@ class TowerButton:
         
     def draw(self, surface, tower_state, player_owner=None, is_highlighted=False):
         """绘制炮塔 - 保持原始风格"""
-        # 基础颜色
-        base_color = (40, 45, 60)
-        accent_color = (0, 200, 255)
-        
-        # 根据状态调整颜色
+        surface.blits(self.blit_items(tower_state, player_owner, is_highlighted), doreturn=False)
+    
+    def blit_items(self, tower_state, player_owner=None, is_highlighted=False):
+        """Surface.blits() items for this tower: its atlas sprite and its number"""
+        # 根据状态选择外观
         if tower_state == 0:  # 已连接
-            if player_owner == 1:
-                base_color = (0, 80, 120)      # 玩家1 - 深青色
-                accent_color = (0, 255, 220)   # 玩家1 - 青色霓虹
-            elif player_owner == 2:
-                base_color = (120, 60, 0)      # 玩家2/AI - 深橙色
-                accent_color = (255, 180, 50)  # 玩家2/AI - 橙色霓虹
-            else:
-                base_color = (50, 50, 65)      # 默认禁用颜色
-                accent_color = (100, 100, 120)
+            look = TOWER_P1 if player_owner == 1 else TOWER_P2 if player_owner == 2 else TOWER_CONNECTED
         else:  # 可用
-            base_color = (30, 35, 50)          # 可用炮塔基座
-            accent_color = (0, 200, 255)       # 激活炮塔 - 亮蓝色
-        
-        # 绘制炮塔底座
-        pygame.draw.rect(surface, base_color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, accent_color, self.rect, 3, border_radius=8)
-        
-        # 炮塔主体
-        body_width = self.rect.width - 20
-        body_height = 40
-        body_rect = pygame.Rect(
-            self.rect.centerx - body_width // 2,
-            self.rect.top + 20,
-            body_width,
-            body_height
-        )
-        pygame.draw.rect(surface, base_color, body_rect)
-        pygame.draw.rect(surface, accent_color, body_rect, 2)
+            look = TOWER_AVAILABLE
+        highlighted = is_highlighted and tower_state == 1
         
-        # 炮塔顶部
-        top_radius = min(body_width, body_height) // 2 - 2  # 确保圆形适合矩形
-        top_center = (body_rect.centerx, body_rect.centery)
-        pygame.draw.circle(surface, accent_color, top_center, top_radius, 2)
+        width, height = self.rect.size
+        sprite = sprite_atlas.item(
+            ('tower', width, height, look, highlighted),
+            (width + 2 * TOWER_SPRITE_MARGIN, height + 2 * TOWER_SPRITE_MARGIN),
+            lambda sprite_surface: _build_tower_sprite(sprite_surface, width, height, look, highlighted),
+            (self.rect.x - TOWER_SPRITE_MARGIN, self.rect.y - TOWER_SPRITE_MARGIN))
         
         # 炮塔编号
-        id_text = self.font_manager.small.render(str(self.tower_id), True, (220, 240, 255))
+        id_text = text_cache.render(self.font_manager.small, str(self.tower_id), True, (220, 240, 255))
         text_pos = (self.rect.centerx - 5, self.rect.bottom - 25)
-        surface.blit(id_text, text_pos)
-        
-        # 高亮显示可用移动
-        if is_highlighted and tower_state == 1:
-            highlight_rect = self.rect.inflate(12, 12)
-            pygame.draw.rect(surface, (0, 255, 200, 100), highlight_rect, 3, border_radius=12)
+        return [sprite, (id_text, text_pos)]
     
     def update_hover(self, mouse_pos):
         """更新悬停状态"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """检查是否被点击"""
@@ -121,8 +146,8 @@ class ScrollButton:
         
         # 绘制箭头
         arrow_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        arrow_font = pygame.font.SysFont('Arial', 24, bold=True)
-        arrow_text = arrow_font.render(self.text, True, arrow_color)
+        arrow_font = resource_cache.get_sys_font('Arial', 24, bold=True)
+        arrow_text = text_cache.render(arrow_font, self.text, True, arrow_color)
         arrow_rect = arrow_text.get_rect(center=self.rect.center)
         surface.blit(arrow_text, arrow_rect)
         
@@ -132,7 +157,7 @@ class ScrollButton:
             pygame.draw.rect(surface, (0, 150, 255, 50), glow_rect, 2, border_radius=10)
     def update_hover(self, mouse_pos):
         """更新悬停状态"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """检查是否被点击"""
@@ -152,6 +177,7 @@ class DawsonKaylesUI:
         self.highlighted_towers = set()
         self.time = 0
         self.grid_offset = 0
+        self.last_background_tick = 0
         self.scroll_buttons = []  # 添加滚动按钮存储
         self.input_box = None  # 新增：输入框实例
         
@@ -166,21 +192,37 @@ class DawsonKaylesUI:
         self.hint_close_button = None
         self.hint_window_rect = None
 
+    def _build_bottom_panel(self, surface):
+        """底部科技面板（静态层）"""
+        panel_height = surface.get_height()
+        for i in range(panel_height):
+            alpha = int(200 * (1 - i / panel_height))
+            pygame.draw.line(surface, (10, 20, 40, alpha), (0, i), (SCREEN_WIDTH, i), 1)
+    
+    def _build_header_panel(self, surface):
+        """顶部科技面板（静态层）"""
+        header_height = surface.get_height()
+        for i in range(header_height):
+            alpha = int(180 * (1 - abs(i - header_height/2) / (header_height/2)))
+            pygame.draw.line(surface, (15, 25, 40, alpha), (0, i), (SCREEN_WIDTH, i), 1)
+    
+    def _star_sprite(self, brightness):
+        """预渲染的星星贴图，按亮度缓存"""
+        def build(surface):
+            pygame.draw.circle(surface, (brightness, brightness, brightness), (1, 1), 1)
+        return background_layers.get(('dk_star', brightness), (3, 3), build, alpha=True)
+
     def draw_background(self):
-        """绘制科技风格背景 - 保持原始风格"""
-        self.screen.fill((5, 10, 20))
-        self.time += 0.5
-        self.grid_offset = (self.grid_offset + 0.3) % 40
+        """绘制科技风格背景 - 静态层只渲染一次，动画部分只做位移和贴图"""
+        # 按经过的时间推进动画（以60帧为基准），空闲低帧率时速度不变
+        now = pygame.time.get_ticks()
+        frames = min((now - self.last_background_tick) * 60 / 1000, 30) if self.last_background_tick else 1
+        self.last_background_tick = now
+        self.time += 0.5 * frames
+        self.grid_offset = (self.grid_offset + 0.3 * frames) % 40
         
-        # 绘制动态网格
-        grid_color = (20, 30, 50)
-        for x in range(-40, SCREEN_WIDTH + 40, 40):
-            x_pos = (x + self.grid_offset) % (SCREEN_WIDTH + 80) - 40
-            pygame.draw.line(self.screen, grid_color, (x_pos, 0), (x_pos, SCREEN_HEIGHT), 1)
-        
-        for y in range(-40, SCREEN_HEIGHT + 40, 40):
-            y_pos = (y + self.grid_offset) % (SCREEN_HEIGHT + 80) - 40
-            pygame.draw.line(self.screen, grid_color, (0, y_pos), (SCREEN_WIDTH, y_pos), 1)
+        # 绘制动态网格（预渲染贴片按偏移滚动）
+        background_layers.scrolling_grid(self.screen, 40, (20, 30, 50), (5, 10, 20), self.grid_offset)
         
         # 中心动态网格线
         center_x = SCREEN_WIDTH // 2
@@ -191,37 +233,31 @@ class DawsonKaylesUI:
                         (center_x + 300, center_y),
                         int(pulse_width))
         
-        # 绘制星空效果
+        # 绘制星空效果（半径为0的星星不可见，其余一次批量贴图）
+        stars = []
         for i in range(50):
-            x = (i * 73) % SCREEN_WIDTH
-            y = (i * 37) % SCREEN_HEIGHT
             size = (math.sin(self.time * 0.05 + i) + 1) * 0.5 + 0.5
+            if int(size) < 1:
+                continue
             brightness = 150 + int(math.sin(self.time * 0.03 + i) * 50)
-            pygame.draw.circle(self.screen, (brightness, brightness, brightness), 
-                             (int(x), int(y)), int(size))
+            stars.append((self._star_sprite(brightness), ((i * 73) % SCREEN_WIDTH - 1, (i * 37) % SCREEN_HEIGHT - 1)))
+        self.screen.blits(stars, doreturn=False)
         
         # 绘制底部科技面板
         panel_height = 120
-        panel_rect = pygame.Rect(0, SCREEN_HEIGHT - panel_height, SCREEN_WIDTH, panel_height)
-        for i in range(panel_height):
-            alpha = int(200 * (1 - i / panel_height))
-            pygame.draw.line(self.screen, (10, 20, 40, alpha),
-                           (0, SCREEN_HEIGHT - panel_height + i),
-                           (SCREEN_WIDTH, SCREEN_HEIGHT - panel_height + i),
-                           1)
+        panel = background_layers.get('dk_bottom_panel', (SCREEN_WIDTH, panel_height), self._build_bottom_panel)
+        self.screen.blit(panel, (0, SCREEN_HEIGHT - panel_height))
     
     def draw_game_info(self, game_logic):
         """绘制游戏信息面板 - 保持原始布局"""
         # 顶部科技面板
         header_height = 200
-        for i in range(header_height):
-            alpha = int(180 * (1 - abs(i - header_height/2) / (header_height/2)))
-            color = (15, 25, 40, alpha)
-            pygame.draw.line(self.screen, color, (0, i), (SCREEN_WIDTH, i), 1)
+        header = background_layers.get('dk_header_panel', (SCREEN_WIDTH, header_height), self._build_header_panel)
+        self.screen.blit(header, (0, 0))
         
         # 游戏标题（霓虹效果）
-        title = self.font_manager.large.render("LASER DEFENSE SYSTEM", True, (0, 255, 220))
-        subtitle = self.font_manager.medium.render("DAWSON-KAYLES PROTOCOL", True, (100, 200, 255))
+        title = text_cache.render(self.font_manager.large, "LASER DEFENSE SYSTEM", True, (0, 255, 220))
+        subtitle = text_cache.render(self.font_manager.medium, "DAWSON-KAYLES PROTOCOL", True, (100, 200, 255))
         
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 15))
         self.screen.blit(subtitle, (SCREEN_WIDTH//2 - subtitle.get_width()//2, 55))
@@ -236,7 +272,7 @@ class DawsonKaylesUI:
             mode_text = f"MODE: PLAYER VS AI - {difficulty_names[game_logic.difficulty-1]}"
             mode_color = (255, 150, 0)
         
-        mode_info = self.font_manager.small.render(mode_text, True, mode_color)
+        mode_info = text_cache.render(self.font_manager.small, mode_text, True, mode_color)
         mode_bg = pygame.Rect(20, 165, mode_info.get_width() + 20, mode_info.get_height() + 8)
         pygame.draw.rect(self.screen, (20, 30, 50, 200), mode_bg, border_radius=6)
         pygame.draw.rect(self.screen, mode_color, mode_bg, 2, border_radius=6)
@@ -250,7 +286,7 @@ class DawsonKaylesUI:
         }
         
         player_color = player_colors.get(game_logic.current_player, (255, 255, 255))
-        player_text = self.font_manager.small.render(f"ACTIVE: {game_logic.current_player}", True, player_color)
+        player_text = text_cache.render(self.font_manager.small, f"ACTIVE: {game_logic.current_player}", True, player_color)
         player_bg = pygame.Rect(
             SCREEN_WIDTH - player_text.get_width() - 50,
             163,
@@ -268,7 +304,7 @@ class DawsonKaylesUI:
         available_moves = len(game_logic.get_available_moves())
         
         status_text = f"TOWERS: {towers_remaining} | MOVES: {available_moves}"
-        status = self.font_manager.large.render(status_text, True, (0, 220, 255))
+        status = text_cache.render(self.font_manager.large, status_text, True, (0, 220, 255))
         status_bg = pygame.Rect(
             SCREEN_WIDTH//2 - status.get_width()//2 - 15,
             80,
@@ -287,7 +323,7 @@ class DawsonKaylesUI:
         
         message_lines = wrap_text(game_logic.message, self.font_manager.medium, SCREEN_WIDTH - 100)
         for i, line in enumerate(message_lines):
-            message_text = self.font_manager.medium.render(line, True, message_color)
+            message_text = text_cache.render(self.font_manager.medium, line, True, message_color)
             self.screen.blit(message_text, (SCREEN_WIDTH//2 - message_text.get_width()//2, 130 + i * 25))
         
         # 胜负状态指示器
@@ -295,7 +331,7 @@ class DawsonKaylesUI:
             game_state = "WINNING POSITION" if game_logic.judge_win() else "LOSING POSITION"
             state_color = WIN_COLOR if game_logic.judge_win() else LOSE_COLOR
             
-            state_text = self.font_manager.small.render(game_state, True, state_color)
+            state_text = text_cache.render(self.font_manager.small, game_state, True, state_color)
             state_bg = pygame.Rect(
                 SCREEN_WIDTH//2 - state_text.get_width()//2 - 10,
                 175,
@@ -311,11 +347,13 @@ class DawsonKaylesUI:
         # 先绘制激光
         self._draw_all_lasers(game_logic, tower_buttons)
         
-        # 然后绘制炮塔
+        # 然后绘制炮塔 (一次 blits 批量绘制)
+        tower_blits = []
         for button in tower_buttons:
             owner = self._get_tower_owner(game_logic, button.tower_id)
             is_highlighted = button.tower_id in self.highlighted_towers
-            button.draw(self.screen, game_logic.towers[button.tower_id], owner, is_highlighted)
+            tower_blits.extend(button.blit_items(game_logic.towers[button.tower_id], owner, is_highlighted))
+        self.screen.blits(tower_blits, doreturn=False)
 
         # 绘制滚动按钮（如果存在）
         self.draw_scroll_buttons()
@@ -399,7 +437,7 @@ class DawsonKaylesUI:
         pygame.draw.rect(self.screen, (0, 200, 255), control_bg, 3, border_radius=12)
         
         # 仪表盘标题 - 位置相应上移
-        panel_title = self.font_manager.medium.render("LASER CONTROL PANEL", True, (0, 255, 220))
+        panel_title = text_cache.render(self.font_manager.medium, "LASER CONTROL PANEL", True, (0, 255, 220))
         self.screen.blit(panel_title, (SCREEN_WIDTH//2 - panel_title.get_width()//2, control_y - 10))
         
         # 获取可用的最大i值
@@ -407,7 +445,7 @@ class DawsonKaylesUI:
         
         if max_i >= 0 and not game_logic.game_over:
             # 输入框标签（简洁版）
-            input_label = self.font_manager.small.render(f"Connect i & i+1 (0 to {max_i}):", 
+            input_label = text_cache.render(self.font_manager.small, f"Connect i & i+1 (0 to {max_i}):", 
                                                         True, (180, 220, 255))
             self.screen.blit(input_label, (control_x, control_y + 30))
             
@@ -451,7 +489,7 @@ class DawsonKaylesUI:
             pygame.draw.rect(self.screen, (0, 255, 220), connect_button_rect, 2, border_radius=8)
             
             # 按钮文字
-            connect_text = self.font_manager.small.render("GO", True, (255, 255, 255))  # 改为"GO"
+            connect_text = text_cache.render(self.font_manager.small, "GO", True, (255, 255, 255))  # 改为"GO"
             self.screen.blit(connect_text, (connect_button_rect.centerx - connect_text.get_width()//2, 
                                         connect_button_rect.centery - connect_text.get_height()//2))
             
@@ -459,7 +497,7 @@ class DawsonKaylesUI:
             self._draw_control_panel_decoration(control_bg)
             
             # 快捷方式提示（位置相应上移）
-            shortcut_hint = self.font_manager.small.render("Press 'C' for quick connect", True, (100, 180, 255))
+            shortcut_hint = text_cache.render(self.font_manager.small, "Press 'C' for quick connect", True, (100, 180, 255))
             self.screen.blit(shortcut_hint, (control_bg.centerx - shortcut_hint.get_width()//2, control_y + 65))
             
             # 新增：绘制提示按钮（如果buttons参数提供）
@@ -492,9 +530,9 @@ class DawsonKaylesUI:
         else:
             # 没有可用移动或游戏已结束
             if game_logic.game_over:
-                status_text = self.font_manager.small.render("GAME OVER", True, (255, 100, 100))
+                status_text = text_cache.render(self.font_manager.small, "GAME OVER", True, (255, 100, 100))
             else:
-                status_text = self.font_manager.small.render("NO MOVES LEFT", True, (255, 100, 100))
+                status_text = text_cache.render(self.font_manager.small, "NO MOVES LEFT", True, (255, 100, 100))
             self.screen.blit(status_text, (control_bg.centerx - status_text.get_width()//2, control_y + 20))
             
             # 仪表盘装饰
@@ -541,7 +579,7 @@ class DawsonKaylesUI:
                 self.corner_radius = 10
             
             def update_hover(self, mouse_pos):
-                self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+                render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
             
             def is_clicked(self, event):
                 return (event.type == pygame.MOUSEBUTTONDOWN and 
@@ -637,8 +675,8 @@ class DawsonKaylesUI:
                     pygame.draw.rect(surface, (200, 180, 100), bottom_rect, border_radius=3)
                     
                     # 问号
-                    font = pygame.font.SysFont('Arial', 16, bold=True)
-                    q_text = font.render("?", True, (60, 60, 80))
+                    font = resource_cache.get_sys_font('Arial', 16, bold=True)
+                    q_text = text_cache.render(font, "?", True, (60, 60, 80))
                     text_rect = q_text.get_rect(center=center)
                     surface.blit(q_text, text_rect)
                     
@@ -653,7 +691,7 @@ class DawsonKaylesUI:
             
             def _draw_tech_text(self, surface):
                 text_color = (240, 250, 255) if self.enabled else (120, 130, 140)
-                text_surface = self.font_manager.small.render(self.text, True, text_color)
+                text_surface = text_cache.render(self.font_manager.small, self.text, True, text_color)
                 text_rect = text_surface.get_rect(center=self.rect.center)
                 surface.blit(text_surface, text_rect)
         
@@ -830,18 +868,23 @@ class DawsonKaylesUI:
         
         # 绘制文本行
         for i, line in enumerate(lines):
-            line_text = self.font_manager.small.render(line, True, (220, 240, 255))
+            line_text = text_cache.render(self.font_manager.small, line, True, (220, 240, 255))
             self.screen.blit(line_text, (tooltip_x + padding, 
                                        tooltip_y + padding + i * line_height))
     
     def show_hint_tooltip(self, text, pos):
         """显示提示工具提示"""
+        if not self.is_hint_tooltip_visible:
+            # 提示框跟随鼠标绘制，出现和消失都重绘整屏（下一帧生效）
+            render_optimizer.mark_dirty()
         self.is_hint_tooltip_visible = True
         self.hint_tooltip_text = text
         self.hint_tooltip_pos = pos
     
     def hide_hint_tooltip(self):
         """隐藏提示工具提示"""
+        if self.is_hint_tooltip_visible:
+            render_optimizer.mark_dirty()
         self.is_hint_tooltip_visible = False
         self.hint_tooltip_text = ""
     
@@ -867,7 +910,7 @@ class DawsonKaylesUI:
         pygame.draw.rect(self.screen, (0, 200, 255), self.hint_window_rect, 3, border_radius=12)
         
         # 绘制窗口标题
-        title_text = self.font_manager.large.render("WINNING HINT", True, (0, 255, 220))
+        title_text = text_cache.render(self.font_manager.large, "WINNING HINT", True, (0, 255, 220))
         title_rect = title_text.get_rect(center=(window_x + window_width//2, window_y + 30))
         self.screen.blit(title_text, title_rect)
         
@@ -896,15 +939,15 @@ class DawsonKaylesUI:
                     self.hovered = False
                 
                 def update_hover(self, mouse_pos):
-                    self.hovered = self.rect.collidepoint(mouse_pos)
+                    render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos))
                 
                 def draw(self, screen):
                     color = (255, 100, 100) if self.hovered else (200, 80, 80)
                     pygame.draw.rect(screen, color, self.rect, border_radius=4)
                     pygame.draw.rect(screen, (255, 200, 200), self.rect, 1, border_radius=4)
                     
-                    font = pygame.font.SysFont('Arial', 20, bold=True)
-                    text_surface = font.render(self.text, True, (255, 255, 255))
+                    font = resource_cache.get_sys_font('Arial', 20, bold=True)
+                    text_surface = text_cache.render(font, self.text, True, (255, 255, 255))
                     text_rect = text_surface.get_rect(center=self.rect.center)
                     screen.blit(text_surface, text_rect)
             
@@ -914,7 +957,7 @@ class DawsonKaylesUI:
         self.hint_close_button.draw(self.screen)
         
         # 绘制关闭提示
-        close_hint = self.font_manager.small.render("Press ESC or click X to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Press ESC or click X to close", True, (180, 200, 220))
         close_hint_rect = close_hint.get_rect(center=(window_x + window_width//2, window_y + window_height - 20))
         self.screen.blit(close_hint, close_hint_rect)
     
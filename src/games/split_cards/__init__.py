@@ -2,6 +2,12 @@
 Split Cards Game Package
 """
 
-from .game import SplitCardsGame
+from utils.lazy_imports import install
+
+# The game classes need pygame; importing them on first access (PEP 562)
+# keeps the logic modules usable headless
+install(globals(), {
+    'SplitCardsGame': '.game',
+})
 
 __all__ = ['SplitCardsGame']
\ No newline at end of file
@@ -10,6 +10,9 @@ from ui.components.sidebar import Sidebar
 from utils.constants import CARD_GAME_FPS, SCREEN_WIDTH, SCREEN_HEIGHT, ACCENT_COLOR, TEXT_COLOR
 from utils.key_repeat import KeyRepeatManager
 from utils.config_manager import config_manager  # 新增导入
+from utils.optimization_tools import render_optimizer
+from utils.performance_monitor import performance_monitor
+from utils.text_cache import text_cache
 
 class SplitCardsInputHandler:
     """Handles input for Split Cards game"""
@@ -735,7 +738,7 @@ Good luck and have fun!
         # 如果显示说明，绘制说明页面
         if self.showing_instructions:
             self.draw_instructions()
-            pygame.display.flip()
+            render_optimizer.present()
             return
         
         try:
@@ -794,7 +797,7 @@ Good luck and have fun!
                 ]
                 hint_y = self.ui.table_rect.bottom + 180
                 for i, hint in enumerate(hints):
-                    hint_text = self.font_manager.small.render(hint, True, (200, 190, 170))
+                    hint_text = text_cache.render(self.font_manager.small, hint, True, (200, 190, 170))
                     self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 20))
                
             else:
@@ -804,7 +807,7 @@ Good luck and have fun!
             # 最后绘制侧边栏，使其在最上层
             self.sidebar.draw()
             
-            pygame.display.flip()
+            render_optimizer.present()
             
         except Exception as e:
             print(f"Error in draw: {e}")
@@ -829,12 +832,12 @@ Good luck and have fun!
         pygame.draw.rect(self.screen, (180, 150, 110), (panel_x, panel_y, panel_width, panel_height), 3, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Split Cards Game - Instructions", True, (240, 230, 220))
+        title = text_cache.render(self.font_manager.large, "Split Cards Game - Instructions", True, (240, 230, 220))
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, panel_y + 40))
         self.screen.blit(title, title_rect)
         
         # Close hint
-        close_hint = self.font_manager.small.render("Click anywhere or press ESC/I to close", True, (200, 190, 170))
+        close_hint = text_cache.render(self.font_manager.small, "Click anywhere or press ESC/I to close", True, (200, 190, 170))
         close_rect = close_hint.get_rect(center=(SCREEN_WIDTH//2, panel_y + panel_height - 30))
         self.screen.blit(close_hint, close_rect)
         
@@ -882,7 +885,7 @@ Good luck and have fun!
             # Draw each line
             for text_line in lines:
                 if y_pos < panel_y + panel_height - 60:
-                    text_surface = font.render(text_line, True, color)
+                    text_surface = text_cache.render(font, text_line, True, color)
                     text_rect = text_surface.get_rect(left=panel_x + 40, top=y_pos)
                     self.screen.blit(text_surface, text_rect)
                     y_pos += font.get_linesize() + 2
@@ -890,10 +893,26 @@ Good luck and have fun!
     def run(self):
         """Run the main game loop"""
         self.running = True
+        render_optimizer.mark_dirty()
         while self.running:
+            performance_monitor.start_frame()
+            
+            # Keys, clicks and window events redraw the screen; pointer motion
+            # only damages the components whose hover it changes
+            render_optimizer.mark_input(self.tracks_pointer())
+            
             if not self.handle_events():
                 break
             
             self.update()
+            
+            # Idle screens skip drawing and sleep until input arrives
+            if not render_optimizer.needs_redraw(self.is_animating(), self.ambient_redraw_ms):
+                performance_monitor.end_frame()
+                render_optimizer.wait_for_input()
+                continue
+            
+            render_optimizer.begin_frame(self.screen)
             self.draw()
+            performance_monitor.end_frame()
             self.clock.tick(CARD_GAME_FPS)
\ No newline at end of file
@@ -11,6 +11,9 @@ but they have some different and strange meaning.
 '''
 import random
 from utils.constants import *  # Using relative imports
+from games.split_cards.moves import iter_moves, random_move, as_move
+from games.split_cards.solver import split_cards_solver
+from utils.replay_recorder import record_ai_turn, record_game_start, record_move
 
 class SplitCardsLogic:
     """Game logic for Split Cards game"""
@@ -33,77 +36,22 @@ class SplitCardsLogic:
     
     def calculate_sg_value(self, n, k):
         """Calculate Sprague-Grundy value for a pile"""
-        if n % (2**2) == 0:
-            return n - 1
-        elif n % (2**2) == 2**2 - 1:
-            return n + 1
-        else:
-            return n
+        return split_cards_solver.sg_value(n)
     
     def is_winning_position(self):
         """Check if current position is winning using SG theory"""
         if not self.card_piles:
             return False
         
-        sg = 0
-        for pile in self.card_piles:
-            sg ^= self.calculate_sg_value(pile, self.max_take)
-        
-        return sg != 0
+        return split_cards_solver.is_winning(self.card_piles)
     
     def get_valid_moves(self):
         """Get all valid moves for current position"""
-        moves = []
-        
-        # Take moves
-        for i, pile in enumerate(self.card_piles):
-            if pile > 0:
-                # 修改：现在最大取牌数是当前牌堆的大小
-                for take_count in range(1, pile + 1):  # 移除了min(self.max_take, pile)
-                    moves.append({
-                        'type': 'take',
-                        'pile_index': i,
-                        'count': take_count
-                    })
-        
-        # Split moves
-        for i, pile in enumerate(self.card_piles):
-            if pile > 1:  # Can only split piles with more than 1 card
-                for split_point in range(1, pile):  # Split into two non-empty piles
-                    moves.append({
-                        'type': 'split',
-                        'pile_index': i,
-                        'left_count': split_point,
-                        'right_count': pile - split_point
-                    })
-        
-        return moves
+        return list(iter_moves(self.card_piles))
     
     def find_winning_move(self):
         """Find a winning move using SG theory"""
-        valid_moves = self.get_valid_moves()
-        
-        for move in valid_moves:
-            # Simulate the move
-            if move['type'] == 'take':
-                new_piles = self.card_piles.copy()
-                new_piles[move['pile_index']] -= move['count']
-                if new_piles[move['pile_index']] == 0:
-                    new_piles.pop(move['pile_index'])
-            else:  # split
-                new_piles = self.card_piles.copy()
-                old_pile = new_piles.pop(move['pile_index'])
-                new_piles.append(move['left_count'])
-                new_piles.append(move['right_count'])
-            
-            # Check if resulting position is losing for opponent
-            temp_logic = SplitCardsLogic()
-            temp_logic.card_piles = new_piles
-            temp_logic.max_take = self.max_take
-            if not temp_logic.is_winning_position():
-                return move
-        
-        return None
+        return split_cards_solver.winning_move(self.card_piles)
     
     def generate_initial_piles(self, target_total, difficulty):
         """Generate initial piles with at least 2 piles"""
@@ -158,6 +106,7 @@ class SplitCardsLogic:
         
         return piles
     
+    @record_game_start("split_cards")
     def initialize_game(self, game_mode, difficulty=None, winning_hints=False):
         """Initialize a new game with winning hints support"""
         self.game_mode = game_mode
@@ -219,16 +168,20 @@ class SplitCardsLogic:
         else:
             self.message = f"Game Started! {len(self.card_piles)} piles with {total_cards} total cards. Max take: {self.max_take}. {self.current_player}'s turn."
     
+    @record_move(lambda logic, move_info: as_move(move_info))
     def make_move(self, move_info):
         """Execute a move"""
         if self.game_over:
             return False
         
-        move_type = move_info.get('type')
+        move = as_move(move_info)
+        
+        if move is None:
+            return False
         
-        if move_type == 'take':
-            pile_idx = move_info.get('pile_index')
-            count = move_info.get('count')
+        pile_idx = move.pile_index
+        if move.type == 'take':
+            count = move.count
             
             if (0 <= pile_idx < len(self.card_piles) and 
                 1 <= count <= self.card_piles[pile_idx]):
@@ -239,10 +192,9 @@ class SplitCardsLogic:
                 # Remove empty piles
                 if self.card_piles[pile_idx] == 0:
                     self.card_piles.pop(pile_idx)
-        elif move_type == 'split':
-            pile_idx = move_info.get('pile_index')
-            left_count = move_info.get('left_count')
-            right_count = move_info.get('right_count')
+        else:
+            left_count = move.left_count
+            right_count = move.right_count
             
             if (0 <= pile_idx < len(self.card_piles) and
                 left_count > 0 and right_count > 0 and
@@ -253,8 +205,6 @@ class SplitCardsLogic:
                 self.card_piles.append(left_count)
                 self.card_piles.append(right_count)
                 self.message = f"{self.current_player} split pile {pile_idx + 1} into piles of {left_count} and {right_count} cards."
-        else:
-            return False
         
         # 移动后更新最大取牌上限
         if self.card_piles:
@@ -299,6 +249,7 @@ class SplitCardsLogic:
                     total_cards = sum(self.card_piles)
                     self.message += f" {self.current_player}'s turn. {len(self.card_piles)} piles ({total_cards} cards) remaining."
     
+    @record_ai_turn
     def ai_make_move(self):
         """Let AI make a move (only in PvE mode)"""
         if (self.game_mode == "PVE" and 
@@ -328,22 +279,25 @@ class SplitCardsLogic:
             # Find a winning move
             winning_move = self.find_winning_move()
             if winning_move:
-                if winning_move['type'] == 'take':
-                    hint += f"ACTION: \n Take {winning_move['count']} card(s) \n from Pile {winning_move['pile_index'] + 1}\n\n"
+                if winning_move.type == 'take':
+                    hint += f"ACTION: \n Take {winning_move.count} card(s) \n from Pile {winning_move.pile_index + 1}\n\n"
                     hint += f"Steps:\n"
-                    hint += f"1. Click on Pile {winning_move['pile_index'] + 1}\n"
+                    hint += f"1. Click on Pile {winning_move.pile_index + 1}\n"
                     hint += f"2. Click 'Take Cards' button\n"
-                    hint += f"3. Set number to {winning_move['count']} \n (use arrows or type directly)\n"
+                    hint += f"3. Set number to {winning_move.count} \n (use arrows or type directly)\n"
                     hint += f"4. Click 'Confirm Move' \n or press ENTER\n"
                 else:  # split
-                    hint += f"ACTION: Split Pile {winning_move['pile_index'] + 1} \n into {winning_move['left_count']} and {winning_move['right_count']} cards\n\n"
+                    hint += f"ACTION: Split Pile {winning_move.pile_index + 1} \n into {winning_move.left_count} and {winning_move.right_count} cards\n\n"
                     hint += f"Steps:\n"
-                    hint += f"1. Click on Pile {winning_move['pile_index'] + 1}\n"
+                    hint += f"1. Click on Pile {winning_move.pile_index + 1}\n"
                     hint += f"2. Click 'Split Pile' button\n"
-                    hint += f"3. Set split point to {winning_move['left_count']} \n (use arrows or type directly)\n"
+                    hint += f"3. Set split point to {winning_move.left_count} \n (use arrows or type directly)\n"
                     hint += f"4. Click 'Confirm Move' \n or press ENTER\n"
                 
                 hint += f"\nReason: This move leaves opponent in a losing position."
+                depth = split_cards_solver.depth_to_end(self.card_piles)
+                if depth is not None:
+                    hint += f"\nWith perfect play you win in {depth} more moves."
             else:
                 hint += "No winning move found. All moves lead to opponent advantage.\n"
                 hint += "Try any move and hope for opponent mistake."
@@ -351,41 +305,30 @@ class SplitCardsLogic:
         else:
             hint += "LOSING POSITION - Best Defense:\n\n"
             
-            # Find best defensive move (most complex position)
-            valid_moves = self.get_valid_moves()
-            best_move = None
-            max_complexity = 0
-            
-            for move in valid_moves:
-                # Calculate complexity: number of piles after move
-                if move['type'] == 'take':
-                    new_piles = len(self.card_piles)
-                    if self.card_piles[move['pile_index']] - move['count'] == 0:
-                        new_piles -= 1
-                else:  # split
-                    new_piles = len(self.card_piles) + 1  # One pile becomes two
-                
-                if new_piles > max_complexity:
-                    max_complexity = new_piles
-                    best_move = move
+            # Best defense: fewest winning replies for the opponent, then the longest game
+            best = split_cards_solver.analyze_position(self.card_piles).best()
+            best_move = best.move if best else None
             
             if best_move:
-                if best_move['type'] == 'take':
-                    hint += f"ACTION: Take {best_move['count']} card(s) from Pile {best_move['pile_index'] + 1}\n\n"
+                if best_move.type == 'take':
+                    hint += f"ACTION: Take {best_move.count} card(s) from Pile {best_move.pile_index + 1}\n\n"
                     hint += f"Steps:\n"
-                    hint += f"1. Click on Pile {best_move['pile_index'] + 1}\n"
+                    hint += f"1. Click on Pile {best_move.pile_index + 1}\n"
                     hint += f"2. Click 'Take Cards' button\n"
-                    hint += f"3. Set number to {best_move['count']} (use arrows or type directly)\n"
+                    hint += f"3. Set number to {best_move.count} (use arrows or type directly)\n"
                     hint += f"4. Click 'Confirm Move' or press ENTER\n"
                 else:  # split
-                    hint += f"ACTION: Split Pile {best_move['pile_index'] + 1} into {best_move['left_count']} and {best_move['right_count']} cards\n\n"
+                    hint += f"ACTION: Split Pile {best_move.pile_index + 1} into {best_move.left_count} and {best_move.right_count} cards\n\n"
                     hint += f"Steps:\n"
-                    hint += f"1. Click on Pile {best_move['pile_index'] + 1}\n"
+                    hint += f"1. Click on Pile {best_move.pile_index + 1}\n"
                     hint += f"2. Click 'Split Pile' button\n"
-                    hint += f"3. Set split point to {best_move['left_count']} (use arrows or type directly)\n"
+                    hint += f"3. Set split point to {best_move.left_count} (use arrows or type directly)\n"
                     hint += f"4. Click 'Confirm Move' or press ENTER\n"
                 
-                hint += f"\nReason: This creates {max_complexity} piles, giving opponent more chances to make mistakes."
+                hint += f"\nReason: Opponent keeps only {best.opponent_winning_replies} winning replies, "
+                hint += "giving them more chances to make mistakes."
+                if best.depth is not None:
+                    hint += f"\nWith perfect play the game lasts {best.depth + 1} more moves."
         
         # Add quick summary
         total_cards = sum(self.card_piles)
@@ -404,50 +347,36 @@ class SplitCardsAI:
     
     def get_move(self):
         """Get AI move based on difficulty"""
-        valid_moves = self.game_logic.get_valid_moves()
-        
-        if not valid_moves:
-            return None
+        piles = self.game_logic.card_piles
         
         # Based on difficulty, choose strategy
         if self.difficulty == 1:  # Easy: mostly random
             if random.random() < 0.7:  # 70% random
-                return random.choice(valid_moves)
+                return random_move(piles)
             else:
-                return self.find_winning_move(valid_moves)
+                return self.find_winning_move()
         elif self.difficulty == 2:  # Normal: mixed
             if random.random() < 0.5:  # 50% random
-                return random.choice(valid_moves)
+                return random_move(piles)
             else:
-                return self.find_winning_move(valid_moves)
+                return self.find_winning_move()
         elif self.difficulty == 3:  # Hard: mostly optimal
             if random.random() < 0.2:  # 20% random
-                return random.choice(valid_moves)
+                return random_move(piles)
             else:
-                return self.find_winning_move(valid_moves)
-        else:  # Insane: always optimal
-            return self.find_winning_move(valid_moves)
+                return self.find_winning_move()
+        else:  # Insane: always optimal, best defense when losing
+            move = split_cards_solver.winning_move(piles)
+            if move is None:
+                best = split_cards_solver.analyze_position(piles).best()
+                move = best.move if best else None
+            return move
     
-    def find_winning_move(self, valid_moves):
+    def find_winning_move(self):
         """Find a winning move if exists, otherwise random"""
-        for move in valid_moves:
-            # Test if this move leads to a losing position for opponent
-            test_game = SplitCardsLogic()
-            test_game.card_piles = self.game_logic.card_piles.copy()
-            test_game.max_take = self.game_logic.max_take
-            
-            if move['type'] == 'take':
-                test_game.card_piles[move['pile_index']] -= move['count']
-                if test_game.card_piles[move['pile_index']] == 0:
-                    test_game.card_piles.pop(move['pile_index'])
-            else:  # split
-                pile_idx = move['pile_index']
-                test_game.card_piles.pop(pile_idx)
-                test_game.card_piles.append(move['left_count'])
-                test_game.card_piles.append(move['right_count'])
-            
-            if not test_game.is_winning_position():
-                return move
+        move = split_cards_solver.winning_move(self.game_logic.card_piles)
+        if move is not None:
+            return move
         
         # No winning move found, return random
-        return random.choice(valid_moves)
\ No newline at end of file
+        return random_move(self.game_logic.card_piles)
@@ -0,0 +1,81 @@
+"""
+Split Cards Moves - compact move type and lazy enumeration
+"""
+
+import random
+from collections import namedtuple
+from typing import Iterator, List, Optional
+
+# 'take': remove `count` cards from pile `pile_index`
+# 'split': replace pile `pile_index` with piles of `left_count` and `right_count`
+Move = namedtuple('Move', ['type', 'pile_index', 'count', 'left_count', 'right_count'],
+                  defaults=(0, 0, 0))
+
+
+def take_move(pile_index: int, count: int) -> Move:
+    """Move that takes `count` cards from a pile"""
+    return Move('take', pile_index, count)
+
+
+def split_move(pile_index: int, left_count: int, right_count: int) -> Move:
+    """Move that splits a pile into two non-empty piles"""
+    return Move('split', pile_index, 0, left_count, right_count)
+
+
+def as_move(move_info) -> Optional[Move]:
+    """Accept a Move or the dict form built by the UI"""
+    if isinstance(move_info, Move):
+        return move_info
+    move_type = move_info.get('type')
+    if move_type == 'take':
+        return take_move(move_info.get('pile_index'), move_info.get('count'))
+    if move_type == 'split':
+        return split_move(move_info.get('pile_index'),
+                          move_info.get('left_count'), move_info.get('right_count'))
+    return None
+
+
+def iter_moves(piles) -> Iterator[Move]:
+    """Yield every legal move: all takes first, then all splits"""
+    for i, pile in enumerate(piles):
+        for count in range(1, pile + 1):
+            yield take_move(i, count)
+    for i, pile in enumerate(piles):
+        for left in range(1, pile):
+            yield split_move(i, left, pile - left)
+
+
+def count_moves(piles) -> int:
+    """Number of legal moves: `pile` takes and `pile - 1` splits per pile"""
+    return sum(2 * pile - 1 for pile in piles if pile > 0)
+
+
+def random_move(piles) -> Optional[Move]:
+    """Uniformly random legal move, picked by index without listing the moves"""
+    total = count_moves(piles)
+    if total == 0:
+        return None
+    index = random.randrange(total)
+    for i, pile in enumerate(piles):
+        if index < pile:
+            return take_move(i, index + 1)
+        index -= max(pile, 0)
+    for i, pile in enumerate(piles):
+        if index < pile - 1:
+            return split_move(i, index + 1, pile - index - 1)
+        index -= max(pile - 1, 0)
+    return None
+
+
+def apply_move(piles, move: Move) -> List[int]:
+    """Piles after `move`, as a new list (empty piles are dropped, splits go to the end)"""
+    piles = list(piles)
+    if move.type == 'take':
+        piles[move.pile_index] -= move.count
+        if piles[move.pile_index] == 0:
+            piles.pop(move.pile_index)
+    else:
+        piles.pop(move.pile_index)
+        piles.append(move.left_count)
+        piles.append(move.right_count)
+    return piles
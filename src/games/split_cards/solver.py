@@ -0,0 +1,148 @@
+"""
+Split Cards Nim-Sum Solver
+"""
+
+from typing import Optional, Tuple
+from games.split_cards.moves import Move, apply_move, iter_moves, take_move, split_move
+from utils.position_analysis import DepthSearch, MoveAnalysis, PositionAnalysis, analysis_cache
+
+# Positions expanded per depth-to-end search; larger games report no depth
+DEPTH_SEARCH_NODES = 4000
+
+
+def _pile_children(piles):
+    """Sorted pile tuples one move away (order and empty piles do not matter)"""
+    children = set()
+    for i, pile in enumerate(piles):
+        rest = piles[:i] + piles[i+1:]
+        for remaining in range(pile):
+            children.add(tuple(sorted(rest + ((remaining,) if remaining else ()))))
+        for left in range(1, pile // 2 + 1):
+            children.add(tuple(sorted(rest + (left, pile - left))))
+    return list(children)
+
+
+class SplitCardsSolver:
+    """
+    Closed-form solver for Split Cards (Lasker's Nim: take any number of cards
+    from a pile, or split a pile into two non-empty piles).
+
+    sg(4m+1) = 4m+1, sg(4m+2) = 4m+2, sg(4m+3) = 4m+4, sg(4m+4) = 4m+3.
+    The mapping only swaps 4m+3 and 4m+4, so it is its own inverse, and a
+    winning move is read off the required value of one pile instead of
+    simulating every move.
+    """
+
+    def __init__(self):
+        self.analyses = analysis_cache()
+        self.depths = DepthSearch(_pile_children, max_nodes=DEPTH_SEARCH_NODES)
+
+    def sg_value(self, pile: int) -> int:
+        """Sprague-Grundy value of a single pile (0 for an empty pile)"""
+        if pile <= 0:
+            return 0
+        if pile % 4 == 0:
+            return pile - 1
+        if pile % 4 == 3:
+            return pile + 1
+        return pile
+
+    def sg_inverse(self, value: int) -> int:
+        """The pile size whose SG value is `value`"""
+        return self.sg_value(value)
+
+    def nim_sum(self, piles) -> int:
+        """XOR of the SG values of all piles"""
+        total = 0
+        for pile in piles:
+            total ^= self.sg_value(pile)
+        return total
+
+    def is_winning(self, piles) -> bool:
+        """True if the player to move can force a win"""
+        return self.nim_sum(piles) != 0
+
+    def take_for_target(self, pile: int, target: int) -> Optional[int]:
+        """Number of cards to take so the pile is worth `target`, or None"""
+        remaining = self.sg_inverse(target)
+        if remaining < pile:
+            return pile - remaining
+        return None
+
+    def split_for_target(self, pile: int, target: int) -> Optional[Tuple[int, int]]:
+        """Split (left, right) whose SG values XOR to `target`, or None"""
+        if pile % 4 == 3 and target == pile:
+            # 4m+3 is worth 4m+4; a single card next to 4m+2 is worth exactly 4m+3
+            return 1, pile - 1
+        # Splits worth more than sg(pile) have no closed form; they are never
+        # needed for a winning move, so this scan only serves explicit queries
+        for left in range(1, pile // 2 + 1):
+            if self.sg_value(left) ^ self.sg_value(pile - left) == target:
+                return left, pile - left
+        return None
+
+    def winning_move(self, piles) -> Optional[Move]:
+        """
+        A move that leaves a zero nim-sum, or None in a losing position.
+
+        Pile i must end up worth sg(pile) ^ total. Takes are preferred; when
+        none exists, the pile whose value has to drop is a 4m+3 pile that
+        must end up worth 4m+3, which is the split (1, 4m+2).
+        """
+        total = self.nim_sum(piles)
+        if total == 0:
+            return None
+
+        for i, pile in enumerate(piles):
+            count = self.take_for_target(pile, self.sg_value(pile) ^ total)
+            if count is not None:
+                return take_move(i, count)
+
+        for i, pile in enumerate(piles):
+            target = self.sg_value(pile) ^ total
+            if target < self.sg_value(pile):
+                split = self.split_for_target(pile, target)
+                if split is not None:
+                    return split_move(i, split[0], split[1])
+        return None
+
+    def winning_move_count(self, piles) -> int:
+        """Number of moves (as listed by iter_moves) that leave a zero nim-sum"""
+        total = self.nim_sum(piles)
+        if total == 0:
+            return 0
+        count = 0
+        for pile in piles:
+            target = self.sg_value(pile) ^ total
+            if self.take_for_target(pile, target) is not None:
+                count += 1
+            count += sum(1 for left in range(1, pile)
+                         if self.sg_value(left) ^ self.sg_value(pile - left) == target)
+        return count
+
+    def depth_to_end(self, piles) -> Optional[int]:
+        """Moves left under perfect play, or None if the game is too long to search"""
+        return self.depths.depth(tuple(sorted(pile for pile in piles if pile > 0)))
+
+    def analyze_position(self, piles) -> PositionAnalysis:
+        """Every move in iter_moves order, with the opponent's winning replies and the depth left"""
+        key = tuple(piles)
+        analysis = self.analyses.get(key)
+        if analysis is not None:
+            return analysis
+
+        # A position over the search budget has children over it too
+        searching = self.depth_to_end(piles) is not None
+        results = []
+        for move in iter_moves(piles):
+            child = apply_move(piles, move)
+            replies = self.winning_move_count(child)
+            depth = self.depth_to_end(child) if searching else None
+            results.append(MoveAnalysis(move, replies == 0, replies, depth))
+        analysis = PositionAnalysis(tuple(results))
+        self.analyses.put(key, analysis)
+        return analysis
+
+
+# Global solver instance shared by SplitCardsLogic and SplitCardsAI
+split_cards_solver = SplitCardsSolver()
@@ -5,10 +5,86 @@ Split Cards Game UI Components
 import pygame
 import math
 from utils.constants import *
+from utils.background_layers import background_layers
 from utils.helpers import wrap_text
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.sprite_atlas import sprite_atlas
+from utils.optimization_tools import render_optimizer
 from ui.components.input_box import InputBox  # 新增导入
 from ui.components.scrollables import ScrollablePanel  # 新增导入
 
+# Card pile sprites: piles show at most PILE_VISIBLE_CARDS cards, so that is
+# also the number of distinct stack looks
+PILE_VISIBLE_CARDS = 5
+PILE_SPRITE_MARGIN = 6  # room for the selection frame
+
+
+def _build_pile_sprite(surface, width, height, bucket, selection):
+    """Draw a pile of `bucket` visible cards with its pile (x, y) at PILE_SPRITE_MARGIN"""
+    x = y = PILE_SPRITE_MARGIN
+    pile_rect = pygame.Rect(x, y, width, height)
+    
+    # Draw pile shadow
+    shadow_rect = pile_rect.move(2, 2)
+    pygame.draw.rect(surface, (150, 120, 90), shadow_rect, border_radius=10)
+    
+    # Draw cards in stack (visual effect)
+    card_color = (255, 245, 230)  # Off-white card color
+    border_color = (180, 150, 110)  # Wood-like border
+    
+    if selection == 'take':
+        card_color = (255, 255, 200)  # Yellowish for take selection
+        border_color = (255, 200, 50)
+    elif selection == 'split':
+        card_color = (200, 255, 200)  # Greenish for split selection
+        border_color = (100, 200, 100)
+    elif selection == 'picked':
+        # 选中但未选择动作时，给牌堆加一个明显的边框
+        pygame.draw.rect(surface, (255, 200, 50), 
+                        (x-6, y-6, width+12, height+12), 4, border_radius=12)
+    
+    # Draw card stack (multiple cards slightly offset)
+    for i in range(bucket):
+        offset = i * 3
+        card_rect = pygame.Rect(x + offset, y + offset, width, height)
+        pygame.draw.rect(surface, card_color, card_rect, border_radius=8)
+        pygame.draw.rect(surface, border_color, card_rect, 2, border_radius=8)
+    
+    # Card count background
+    max_offset = min(4, bucket-1) * 3
+    count_bg = pygame.Rect(x + width//2 - 25+max_offset, y + height//2 - 20+max_offset, 50, 40)
+    pygame.draw.rect(surface, (255, 245, 230), count_bg, border_radius=8)
+    pygame.draw.rect(surface, (180, 150, 110), count_bg, 2, border_radius=8)
+    
+    # Pile number background
+    pygame.draw.rect(surface, (50, 45, 40), 
+                     (x+10, y + height + 15, width-10, 30), border_radius=5)
+    pygame.draw.rect(surface, (180, 150, 110), 
+                     (x+10, y + height + 15, width-10, 30), 2, border_radius=5)
+    
+    # 绘制选中箭头（如果这个牌堆被选中）
+    if selection is not None:
+        arrow_y = y + height + 50  # 在牌堆编号下方
+        arrow_x = x + width // 2
+        
+        # 根据选择的操作确定箭头颜色
+        if selection == 'take':
+            arrow_color = (255, 200, 50)  # 黄色
+        elif selection == 'split':
+            arrow_color = (100, 200, 100)  # 绿色
+        else:
+            arrow_color = (255, 255, 0)    # 亮黄色（选中但未选择动作）
+        
+        # 绘制三角形箭头
+        points = [
+            (arrow_x, arrow_y - 15),           # 顶点
+            (arrow_x - 10, arrow_y ), # 左下角
+            (arrow_x + 10, arrow_y )  # 右下角
+        ]
+        pygame.draw.polygon(surface, arrow_color, points)
+
+
 # 内联Button类定义（避免导入错误）
 class Button:
     def __init__(self, x, y, width, height, text, font_manager, icon=None, tooltip=""):
@@ -23,7 +99,7 @@ class Button:
         self.corner_radius = 12
     
     def update_hover(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled and self.visible
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled and self.visible)
     
     def is_clicked(self, event):
         return (event.type == pygame.MOUSEBUTTONDOWN and 
@@ -86,14 +162,14 @@ class Button:
             ])
         elif self.icon == 'refresh':
             # Draw refresh icon as text
-            refresh_font = pygame.font.SysFont('Arial', 12, bold=True)
-            refresh_text = refresh_font.render("Refresh", True, icon_color)
+            refresh_font = resource_cache.get_sys_font('Arial', 12, bold=True)
+            refresh_text = text_cache.render(refresh_font, "Refresh", True, icon_color)
             refresh_rect = refresh_text.get_rect(center=self.rect.center)
             surface.blit(refresh_text, refresh_rect)
         elif self.icon == 'info':
             # Draw info icon (i)
-            info_font = pygame.font.SysFont('Arial', 18, bold=True)
-            info_text = info_font.render("i", True, icon_color)
+            info_font = resource_cache.get_sys_font('Arial', 18, bold=True)
+            info_text = text_cache.render(info_font, "i", True, icon_color)
             info_rect = info_text.get_rect(center=self.rect.center)
             surface.blit(info_text, info_rect)
         elif self.icon == 'settings':
@@ -129,8 +205,8 @@ class Button:
                 pygame.draw.line(surface, (255, 255, 150), (start_x, start_y), (end_x, end_y), 2)
             
             # Draw question mark inside
-            font = pygame.font.SysFont('Arial', 14, bold=True)
-            q_text = font.render("?", True, (50, 50, 50))
+            font = resource_cache.get_sys_font('Arial', 14, bold=True)
+            q_text = text_cache.render(font, "?", True, (50, 50, 50))
             text_rect = q_text.get_rect(center=center)
             surface.blit(q_text, text_rect)
     
@@ -138,12 +214,12 @@ class Button:
     def _draw_text(self, surface):
         """绘制按钮文本"""
         text_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        text_surface = self.font_manager.medium.render(self.text, True, text_color)
+        text_surface = text_cache.render(self.font_manager.medium, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         
         # 文本阴影
         if self.enabled:
-            shadow_surface = self.font_manager.medium.render(self.text, True, (0, 0, 0, 100))
+            shadow_surface = text_cache.render(self.font_manager.medium, self.text, True, (0, 0, 0, 100))
             shadow_rect = text_rect.move(2, 2)
             surface.blit(shadow_surface, shadow_rect)
         
@@ -153,7 +229,7 @@ class Button:
     def _draw_tooltip(self, surface):
         """绘制按钮工具提示（可选）"""
         if self.hovered and self.tooltip:
-            tooltip_surface = self.font_manager.small.render(self.tooltip, True, (220, 240, 255))
+            tooltip_surface = text_cache.render(self.font_manager.small, self.tooltip, True, (220, 240, 255))
             tooltip_rect = tooltip_surface.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
             
             # 绘制工具提示背景
@@ -183,30 +259,34 @@ class SplitCardsUI:
         self.hint_close_button = None
         self.hint_window_rect = None
     
-    def draw_background(self):
-        """Draw the background with table"""
+    def _build_table(self, surface):
+        """Dark background with the wooden table (static layer)"""
         # Draw dark background
-        self.screen.fill((30, 25, 20))
+        surface.fill((30, 25, 20))
         
         # Draw table shadow
         shadow_rect = self.table_rect.move(8, 8)
-        pygame.draw.rect(self.screen, (20, 15, 10), shadow_rect, border_radius=20)
+        pygame.draw.rect(surface, (20, 15, 10), shadow_rect, border_radius=20)
 
         # Draw wooden table
-        pygame.draw.rect(self.screen, self.table_color, self.table_rect, border_radius=20)
+        pygame.draw.rect(surface, self.table_color, self.table_rect, border_radius=20)
         
         # Draw table texture (wood grain)
         for y in range(self.table_rect.top, self.table_rect.bottom, 4):
-            pygame.draw.line(self.screen, 
+            pygame.draw.line(surface, 
                             (200, 170, 130), 
                             (self.table_rect.left, y), 
                             (self.table_rect.right, y), 
                             1)
         
         # Draw table edge
-        pygame.draw.rect(self.screen, (180, 150, 110), self.table_rect, 5, border_radius=20)
-      
-        
+        pygame.draw.rect(surface, (180, 150, 110), self.table_rect, 5, border_radius=20)
+    
+    def draw_background(self):
+        """Draw the background with table, rendered once and reused every frame"""
+        layer = background_layers.get(('split_cards_table', tuple(self.table_rect), self.table_color),
+                                      self.screen.get_size(), self._build_table)
+        self.screen.blit(layer, (0, 0))
     
     def draw_game_info(self, game_logic):
         """Draw game information panel"""
@@ -216,14 +296,14 @@ class SplitCardsUI:
         pygame.draw.line(self.screen, (180, 150, 110), (0, 120), (SCREEN_WIDTH, 120), 3)
         
         # Game title
-        title = self.font_manager.large.render("Split Cards", True, (240, 230, 220))
-        title_shadow = self.font_manager.large.render("Split Cards", True, (20, 15, 10))
+        title = text_cache.render(self.font_manager.large, "Split Cards", True, (240, 230, 220))
+        title_shadow = text_cache.render(self.font_manager.large, "Split Cards", True, (20, 15, 10))
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 2, 15))
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 13))
         
         # Game rules
         rules = "Take 1-{} cards from a pile, or split a pile into two non-empty piles".format(game_logic.max_take)
-        rules_text = self.font_manager.small.render(rules, True, (200, 190, 170))
+        rules_text = text_cache.render(self.font_manager.small, rules, True, (200, 190, 170))
         self.screen.blit(rules_text, (SCREEN_WIDTH//2 - rules_text.get_width()//2, 50))
         
         # Game mode and difficulty
@@ -233,7 +313,7 @@ class SplitCardsUI:
             difficulty_names = ["Easy", "Normal", "Hard", "Insane"]
             mode_text = f"Mode: Player vs AI - {difficulty_names[game_logic.difficulty-1]}"
         
-        mode_info = self.font_manager.small.render(mode_text, True, (180, 150, 110))
+        mode_info = text_cache.render(self.font_manager.small, mode_text, True, (180, 150, 110))
         self.screen.blit(mode_info, (20, 85))
         
         # Current player
@@ -244,7 +324,7 @@ class SplitCardsUI:
         }
         player_color = player_colors.get(game_logic.current_player, (240, 230, 220))
         
-        player_text = self.font_manager.medium.render(
+        player_text = text_cache.render(self.font_manager.medium,
             f"Current Player: {game_logic.current_player}", 
             True, player_color
         )
@@ -262,7 +342,7 @@ class SplitCardsUI:
             position_text = "Winning Position" if is_winning else "Losing Position"
             position_color = (100, 200, 100) if is_winning else (220, 100, 100)
             
-            position_display = self.font_manager.small.render(position_text, True, position_color)
+            position_display = text_cache.render(self.font_manager.small, position_text, True, position_color)
             position_bg = pygame.Rect(SCREEN_WIDTH//2 - position_display.get_width()//2 - 10, 92, 
                                position_display.get_width() + 20, position_display.get_height() + 6)
             pygame.draw.rect(self.screen, (50, 45, 40), position_bg, border_radius=8)
@@ -276,7 +356,7 @@ class SplitCardsUI:
         
         message_lines = wrap_text(game_logic.message, self.font_manager.medium, SCREEN_WIDTH - 100)
         for i, line in enumerate(message_lines):
-            message_text = self.font_manager.medium.render(line, True, message_color)
+            message_text = text_cache.render(self.font_manager.medium, line, True, message_color)
             if i == 0:
                 message_bg_width = message_text.get_width() + 30
                 message_bg = pygame.Rect(SCREEN_WIDTH//2 - message_bg_width//2, 119, 
@@ -291,6 +371,7 @@ class SplitCardsUI:
             return []
         
         pile_rects = []
+        batch = []
         num_piles = len(card_piles)
         
         # Calculate pile positions
@@ -308,7 +389,7 @@ class SplitCardsUI:
             for i, pile_count in enumerate(card_piles):
                 x = start_x + i * (pile_width + spacing)
                 pile_rect = self.draw_pile(x, y, pile_width, pile_height, pile_count, 
-                                          i, selected_index, selected_action)
+                                          i, selected_index, selected_action, batch)
                 pile_rects.append(pile_rect)
         else:
             # Two rows - 修复重叠问题
@@ -323,7 +404,7 @@ class SplitCardsUI:
             for i in range(row1_count):
                 x = start_x + i * (pile_width + spacing)
                 pile_rect = self.draw_pile(x, y1, pile_width, pile_height, 
-                                          card_piles[i], i, selected_index, selected_action)
+                                          card_piles[i], i, selected_index, selected_action, batch)
                 pile_rects.append(pile_rect)
             
             # Row 2
@@ -335,83 +416,44 @@ class SplitCardsUI:
                 x = start_x + i * (pile_width + spacing)
                 pile_idx = row1_count + i
                 pile_rect = self.draw_pile(x, y2, pile_width, pile_height, 
-                                          card_piles[pile_idx], pile_idx, selected_index, selected_action)
+                                          card_piles[pile_idx], pile_idx, selected_index, selected_action, batch)
                 pile_rects.append(pile_rect)
         
+        self.screen.blits(batch, doreturn=False)
         return pile_rects
     
-    def draw_pile(self, x, y, width, height, count, index, selected_index, selected_action):
-        """Draw a single card pile"""
-        # Pile background (card stack)
+    def draw_pile(self, x, y, width, height, count, index, selected_index, selected_action, batch=None):
+        """Draw a single card pile (queued on `batch` if given)"""
         pile_rect = pygame.Rect(x, y, width, height)
         
-        # Draw pile shadow
-        shadow_rect = pile_rect.move(2, 2)
-        pygame.draw.rect(self.screen, (150, 120, 90), shadow_rect, border_radius=10)
-        
-        # Draw cards in stack (visual effect)
-        card_color = (255, 245, 230)  # Off-white card color
-        border_color = (180, 150, 110)  # Wood-like border
-        
-        if index == selected_index:
-            if selected_action == 'take':
-                card_color = (255, 255, 200)  # Yellowish for take selection
-                border_color = (255, 200, 50)
-            elif selected_action == 'split':
-                card_color = (200, 255, 200)  # Greenish for split selection
-                border_color = (100, 200, 100)
-            else:
-                # 选中但未选择动作时，给牌堆加一个明显的边框
-                pygame.draw.rect(self.screen, (255, 200, 50), 
-                                (x-6, y-6, width+12, height+12), 4, border_radius=12)
+        if index != selected_index:
+            selection = None
+        elif selected_action in ('take', 'split'):
+            selection = selected_action
+        else:
+            selection = 'picked'  # 选中但未选择动作
         
-        # Draw card stack (multiple cards slightly offset)
-        for i in range(min(5, count)):
-            offset = i * 3
-            card_rect = pygame.Rect(x + offset, y + offset, width, height)
-            pygame.draw.rect(self.screen, card_color, card_rect, border_radius=8)
-            pygame.draw.rect(self.screen, border_color, card_rect, 2, border_radius=8)
+        # Shadow, card stack, count and number backgrounds and arrow: one atlas sprite per look
+        bucket = min(count, PILE_VISIBLE_CARDS)
+        items = [] if batch is None else batch
+        items.append(sprite_atlas.item(
+            ('sc_pile', width, height, bucket, selection),
+            (width + PILE_SPRITE_MARGIN + 12, height + PILE_SPRITE_MARGIN + 51),
+            lambda surface: _build_pile_sprite(surface, width, height, bucket, selection),
+            (x - PILE_SPRITE_MARGIN, y - PILE_SPRITE_MARGIN)))
         
         max_offset = min(4, count-1) * 3
         # Draw card count
-        count_text = self.font_manager.large.render(str(count), True, (40, 35, 30))
-        count_bg = pygame.Rect(x + width//2 - 25+max_offset, y + height//2 - 20+max_offset, 50, 40)
-        pygame.draw.rect(self.screen, (255, 245, 230), count_bg, border_radius=8)
-        pygame.draw.rect(self.screen, (180, 150, 110), count_bg, 2, border_radius=8)
-        self.screen.blit(count_text, (x + width//2 - count_text.get_width()//2+max_offset, 
-                                     y + height//2 - count_text.get_height()//2+max_offset))
-        
-        # Draw pile number background
-        pygame.draw.rect(self.screen, (50, 45, 40), 
-                         (x+10, y + height + 15, width-10, 30), border_radius=5)
-        pygame.draw.rect(self.screen, (180, 150, 110), 
-                         (x+10, y + height + 15, width-10, 30), 2, border_radius=5)
-
-        # Draw pile number
-        pile_num = self.font_manager.small.render(f"Pile {index + 1}", True, (255, 255, 255))
-        self.screen.blit(pile_num, (x + width//2 - pile_num.get_width()//2+5, y + height + 18))
+        count_text = text_cache.render(self.font_manager.large, str(count), True, (40, 35, 30))
+        items.append((count_text, (x + width//2 - count_text.get_width()//2+max_offset, 
+                                   y + height//2 - count_text.get_height()//2+max_offset)))
         
-        # 绘制选中箭头（如果这个牌堆被选中）
-        if index == selected_index:
-            arrow_y = y + height + 50  # 在牌堆编号下方
-            arrow_x = x + width // 2
-            
-            # 根据选择的操作确定箭头颜色
-            if selected_action == 'take':
-                arrow_color = (255, 200, 50)  # 黄色
-            elif selected_action == 'split':
-                arrow_color = (100, 200, 100)  # 绿色
-            else:
-                arrow_color = (255, 255, 0)    # 亮黄色（选中但未选择动作）
-            
-            # 绘制三角形箭头
-            points = [
-                (arrow_x, arrow_y - 15),           # 顶点
-                (arrow_x - 10, arrow_y ), # 左下角
-                (arrow_x + 10, arrow_y )  # 右下角
-            ]
-            pygame.draw.polygon(self.screen, arrow_color, points)
+        # Draw pile number
+        pile_num = text_cache.render(self.font_manager.small, f"Pile {index + 1}", True, (255, 255, 255))
+        items.append((pile_num, (x + width//2 - pile_num.get_width()//2+5, y + height + 18)))
         
+        if batch is None:
+            self.screen.blits(items, doreturn=False)
         return pile_rect
     
     def draw_control_panel(self, game_logic, buttons):
@@ -437,7 +479,7 @@ class SplitCardsUI:
             if (game_logic.selected_pile_index is not None and 
                 game_logic.selected_action is None):
                 
-                action_text = self.font_manager.medium.render("Select Action:", True, (240, 230, 220))
+                action_text = text_cache.render(self.font_manager.medium, "Select Action:", True, (240, 230, 220))
                 self.screen.blit(action_text, (control_x, control_y))
         
         # 新增：创建或更新输入框
@@ -466,7 +508,7 @@ class SplitCardsUI:
             
             # 如果输入框激活，显示提示
             if self.input_box.active:
-                hint_text = self.font_manager.small.render("输入数字，回车确认，ESC取消", True, (200, 190, 170))
+                hint_text = text_cache.render(self.font_manager.small, "输入数字，回车确认，ESC取消", True, (200, 190, 170))
                 self.screen.blit(hint_text, (control_x + 150, control_y + 50))
         
         return control_x, control_y
@@ -542,7 +584,7 @@ class SplitCardsUI:
         pygame.draw.rect(self.screen, (180, 150, 110), self.hint_window_rect, 2, border_radius=10)
         
         # 绘制窗口标题
-        title_text = self.font_manager.medium.render("Winning Hint", True, (200, 180, 110))
+        title_text = text_cache.render(self.font_manager.medium, "Winning Hint", True, (200, 180, 110))
         title_rect = title_text.get_rect(center=(window_x + window_width//2, window_y + 25))
         self.screen.blit(title_text, title_rect)
         
@@ -571,15 +613,15 @@ class SplitCardsUI:
                     self.hovered = False
                 
                 def update_hover(self, mouse_pos):
-                    self.hovered = self.rect.collidepoint(mouse_pos)
+                    render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos))
                 
                 def draw(self, screen):
                     color = (220, 100, 100) if self.hovered else (180, 80, 80)  # 使用红色系
                     pygame.draw.rect(screen, color, self.rect, border_radius=4)
                     pygame.draw.rect(screen, (255, 200, 200), self.rect, 1, border_radius=4)
                     
-                    font = pygame.font.SysFont('Arial', 20, bold=True)
-                    text_surface = font.render(self.text, True, (255, 255, 255))
+                    font = resource_cache.get_sys_font('Arial', 20, bold=True)
+                    text_surface = text_cache.render(font, self.text, True, (255, 255, 255))
                     text_rect = text_surface.get_rect(center=self.rect.center)
                     screen.blit(text_surface, text_rect)
             
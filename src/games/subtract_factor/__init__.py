@@ -1,3 +1,9 @@
-from .game import SubtractFactorGame
+from utils.lazy_imports import install
+
+# The game classes need pygame; importing them on first access (PEP 562)
+# keeps the logic modules usable headless
+install(globals(), {
+    'SubtractFactorGame': '.game',
+})
 
 __all__ = ['SubtractFactorGame']
\ No newline at end of file
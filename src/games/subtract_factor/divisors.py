@@ -0,0 +1,86 @@
+"""
+Subtract Factor Divisors - smallest-prime-factor sieve
+"""
+
+from array import array
+from typing import List
+
+# Initial sieve ceiling; covers every PvE/PvP starting value with room to spare
+DEFAULT_SIEVE_LIMIT = 1 << 12
+
+
+class DivisorSieve:
+    """
+    Smallest prime factor of every integer below `limit`, stored in a compact
+    array. Divisors are read off the factorisation instead of trial division,
+    and the sieve doubles its ceiling on demand when a larger number is asked for.
+    """
+
+    def __init__(self, limit: int = DEFAULT_SIEVE_LIMIT):
+        self.limit = 0
+        self.spf = array('I')
+        self.ensure(limit)
+
+    def ensure(self, number: int):
+        """Grow the sieve so that `number` is covered"""
+        if number < self.limit:
+            return
+        limit = max(self.limit, 2)
+        while limit <= number:
+            limit *= 2
+
+        is_prime = bytearray([1]) * limit
+        is_prime[0:2] = b'\x00\x00'
+        p = 2
+        while p * p < limit:
+            if is_prime[p]:
+                is_prime[p*p::p] = bytes(len(range(p*p, limit, p)))
+            p += 1
+
+        spf = array('I', range(limit))
+        # Largest primes first so that the smallest prime factor is written last
+        for p in range(p, 1, -1):
+            if is_prime[p]:
+                spf[p*p::p] = array('I', [p]) * len(range(p*p, limit, p))
+
+        self.spf = spf
+        self.limit = limit
+
+    def factorize(self, number: int) -> List[tuple]:
+        """Prime factorisation as (prime, exponent) pairs"""
+        self.ensure(number)
+        spf = self.spf
+        factors = []
+        while number > 1:
+            p = spf[number]
+            exponent = 0
+            while number % p == 0:
+                number //= p
+                exponent += 1
+            factors.append((p, exponent))
+        return factors
+
+    def divisors(self, number: int) -> List[int]:
+        """All divisors of `number` (including itself) in ascending order"""
+        if number < 1:
+            return []
+        divisors = [1]
+        for p, exponent in self.factorize(number):
+            step = []
+            power = 1
+            for _ in range(exponent):
+                power *= p
+                step.extend(d * power for d in divisors)
+            divisors.extend(step)
+        divisors.sort()
+        return divisors
+
+    def proper_divisors(self, number: int) -> List[int]:
+        """All divisors smaller than `number` in ascending order"""
+        if number <= 1:
+            return []
+        return self.divisors(number)[:-1]
+
+
+# Global sieve shared by SubtractFactorLogic and SubtractFactorAutoPlayer
+divisor_sieve = DivisorSieve()
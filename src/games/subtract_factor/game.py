@@ -11,6 +11,8 @@ from ui.components.sidebar import Sidebar
 from utils.constants import CARD_GAME_FPS, SCREEN_WIDTH, SCREEN_HEIGHT, ACCENT_COLOR, TEXT_COLOR
 from utils.key_repeat import KeyRepeatManager  
 from utils.config_manager import config_manager  # 新增导入
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class SubtractFactorInputHandler:
     """Handles input for Subtract Factor game"""
@@ -316,6 +318,7 @@ Good luck and have fun!
         self.control_buttons = self.ui.create_buttons()
         self.factor_buttons = []
         self.scroll_buttons = []
+        self.widget_state = None  # 下一帧重建因数和滚动按钮
         self.ai_timer = 0
     
     def handle_events(self):
@@ -560,16 +563,20 @@ Good luck and have fun!
         # 更新按键重复状态
         self.input_handler.update_key_repeat()
 
-        # Update factor buttons based on current valid factors
-        self.factor_buttons = self.ui.create_factor_buttons(
-            self.logic.valid_factors, self.logic.selected_factor
-        )
-        
-        # Update scroll buttons
-        self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.valid_factors))
-        
-        # Set button enabled states
-        self.update_button_states()
+        # 控件只在局面、滚动、选择或提示设置变化时重建
+        if self.widgets_changed(self.logic.version, self.ui.scroll_offset,
+                                self.logic.selected_factor,
+                                self.config_manager.get_user_preferences().winning_hints):
+            # Update factor buttons based on current valid factors
+            self.factor_buttons = self.ui.create_factor_buttons(
+                self.logic.valid_factors, self.logic.selected_factor
+            )
+            
+            # Update scroll buttons
+            self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.valid_factors))
+            
+            # Set button enabled states
+            self.update_button_states()
         
         # AI's turn (only in PvE mode)
         if (self.logic.game_mode == "PVE" and 
@@ -630,7 +637,7 @@ Good luck and have fun!
         # 如果显示说明，绘制说明页面
         if self.showing_instructions:
             self.draw_instructions()
-            pygame.display.flip()
+            render_optimizer.present()
             return
         
         try:
@@ -665,7 +672,7 @@ Good luck and have fun!
                     hints.append("Press H or click on the hint button (💡) for winning hints")
                 
                 for i, hint in enumerate(hints):
-                    hint_text = self.font_manager.small.render(hint, True, (150, 170, 190))
+                    hint_text = text_cache.render(self.font_manager.small, hint, True, (150, 170, 190))
                     self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 20))
             else:
                 # Draw game over screen
@@ -680,7 +687,7 @@ Good luck and have fun!
             # 最后绘制侧边栏，使其在最上层
             self.sidebar.draw()
             
-            pygame.display.flip()
+            render_optimizer.present()
             
         except Exception as e:
             print(f"Error in draw: {e}")
@@ -705,12 +712,12 @@ Good luck and have fun!
         pygame.draw.rect(self.screen, ACCENT_COLOR, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Subtract Factor Game - Instructions", True, TEXT_COLOR)
+        title = text_cache.render(self.font_manager.large, "Subtract Factor Game - Instructions", True, TEXT_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, panel_y + 40))
         self.screen.blit(title, title_rect)
         
         # Close hint
-        close_hint = self.font_manager.small.render("Click anywhere or press ESC/I to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Click anywhere or press ESC/I to close", True, (180, 200, 220))
         close_rect = close_hint.get_rect(center=(SCREEN_WIDTH//2, panel_y + panel_height - 30))
         self.screen.blit(close_hint, close_rect)
         
@@ -758,7 +765,7 @@ Good luck and have fun!
             # Draw each line
             for text_line in lines:
                 if y_pos < panel_y + panel_height - 60:
-                    text_surface = font.render(text_line, True, color)
+                    text_surface = text_cache.render(font, text_line, True, color)
                     text_rect = text_surface.get_rect(left=panel_x + 40, top=y_pos)
                     self.screen.blit(text_surface, text_rect)
                     y_pos += font.get_linesize() + 2
@@ -1,6 +1,9 @@
 import random
 import math
 from utils.constants import *
+from games.subtract_factor.divisors import divisor_sieve
+from games.subtract_factor.solver import subtract_factor_solver
+from utils.replay_recorder import record_ai_turn, record_game_start, record_move
 
 class SubtractFactorAutoPlayer:
     """Handles AI logic for Subtract Factor game"""
@@ -19,36 +22,17 @@ class SubtractFactorAutoPlayer:
         if number <= 1 or number <= self.threshold:
             return []
         
-        factors = set()
-        i = 1
-        while i * i <= number:
-            if number % i == 0:
-                if i < number and (number - i) >= self.threshold:
-                    factors.add(i)
-                other_factor = number // i
-                if other_factor < number and other_factor != i and (number - other_factor) >= self.threshold:
-                    factors.add(other_factor)
-            i += 1
-        
-        return sorted(factors)
+        # 因子升序排列，移动后的值随之递减
+        factors = []
+        for factor in divisor_sieve.proper_divisors(number):
+            if number - factor < self.threshold:
+                break
+            factors.append(factor)
+        return factors
     
     def _get_all_factors(self, number):
         """获取所有真因子（不检查阈值） - 用于fallback情况"""
-        if number <= 1:
-            return []
-        
-        factors = []
-        i = 1
-        while i * i <= number:
-            if number % i == 0:
-                if i < number:
-                    factors.append(i)
-                other_factor = number // i
-                if other_factor != i and other_factor < number:
-                    factors.append(other_factor)
-            i += 1
-        
-        return sorted(factors)
+        return divisor_sieve.proper_divisors(number)
     
     def find_winning_move(self):
         """Find a move that leaves opponent in losing position"""
@@ -87,6 +71,9 @@ class SubtractFactorAutoPlayer:
         # 对于高难度，更频繁使用必胜移动
         if winning_move and not self.this_turn_random(difficulty):
             return winning_move
+        elif not winning_move and difficulty >= 4:
+            # 必败局面：最佳防守，留给对手最少的必胜走法并尽量拖长对局
+            return subtract_factor_solver.analyze_position(self.current_value, self.threshold).best().move
         else:
             # 随机选择，但根据难度调整策略
             if difficulty >= 3:  # Hard and Insane
@@ -186,55 +173,17 @@ class SubtractFactorLogic:
         self.winning_positions = []
         self.valid_factors = []
         self.winning_hints_enabled = False  # 新增：提示功能开关
+        self.version = 0  # 每次局面变化加一，UI据此判断是否需要重建控件
     
     def calculate_winning_positions(self):
         """Calculate winning positions using dynamic programming"""
-        n = self.initial_n
-        k = self.threshold_k
-        
-        # 增加数组大小以避免索引越界
-        self.winning_positions = [False] * (n + 100)
-        
-        # 设置基础情况
-        for i in range(k):
-            if i < len(self.winning_positions):
-                self.winning_positions[i] = False
-
-        # 从阈值开始计算
-        for m in range(k, n + 1):
-            if m >= len(self.winning_positions):
-                continue
-                
-            found_winning_move = False
-            # Get all valid factors
-            factors = self._get_factors_optimized(m)
-            
-            for factor in factors:
-                new_val = m - factor
-                if new_val < k:
-                    continue
-                if new_val < len(self.winning_positions) and not self.winning_positions[new_val]:
-                    found_winning_move = True
-                    break
-            
-            self.winning_positions[m] = found_winning_move
+        # 同一阈值的结果表在重试、重开和多个游戏实例之间共享，按需向上扩展
+        self.winning_positions = subtract_factor_solver.table(self.threshold_k)
+        self.winning_positions.ensure(self.initial_n)
     
     def _get_factors_optimized(self, n):
         """Get all proper factors of n (factors < n)"""
-        if n <= 1:
-            return []
-        
-        factors = set()
-        i = 1
-        while i * i <= n:
-            if n % i == 0:
-                if i < n:
-                    factors.add(i)
-                if n // i < n and n // i != i:
-                    factors.add(n // i)
-            i += 1
-        
-        return sorted(factors)
+        return divisor_sieve.proper_divisors(n)
     
     def update_valid_factors(self):
         """Update list of valid factors for current value - 修复版本"""
@@ -263,38 +212,24 @@ class SubtractFactorLogic:
     
     def _calculate_winning_position(self, value):
         """实时计算单个位置的胜负状态"""
-        if value < self.threshold_k:
-            return False
-            
-        factors = self._get_factors_optimized(value)
-        # 只考虑不会导致立即失败的因子
-        valid_factors = [f for f in factors if (value - f) >= self.threshold_k]
-        
-        for factor in valid_factors:
-            new_val = value - factor
-            if new_val < self.threshold_k:
-                continue
-            if not self.judge_win_single(new_val):
-                return True
-        return False
+        return self.judge_win_single(value)
     
     def judge_win_single(self, value):
-        """判断单个位置的胜负状态（递归版本）"""
-        if value < self.threshold_k:
-            return False
-            
-        factors = self._get_factors_optimized(value)
-        # 只考虑不会导致立即失败的因子
-        valid_factors = [f for f in factors if (value - f) >= self.threshold_k]
-        
-        for factor in valid_factors:
-            new_val = value - factor
-            if new_val < self.threshold_k:
-                continue
-            if not self.judge_win_single(new_val):
-                return True
-        return False
+        """判断单个位置的胜负状态（查共享结果表，按需从低到高迭代扩展，不递归）"""
+        return subtract_factor_solver.is_winning(value, self.threshold_k)
+    
+    def _threshold_range(self, n):
+        """阈值k的取值范围，确保游戏有足够的回合"""
+        min_k = max(10, int(math.sqrt(n) * 1.5))
+        max_k = min(n - 20, int(n * 0.7))
+        
+        # 确保min_k不大于max_k
+        if min_k > max_k:
+            min_k = max(10, n // 3)
+            max_k = min(n - 10, n // 2)
+        return min_k, max_k
     
+    @record_game_start("subtract_factor")
     def initialize_game(self, game_mode, difficulty=None, winning_hints=False):  # 修改：添加winning_hints参数
         """Initialize a new game - ensure player starts in winning position in PvE"""
         self.game_mode = game_mode
@@ -315,50 +250,29 @@ class SubtractFactorLogic:
             }
             min_n, max_n = difficulty_ranges.get(difficulty, (150, 250))
         
-        max_attempts = 100
-        attempt_count = 0
-        
-        while attempt_count < max_attempts:
-            attempt_count += 1
-            self.initial_n = random.randint(min_n, max_n)
-            
-            # 调整阈值范围，确保游戏有足够的回合
-            min_k = max(10, int(math.sqrt(self.initial_n) * 1.5))
-            max_k = min(self.initial_n - 20, int(self.initial_n * 0.7))
-            
-            # 确保min_k不大于max_k
-            if min_k > max_k:
-                min_k = max(10, self.initial_n // 3)
-                max_k = min(self.initial_n - 10, self.initial_n // 2)
-            
-            self.threshold_k = random.randint(min_k, max_k)
-            
-            self.current_value = self.initial_n
-            self.selected_factor = 1
-            self.game_over = False
-            self.winner = None
-            self.current_player = "Player 1"
-            
-            # 计算必胜位置
-            self.calculate_winning_positions()
-            self.update_valid_factors()
-            
-            if self.game_mode == "PVE":
-                # 检查是否为玩家胜利局面
-                is_winning_position = self.judge_win()
-                if is_winning_position and self.valid_factors:
-                    break
-            else:
-                if self.valid_factors:
-                    break
+        if self.game_mode == "PVE":
+            # 直接从结果表中抽取一个玩家必胜的(n, k)，无需反复试错
+            pair = subtract_factor_solver.sample_winning_pair(min_n, max_n, self._threshold_range)
+        else:
+            # PvP模式：k <= n - 10，减去因子1总是合法的
+            n = random.randint(min_n, max_n)
+            pair = (n, random.randint(*self._threshold_range(n)))
         
         # 如果没找到合适的配置，使用一个安全的默认值
-        if attempt_count >= max_attempts:
-            self.initial_n = random.randint(200, 300)
-            self.threshold_k = random.randint(50, 100)
-            self.current_value = self.initial_n
-            self.calculate_winning_positions()
-            self.update_valid_factors()
+        if pair is None:
+            pair = (random.randint(200, 300), random.randint(50, 100))
+        
+        self.initial_n, self.threshold_k = pair
+        self.current_value = self.initial_n
+        self.selected_factor = 1
+        self.game_over = False
+        self.winner = None
+        self.current_player = "Player 1"
+        
+        # 计算必胜位置
+        self.calculate_winning_positions()
+        self.update_valid_factors()
+        self.version += 1
         
         if self.game_mode == "PVE":
             self.auto_player = SubtractFactorAutoPlayer(
@@ -379,6 +293,7 @@ class SubtractFactorLogic:
         if self.winning_hints_enabled:
             self.message += " [Winning Hints: ON]"
     
+    @record_move(lambda logic, factor: factor)
     def make_move(self, factor):
         """Execute a move and return success status"""
         # 验证因子是否有效
@@ -387,6 +302,7 @@ class SubtractFactorLogic:
             return False
         
         new_value = self.current_value - factor
+        self.version += 1
         
         # 检查是否会导致立即失败（理论上不应该发生，因为valid_factors已经过滤过了）
         if new_value < self.threshold_k:
@@ -440,6 +356,7 @@ class SubtractFactorLogic:
                 self.current_player = "Player 1"
                 self.message += f" {self.current_player}'s turn."
     
+    @record_ai_turn
     def ai_make_move(self):
         """Let AI make a move (only in PvE mode)"""
         if self.game_mode == "PVE" and self.current_player == "AI" and not self.game_over:
@@ -503,75 +420,35 @@ class SubtractFactorLogic:
         # 确定当前局面类型
         is_winning_position = self.judge_win()
         
+        # 整个局面分析一次：每个因子的胜负、对手必胜应对数和剩余步数
+        analysis = subtract_factor_solver.analyze_position(self.current_value, self.threshold_k)
+        best = analysis.best()
+        new_value = self.current_value - best.move
+        
         if is_winning_position:
-            # 必胜局面 - 寻找最佳必胜移动
-            best_factor = None
-            best_score = -1
-            best_desc = ""
-            moves_analysis = []
-            
-            for factor in available_factors:
-                if self.auto_player:
-                    score, desc = self.auto_player.analyze_move(
-                        self.current_value, self.threshold_k, factor
-                    )
-                    moves_analysis.append((factor, score, desc))
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_factor = factor
-                        best_desc = desc
+            # 必胜局面 - 最快取胜的必胜移动
+            hint = f"WINNING POSITION\n"
+            hint += f"Current position is WINNING!\n\n"
+            hint += f"Recommended move: Subtract {best.move}\n"
+            hint += f"New value: {new_value}\n"
+            hint += f"Description: Winning move - leaves opponent in losing position\n"
+            hint += f"Winning moves: {len(analysis.winning_moves)} of {len(analysis.moves)}\n"
+            if analysis.depth is not None:
+                hint += f"With perfect play you win in {analysis.depth} more moves.\n"
             
-            if best_factor is not None:
-                hint = f"WINNING POSITION\n"
-                hint += f"Current position is WINNING!\n\n"
-                hint += f"Recommended move: Subtract {best_factor}\n"
-                hint += f"New value: {self.current_value - best_factor}\n"
-                hint += f"Score: {best_score}/100\n"
-                hint += f"Description: {best_desc}\n\n"
-                
-                
-                hint += "\nStrategy: Choose moves that leave opponent in losing position."
-            else:
-                hint = "WINNING POSITION\n"
-                hint += "Current position is winning, but no obvious best move found.\n"
-                hint += f"Available factors: {available_factors}\n"
-                hint += "Suggest selecting a random valid factor."
+            hint += "\nStrategy: Choose moves that leave opponent in losing position."
         else:
-            # 必败局面 - 寻找最不坏的移动
-            best_factor = None
-            best_score = -1
-            best_desc = ""
-            moves_analysis = []
-            
-            for factor in available_factors:
-                if self.auto_player:
-                    score, desc = self.auto_player.analyze_move(
-                        self.current_value, self.threshold_k, factor
-                    )
-                    moves_analysis.append((factor, score, desc))
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_factor = factor
-                        best_desc = desc
+            # 必败局面 - 对手必胜应对最少、拖得最久的移动
+            hint = f"LOSING POSITION\n"
+            hint += f"Current position is LOSING. There is no guaranteed winning strategy.\n"
+            hint += f"You need opponent to make a mistake.\n\n"
+            hint += f"Recommended move: Subtract {best.move}\n"
+            hint += f"New value: {new_value}\n"
+            hint += f"Description: Opponent has {best.opponent_winning_replies} winning responses\n"
+            if analysis.depth is not None:
+                hint += f"With perfect play the game lasts {analysis.depth} more moves.\n"
             
-            if best_factor is not None:
-                hint = f"LOSING POSITION\n"
-                hint += f"Current position is LOSING. There is no guaranteed winning strategy.\n"
-                hint += f"You need opponent to make a mistake.\n\n"
-                hint += f"Recommended move: Subtract {best_factor}\n"
-                hint += f"New value: {self.current_value - best_factor}\n"
-                hint += f"Score: {best_score}/100\n"
-                hint += f"Description: {best_desc}\n\n"
-                
-                
-                hint += "\nStrategy: Choose the move with highest probability of opponent error, and hope for a mistake."
-            else:
-                hint = "LOSING POSITION\n"
-                hint += "Current position is losing.\n"
-                hint += f"Available factors: {available_factors}\n"
-                hint += "Suggest selecting a random valid factor and hope opponent makes a mistake."
+            hint += "\nStrategy: Choose the move with highest probability of opponent error, and hope for a mistake."
         
         # 添加游戏状态信息
         hint += f"\n\nCURRENT GAME STATE\n"
@@ -608,6 +485,9 @@ class SubtractFactorLogic:
         available_factors = self.valid_factors
         analysis += f"• Available factors: {available_factors}\n"
         analysis += f"• Number of factors: {len(available_factors)}\n"
+        position = subtract_factor_solver.analyze_position(self.current_value, self.threshold_k)
+        analysis += f"• Winning moves: {len(position.winning_moves)}\n"
+        analysis += f"• Moves left with perfect play: {position.depth}\n"
         
         # 策略建议
         if self.judge_win():
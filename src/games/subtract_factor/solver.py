@@ -0,0 +1,244 @@
+"""
+Subtract Factor Outcome Tables
+"""
+
+import os
+import random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from games.subtract_factor.divisors import divisor_sieve
+from utils.bounded_cache import BoundedCache
+from utils.opening_book import get_book
+from utils.position_analysis import DepthSearch, MoveAnalysis, PositionAnalysis, analysis_cache
+from utils.position_sampler import PositionIndex
+
+# Number of per-threshold tables kept alive; least recently used ones are dropped
+TABLE_CACHE_SIZE = 64
+# Number of start-position indexes (one per n range) kept alive
+INDEX_CACHE_SIZE = 8
+
+# Opening book: grouped by n, one record per threshold k with the smallest
+# winning factor (0 for losing pairs)
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '..', '..', '..', 'assets', 'tables', 'subtract_factor_book.bin')
+BOOK_FORMAT = '<HH'
+
+# Values expanded per depth-to-end search (a game visits at most n - k values)
+DEPTH_SEARCH_NODES = 1 << 16
+
+
+def valid_factors(value: int, threshold: int) -> List[int]:
+    """Proper divisors that keep the value at or above the threshold, ascending"""
+    factors = []
+    for d in divisor_sieve.proper_divisors(value):
+        if value - d < threshold:
+            break
+        factors.append(d)
+    return factors
+
+
+def _value_children(key):
+    """(value, k) pairs one move away"""
+    value, threshold = key
+    return [(value - d, threshold) for d in valid_factors(value, threshold)]
+
+
+class OutcomeTable:
+    """
+    Win/loss of every value for one threshold k, extended lazily.
+
+    Values below k are losses (no move may go below the threshold). The table
+    is filled forward: once m is known to be losing, m + d is winning for every
+    divisor d of m, since subtracting d from m + d lands on m. Indexing and
+    len() behave like the winning_positions list the AutoPlayer expects.
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold = max(threshold, 0)
+        self.winning = bytearray()
+
+    def __len__(self):
+        return len(self.winning)
+
+    def __getitem__(self, value):
+        return bool(self.winning[value])
+
+    def ensure(self, value: int):
+        """Extend the table so that `value` is covered (at least doubling its size)"""
+        old = len(self.winning)
+        if value < old:
+            return
+        limit = max(value + 1, 2 * old)
+        divisor_sieve.ensure(limit)
+        divisors = divisor_sieve.divisors
+        winning = self.winning
+        winning.extend(bytes(limit - old))
+        k = self.threshold
+
+        # Settled losing values can still reach the new range with a large
+        # divisor; m + d <= 2m, so only the upper half needs another pass
+        for m in range(max(k, (old + 1) // 2), old):
+            if winning[m]:
+                continue
+            for d in reversed(divisors(m)):
+                if m + d < old:
+                    break
+                if m + d < limit:
+                    winning[m + d] = 1
+
+        for m in range(max(k, old), limit):
+            if winning[m]:
+                continue
+            for d in divisors(m):
+                if m + d >= limit:
+                    break
+                winning[m + d] = 1
+
+    def is_winning(self, value: int) -> bool:
+        """True if the player to move from `value` can force a win"""
+        if value < self.threshold:
+            return False
+        self.ensure(value)
+        return bool(self.winning[value])
+
+    def winning_values(self, low: int, high: int) -> List[int]:
+        """All first-player wins in [low, high]"""
+        self.ensure(high)
+        low = max(low, self.threshold)
+        winning = self.winning
+        return [value for value in range(low, high + 1) if winning[value]]
+
+
+class SubtractFactorSolver:
+    """Shares one lazily extended OutcomeTable per threshold across games and retries"""
+
+    def __init__(self, max_tables: int = TABLE_CACHE_SIZE):
+        self.tables = BoundedCache(max_tables)
+        self.start_indexes = BoundedCache(INDEX_CACHE_SIZE)
+        self.analyses = analysis_cache()
+        self.depths = DepthSearch(_value_children, max_nodes=DEPTH_SEARCH_NODES)
+
+    def table(self, threshold: int) -> OutcomeTable:
+        """Outcome table for threshold k"""
+        table = self.tables.get(threshold)
+        if table is None:
+            table = OutcomeTable(threshold)
+            self.tables.put(threshold, table)
+        return table
+
+    def is_winning(self, value: int, threshold: int) -> bool:
+        """True if the player to move wins from `value` with threshold k"""
+        return self.table(threshold).is_winning(value)
+
+    def winning_pairs(self, min_n: int, max_n: int,
+                      threshold_range: Callable[[int], Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+        """Every first-player win (n, k) with min_n <= n <= max_n and k in threshold_range(n)"""
+        ranges = {n: threshold_range(n) for n in range(min_n, max_n + 1)}
+        min_k = min(low for low, _ in ranges.values())
+        max_k = max(high for _, high in ranges.values())
+        for k in range(min_k, max_k + 1):
+            for n in self.table(k).winning_values(min_n, max_n):
+                low, high = ranges[n]
+                if low <= k <= high:
+                    yield n, k
+
+    def start_index(self, min_n: int, max_n: int,
+                    threshold_range: Callable[[int], Tuple[int, int]]) -> PositionIndex:
+        """
+        Every (n, k) with min_n <= n <= max_n and k in threshold_range(n),
+        indexed by outcome. Pairs are enumerated threshold by threshold so each
+        outcome table is built once.
+        """
+        key = (min_n, max_n, getattr(threshold_range, '__func__', threshold_range))
+        index = self.start_indexes.get(key)
+        if index is not None:
+            return index
+
+        ranges = {n: threshold_range(n) for n in range(min_n, max_n + 1)}
+        index = PositionIndex()
+        if ranges:
+            for k in range(min(low for low, _ in ranges.values()), max(high for _, high in ranges.values()) + 1):
+                table = self.table(k)
+                for n, (low, high) in ranges.items():
+                    if low <= k <= high:
+                        index.add(n, (n, k), table.is_winning(n))
+        self.start_indexes.put(key, index)
+        return index
+
+    def sample_winning_pair(self, min_n: int, max_n: int,
+                            threshold_range: Callable[[int], Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """
+        Random first-player win (n, k): n uniform over the values in range with
+        a winning threshold, then k uniform among those. Read from the opening
+        book when it covers the range, otherwise drawn from the outcome index.
+        Returns None if none exists.
+        """
+        book = get_book(BOOK_PATH)
+        if book is not None:
+            values = [n for n in range(min_n, max_n + 1) if book.winning_count(n)]
+            hit = book.random_winning([random.choice(values)]) if values else None
+            if hit is not None:
+                n, (k, _) = hit
+                low, high = threshold_range(n)
+                if low <= k <= high:
+                    return n, k
+
+        hit = self.start_index(min_n, max_n, threshold_range).sample_by_key(winning=True)
+        return hit[1] if hit else None
+
+    def winning_factor(self, value: int, threshold: int) -> Optional[int]:
+        """Smallest factor that leaves the opponent a losing value, or None"""
+        for d in divisor_sieve.proper_divisors(value):
+            if value - d >= threshold and not self.is_winning(value - d, threshold):
+                return d
+        return None
+
+    def depth_to_end(self, value: int, threshold: int) -> Optional[int]:
+        """Moves left under perfect play"""
+        return self.depths.depth((value, threshold))
+
+    def analyze_position(self, value: int, threshold: int) -> PositionAnalysis:
+        """Every valid factor, with the opponent's winning replies and the depth left"""
+        key = (value, threshold)
+        analysis = self.analyses.get(key)
+        if analysis is not None:
+            return analysis
+
+        table = self.table(threshold)
+        factors = valid_factors(value, threshold)
+        # One node budget for the whole position, not one per child
+        depths = self.depths.depths((value - d, threshold) for d in factors)
+        results = []
+        for d, depth in zip(factors, depths):
+            child = value - d
+            replies = sum(1 for e in valid_factors(child, threshold)
+                          if not table.is_winning(child - e))
+            results.append(MoveAnalysis(d, replies == 0, replies, depth))
+        analysis = PositionAnalysis(tuple(results))
+        self.analyses.put(key, analysis)
+        return analysis
+
+    def build_book(self, min_n: int, max_n: int,
+                   threshold_range: Callable[[int], Tuple[int, int]]) -> Dict[int, tuple]:
+        """Book groups: every (n, k) with min_n <= n <= max_n and k in threshold_range(n)"""
+        groups = {}
+        for n in range(min_n, max_n + 1):
+            low, high = threshold_range(n)
+            winning, losing = [], []
+            for k in range(low, high + 1):
+                factor = self.winning_factor(n, k)
+                if factor is None:
+                    losing.append((k, 0))
+                else:
+                    winning.append((k, factor))
+            groups[n] = (winning, losing)
+        return groups
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get outcome table statistics"""
+        stats = self.tables.get_stats()
+        stats['table_values'] = sum(len(table) for table in self.tables.values())
+        return stats
+
+
+# Global solver instance shared by every SubtractFactorLogic
+subtract_factor_solver = SubtractFactorSolver()
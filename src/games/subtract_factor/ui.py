@@ -4,7 +4,11 @@ Subtract Factor Game UI Components
 
 import pygame
 from utils.constants import *
+from utils.background_layers import background_layers
 from utils.helpers import wrap_text
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.optimization_tools import render_optimizer
 from ui.components.scrollables import ScrollablePanel  # 新增导入
 
 class SubtractFactorUI:
@@ -29,12 +33,8 @@ class SubtractFactorUI:
     
     def draw_background(self):
         """Draw the background with gradient effect"""
-        self.screen.fill(BACKGROUND_COLOR)
-        
-        for x in range(0, SCREEN_WIDTH, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (0, y), (SCREEN_WIDTH, y), 1)
+        # 网格背景为静态层，只在尺寸或主题变化时重新渲染
+        self.screen.blit(background_layers.grid(self.screen.get_size(), 40, (35, 45, 55), BACKGROUND_COLOR), (0, 0))
     
     def draw_game_info(self, game_logic):
         """Draw game information panel"""
@@ -44,8 +44,8 @@ class SubtractFactorUI:
         pygame.draw.line(self.screen, ACCENT_COLOR, (0, 180), (SCREEN_WIDTH, 180), 3)
         
         # Game title with shadow
-        title = self.font_manager.large.render("Subtract Factor Game", True, TEXT_COLOR)
-        title_shadow = self.font_manager.large.render("Subtract Factor Game", True, SHADOW_COLOR)
+        title = text_cache.render(self.font_manager.large, "Subtract Factor Game", True, TEXT_COLOR)
+        title_shadow = text_cache.render(self.font_manager.large, "Subtract Factor Game", True, SHADOW_COLOR)
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 2, 15))
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 13))
         
@@ -58,8 +58,8 @@ class SubtractFactorUI:
             mode_text = f"Mode: Player vs AI - {difficulty_names[game_logic.difficulty-1]}"
         
         params_text = f"Initial n: {game_logic.initial_n} | Threshold k: {game_logic.threshold_k}"
-        mode_info = self.font_manager.small.render(mode_text, True, ACCENT_COLOR)
-        params_info = self.font_manager.small.render(params_text, True, ACCENT_COLOR)
+        mode_info = text_cache.render(self.font_manager.small, mode_text, True, ACCENT_COLOR)
+        params_info = text_cache.render(self.font_manager.small, params_text, True, ACCENT_COLOR)
         
         self.screen.blit(mode_info, (20, 145))
         
@@ -71,7 +71,7 @@ class SubtractFactorUI:
         }
         player_color = player_colors.get(game_logic.current_player, TEXT_COLOR)
         
-        player_text = self.font_manager.small.render(
+        player_text = text_cache.render(self.font_manager.small,
             f"Current Player: {game_logic.current_player}", 
             True, player_color
         )
@@ -84,7 +84,7 @@ class SubtractFactorUI:
         self.screen.blit(player_text, (SCREEN_WIDTH - player_text.get_width() - 30, 148))
         
         # Current value display
-        value_text = self.font_manager.large.render(f"Current Value: {game_logic.current_value} | Threshold: {game_logic.threshold_k}", True, HIGHLIGHT_COLOR)
+        value_text = text_cache.render(self.font_manager.large, f"Current Value: {game_logic.current_value} | Threshold: {game_logic.threshold_k}", True, HIGHLIGHT_COLOR)
         self.screen.blit(value_text, (SCREEN_WIDTH//2 - value_text.get_width()//2, 60))
         
         # Current message with background - with text wrapping
@@ -96,7 +96,7 @@ class SubtractFactorUI:
         # Handle long messages with text wrapping
         message_lines = wrap_text(game_logic.message, self.font_manager.medium, SCREEN_WIDTH - 100)
         for i, line in enumerate(message_lines):
-            message_text = self.font_manager.medium.render(line, True, message_color)
+            message_text = text_cache.render(self.font_manager.medium, line, True, message_color)
             message_bg_width = message_text.get_width() + 30
             message_bg = pygame.Rect(SCREEN_WIDTH//2 - message_bg_width//2, 110 + i * 25, 
                                    message_bg_width, message_text.get_height() + 6)
@@ -112,7 +112,7 @@ class SubtractFactorUI:
         if not game_logic.game_over:
             game_state = "Winning Position" if game_logic.judge_win() else "Losing Position"
             state_color = WIN_COLOR if game_logic.judge_win() else LOSE_COLOR
-            state_text = self.font_manager.small.render(game_state, True, state_color)
+            state_text = text_cache.render(self.font_manager.small, game_state, True, state_color)
             
             state_bg = pygame.Rect(SCREEN_WIDTH//2 - state_text.get_width()//2 - 10, 155, 
                                  state_text.get_width() + 20, state_text.get_height() + 6)
@@ -139,7 +139,7 @@ class SubtractFactorUI:
         else:
             scroll_info = f" ({total_factors} factors)"
             
-        title_text = self.font_manager.medium.render(f"Select a Factor to Subtract:{scroll_info}", True, TEXT_COLOR)
+        title_text = text_cache.render(self.font_manager.medium, f"Select a Factor to Subtract:{scroll_info}", True, TEXT_COLOR)
         self.screen.blit(title_text, (SCREEN_WIDTH//2 - title_text.get_width()//2, selection_y + 20))
         
         # Draw scroll buttons if needed
@@ -158,7 +158,7 @@ class SubtractFactorUI:
             result = game_logic.current_value - game_logic.selected_factor
             result_color = LOSE_COLOR if result < game_logic.threshold_k else TEXT_COLOR
             result_status = "LOSE!" if result < game_logic.threshold_k else f"{result}"
-            result_text = self.font_manager.small.render(
+            result_text = text_cache.render(self.font_manager.small,
                 f"Selected: {game_logic.selected_factor}    New value: {result_status}", 
                 True, result_color
             )
@@ -177,7 +177,7 @@ class SubtractFactorUI:
         
         # Draw selected factor display
         factor_display = str(game_logic.selected_factor) if game_logic.selected_factor > 0 else "-"
-        factor_text = self.font_manager.large.render(factor_display, True, TEXT_COLOR)
+        factor_text = text_cache.render(self.font_manager.large, factor_display, True, TEXT_COLOR)
         factor_bg = pygame.Rect(control_x + control_width//2 - 35, control_y+40, 70, 60)
         pygame.draw.rect(self.screen, (40, 60, 80), factor_bg, border_radius=12)
         pygame.draw.rect(self.screen, ACCENT_COLOR, factor_bg, 3, border_radius=12)
@@ -261,7 +261,7 @@ class SubtractFactorUI:
         
         # 绘制文本行
         for i, line in enumerate(lines):
-            line_text = self.font_manager.small.render(line, True, (220, 240, 255))
+            line_text = text_cache.render(self.font_manager.small, line, True, (220, 240, 255))
             self.screen.blit(line_text, (tooltip_x + padding, 
                                        tooltip_y + padding + i * line_height))
     
@@ -287,7 +287,7 @@ class SubtractFactorUI:
         pygame.draw.rect(self.screen, (0, 200, 255), self.hint_window_rect, 3, border_radius=12)
         
         # 绘制窗口标题
-        title_text = self.font_manager.large.render("WINNING HINT", True, (0, 255, 220))
+        title_text = text_cache.render(self.font_manager.large, "WINNING HINT", True, (0, 255, 220))
         title_rect = title_text.get_rect(center=(window_x + window_width//2, window_y + 30))
         self.screen.blit(title_text, title_rect)
         
@@ -316,15 +316,15 @@ class SubtractFactorUI:
                     self.hovered = False
                 
                 def update_hover(self, mouse_pos):
-                    self.hovered = self.rect.collidepoint(mouse_pos)
+                    render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos))
                 
                 def draw(self, screen):
                     color = (255, 100, 100) if self.hovered else (200, 80, 80)
                     pygame.draw.rect(screen, color, self.rect, border_radius=4)
                     pygame.draw.rect(screen, (255, 200, 200), self.rect, 1, border_radius=4)
                     
-                    font = pygame.font.SysFont('Arial', 20, bold=True)
-                    text_surface = font.render(self.text, True, (255, 255, 255))
+                    font = resource_cache.get_sys_font('Arial', 20, bold=True)
+                    text_surface = text_cache.render(font, self.text, True, (255, 255, 255))
                     text_rect = text_surface.get_rect(center=self.rect.center)
                     screen.blit(text_surface, text_rect)
             
@@ -334,18 +334,23 @@ class SubtractFactorUI:
         self.hint_close_button.draw(self.screen)
         
         # 绘制关闭提示
-        close_hint = self.font_manager.small.render("Press ESC or click X to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Press ESC or click X to close", True, (180, 200, 220))
         close_hint_rect = close_hint.get_rect(center=(window_x + window_width//2, window_y + window_height - 20))
         self.screen.blit(close_hint, close_hint_rect)
     
     def show_hint_tooltip(self, text, pos):
         """显示提示工具提示"""
+        if not self.is_hint_tooltip_visible:
+            # 提示框跟随鼠标绘制，出现和消失都重绘整屏（下一帧生效）
+            render_optimizer.mark_dirty()
         self.is_hint_tooltip_visible = True
         self.hint_tooltip_text = text
         self.hint_tooltip_pos = pos
     
     def hide_hint_tooltip(self):
         """隐藏提示工具提示"""
+        if self.is_hint_tooltip_visible:
+            render_optimizer.mark_dirty()
         self.is_hint_tooltip_visible = False
         self.hint_tooltip_text = ""
     
@@ -460,7 +465,7 @@ class SubtractFactorUI:
         # 注意：这个函数在游戏逻辑中调用，我们需要从其他地方获取winning_hints_enabled状态
         
         for i, hint in enumerate(hints):
-            hint_text = self.font_manager.small.render(hint, True, (150, 170, 190))
+            hint_text = text_cache.render(self.font_manager.small, hint, True, (150, 170, 190))
             self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 20))
     
     def create_buttons(self):
@@ -478,7 +483,7 @@ class SubtractFactorUI:
                 self.corner_radius = 12
             
             def update_hover(self, mouse_pos):
-                self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+                render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
             
             def is_clicked(self, event):
                 return (event.type == pygame.MOUSEBUTTONDOWN and 
@@ -537,8 +542,8 @@ class SubtractFactorUI:
                     ])
                 elif self.icon == 'refresh':
                     # Draw refresh icon as text
-                    refresh_font = pygame.font.SysFont('Arial', 12, bold=True)
-                    refresh_text = refresh_font.render("Refresh", True, icon_color)
+                    refresh_font = resource_cache.get_sys_font('Arial', 12, bold=True)
+                    refresh_text = text_cache.render(refresh_font, "Refresh", True, icon_color)
                     refresh_rect = refresh_text.get_rect(center=self.rect.center)
                     surface.blit(refresh_text, refresh_rect)
                 elif self.icon == 'hint':  # 新增：提示图标
@@ -558,8 +563,8 @@ class SubtractFactorUI:
                     pygame.draw.rect(surface, (200, 180, 100), bottom_rect, border_radius=3)
                     
                     # 问号
-                    font = pygame.font.SysFont('Arial', 16, bold=True)
-                    q_text = font.render("?", True, (60, 60, 80))
+                    font = resource_cache.get_sys_font('Arial', 16, bold=True)
+                    q_text = text_cache.render(font, "?", True, (60, 60, 80))
                     text_rect = q_text.get_rect(center=center)
                     surface.blit(q_text, text_rect)
                     
@@ -574,12 +579,12 @@ class SubtractFactorUI:
             
             def _draw_text(self, surface):
                 text_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-                text_surface = self.font_manager.medium.render(self.text, True, text_color)
+                text_surface = text_cache.render(self.font_manager.medium, self.text, True, text_color)
                 text_rect = text_surface.get_rect(center=self.rect.center)
                 
                 # Text shadow
                 if self.enabled:
-                    shadow_surface = self.font_manager.medium.render(self.text, True, (0, 0, 0, 100))
+                    shadow_surface = text_cache.render(self.font_manager.medium, self.text, True, (0, 0, 0, 100))
                     shadow_rect = text_rect.move(2, 2)
                     surface.blit(shadow_surface, shadow_rect)
                 
@@ -704,11 +709,11 @@ class FactorButton:
         
         # Draw text
         text_color = (255, 255, 255)
-        text_surface = self.font_manager.medium.render(self.text, True, text_color)
+        text_surface = text_cache.render(self.font_manager.medium, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         
         # Text shadow
-        shadow_surface = self.font_manager.medium.render(self.text, True, (0, 0, 0, 100))
+        shadow_surface = text_cache.render(self.font_manager.medium, self.text, True, (0, 0, 0, 100))
         shadow_rect = text_rect.move(1, 1)
         surface.blit(shadow_surface, shadow_rect)
         
@@ -716,7 +721,7 @@ class FactorButton:
     
     def update_hover(self, mouse_pos):
         """Update hover state"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """Check if button was clicked"""
@@ -756,14 +761,14 @@ class ScrollButton:
         
         # Draw arrow
         arrow_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        arrow_font = pygame.font.SysFont('Arial', 24, bold=True)
-        arrow_text = arrow_font.render(self.text, True, arrow_color)
+        arrow_font = resource_cache.get_sys_font('Arial', 24, bold=True)
+        arrow_text = text_cache.render(arrow_font, self.text, True, arrow_color)
         arrow_rect = arrow_text.get_rect(center=self.rect.center)
         surface.blit(arrow_text, arrow_rect)
     
     def update_hover(self, mouse_pos):
         """Update hover state"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """Check if button was clicked"""
@@ -1,8 +1,14 @@
+from utils.lazy_imports import install
+
 # [file name]: src/games/take_coins/__init__.py
 """
 Take Coins Game Package
 """
 
-from .game import TakeCoinsGame
+# The game classes need pygame; importing them on first access (PEP 562)
+# keeps the logic modules usable headless
+install(globals(), {
+    'TakeCoinsGame': '.game',
+})
 
 __all__ = ['TakeCoinsGame']
\ No newline at end of file
@@ -7,6 +7,8 @@ from utils.constants import *
 from utils.key_repeat import KeyRepeatManager
 from ui.components.sidebar import Sidebar
 from utils.config_manager import config_manager  # 新增导入
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class TakeCoinsInputHandler:
     """Handles input for Take Coins game with scrolling support"""
@@ -295,6 +297,7 @@ Good luck and have fun!
         self.control_buttons = self.ui.create_buttons()
         self.position_buttons = []
         self.scroll_buttons = []
+        self.widget_state = None  # 下一帧重建位置和滚动按钮
         self.ai_timer = 0
     
     def initialize_game_settings(self):
@@ -529,20 +532,24 @@ Good luck and have fun!
         """Update game state with scrolling support"""
         self.sidebar.update()
         
-        # Update position buttons based on current valid positions
-        self.position_buttons = self.ui.create_position_buttons(
-            self.logic.coins, self.logic.valid_positions, self.logic.selected_position
-        )
-        
-        # Update scroll buttons
-        self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.coins))
+        # 控件只在局面、滚动、选择或提示设置变化时重建
+        if self.widgets_changed(self.logic.version, self.ui.scroll_offset,
+                                self.logic.selected_position,
+                                self.config_manager.get_user_preferences().winning_hints):
+            # Update position buttons based on current valid positions
+            self.position_buttons = self.ui.create_position_buttons(
+                self.logic.coins, self.logic.valid_positions, self.logic.selected_position
+            )
+            
+            # Update scroll buttons
+            self.scroll_buttons = self.ui.create_scroll_buttons(len(self.logic.coins))
+            
+            # Update button states
+            self.update_button_states()
         
         # Update key repeat
         self.input_handler.update_key_repeat()
         
-        # Update button states
-        self.update_button_states()
-        
         # AI's turn (only in PvE mode)
         if (self.logic.game_mode == "PVE" and 
             self.logic.current_player == "AI" and 
@@ -559,7 +566,7 @@ Good luck and have fun!
         try:
             if self.showing_instructions:
                 self.draw_instructions()
-                pygame.display.flip()
+                render_optimizer.present()
                 return
             
             # Draw background
@@ -591,7 +598,7 @@ Good luck and have fun!
             # 最后绘制侧边栏，使其在最上层
             self.sidebar.draw()
             
-            pygame.display.flip()
+            render_optimizer.present()
             
         except Exception as e:
             print(f"Error in draw: {e}")
@@ -616,12 +623,12 @@ Good luck and have fun!
         pygame.draw.rect(self.screen, ACCENT_COLOR, (panel_x, panel_y, panel_width, panel_height), 3, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Take Coins Game - Instructions", True, TEXT_COLOR)
+        title = text_cache.render(self.font_manager.large, "Take Coins Game - Instructions", True, TEXT_COLOR)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, panel_y + 40))
         self.screen.blit(title, title_rect)
         
         # Close hint
-        close_hint = self.font_manager.small.render("Click anywhere or press ESC/I to close", True, (180, 200, 220))
+        close_hint = text_cache.render(self.font_manager.small, "Click anywhere or press ESC/I to close", True, (180, 200, 220))
         close_rect = close_hint.get_rect(center=(SCREEN_WIDTH//2, panel_y + panel_height - 30))
         self.screen.blit(close_hint, close_rect)
         
@@ -669,7 +676,7 @@ Good luck and have fun!
             # Draw each line
             for text_line in lines:
                 if y_pos < panel_y + panel_height - 60:
-                    text_surface = font.render(text_line, True, color)
+                    text_surface = text_cache.render(font, text_line, True, color)
                     text_rect = text_surface.get_rect(left=panel_x + 40, top=y_pos)
                     self.screen.blit(text_surface, text_rect)
                     y_pos += font.get_linesize() + 2
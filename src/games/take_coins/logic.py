@@ -1,6 +1,7 @@
 import random
 import copy
-from functools import lru_cache
+from games.take_coins.solver import take_coins_solver
+from utils.replay_recorder import record_ai_turn, record_game_start, record_move
 
 class TakeCoinsAutoPlayer:
     """Handles AI logic for Take Coins game"""
@@ -26,43 +27,11 @@ class TakeCoinsAutoPlayer:
     
     def judge_win(self, coins):
         """Determine if current position is winning for the player to move"""
-        return self._judge_win_internal(tuple(coins))
-    
-    @staticmethod
-    @lru_cache(maxsize=None)
-    def _judge_win_internal(state):
-        """递归判断：当前玩家是否能强制获胜"""
-        state_list = list(state)
-        n = len(state_list)
-        
-        has_legal_move = False
-        for i in range(1, n - 1):
-            if state_list[i-1] >= 1 and state_list[i+1] >= 1:
-                has_legal_move = True
-                new_state = state_list.copy()
-                new_state[i] += 1
-                new_state[i-1] -= 1
-                new_state[i+1] -= 1
-                
-                if new_state[i-1] >= 0 and new_state[i+1] >= 0:
-                    if not TakeCoinsAutoPlayer._judge_win_internal(tuple(new_state)):
-                        return True
-        return False
+        return take_coins_solver.is_winning(coins)
     
     def find_winning_move(self):
         """寻找能让对手处于必败局面的移动"""
-        valid_positions = self.get_valid_positions(self.coins)
-        
-        for pos in valid_positions:
-            new_coins = self.coins.copy()
-            new_coins[pos] += 1
-            new_coins[pos-1] -= 1
-            new_coins[pos+1] -= 1
-            
-            if not self.judge_win(new_coins):
-                return pos
-        
-        return None
+        return take_coins_solver.first_winning_move(self.coins)
     
     def move_instruction(self, difficulty):
         """生成AI移动指令"""
@@ -95,6 +64,9 @@ class TakeCoinsAutoPlayer:
             hint += f"• Position {winning_move-1}: Loses 1 coin (currently {coins[winning_move-1]} coins)\n"
             hint += f"• Position {winning_move+1}: Loses 1 coin (currently {coins[winning_move+1]} coins)\n\n"
             hint += "This move will leave your opponent in a losing position."
+            depth = take_coins_solver.depth_to_end(coins)
+            if depth is not None:
+                hint += f"\nWith perfect play the game ends in {depth} more moves."
         else:
             hint += "No guaranteed winning move exists. "
             hint += f"Available moves: positions {valid_positions}\n\n"
@@ -102,7 +74,10 @@ class TakeCoinsAutoPlayer:
             hint += "1. Try to create symmetrical positions\n"
             hint += "2. Avoid creating isolated positions\n"
             hint += "3. Make the opponent's moves predictable\n\n"
-            hint += f"Recommended: Try position {random.choice(valid_positions)}"
+            # 最佳防守：对手必胜应对最少、对局拖得最长的走法
+            best = take_coins_solver.analyze_position(coins).best()
+            hint += f"Recommended: Try position {best.move} "
+            hint += f"(opponent keeps {best.opponent_winning_replies} winning replies)"
             
             if difficulty >= 3:  # Hard/Insane难度额外建议
                 hint += "\n\nAdvanced strategy: "
@@ -142,40 +117,22 @@ class TakeCoinsLogic:
         self.auto_player = None
         self.valid_positions = []
         self.winning_hints_enabled = False
+        self.version = 0  # 每次局面变化加一，UI据此判断是否需要重建控件
     
     def judge_win(self, coins=None):
         """判断当前局面是否对当前玩家有利"""
         if coins is None:
             coins = self.coins
-        return self._judge_win_internal(tuple(coins))
-    
-    @staticmethod
-    @lru_cache(maxsize=None)
-    def _judge_win_internal(state):
-        """递归判断：当前玩家是否能强制获胜"""
-        state_list = list(state)
-        n = len(state_list)
-        
-        has_legal_move = False
-        for i in range(1, n - 1):
-            if state_list[i-1] >= 1 and state_list[i+1] >= 1:
-                has_legal_move = True
-                new_state = state_list.copy()
-                new_state[i] += 1
-                new_state[i-1] -= 1
-                new_state[i+1] -= 1
-                
-                if new_state[i-1] >= 0 and new_state[i+1] >= 0:
-                    if not TakeCoinsLogic._judge_win_internal(tuple(new_state)):
-                        return True
-        return False
+        return take_coins_solver.is_winning(coins)
     
+    @record_game_start("take_coins")
     def initialize_game(self, game_mode, difficulty=None, num_positions=None, winning_hints=False):
         """初始化游戏 - PvE模式下确保玩家处于必胜局面"""
         self.game_mode = game_mode
         self.difficulty = difficulty
         self.winning_hints_enabled = winning_hints  # 存储提示设置
         
+        start_coins = None
         if num_positions is None:
             if game_mode == "PVP":
                 num_positions = random.randint(8, 12)
@@ -184,29 +141,18 @@ class TakeCoinsLogic:
                     1: (8, 10), 2: (9, 11), 3: (10, 12), 4: (11, 14)
                 }
                 min_n, max_n = difficulty_ranges.get(difficulty, (8, 12))
-                num_positions = random.randint(min_n, max_n)
-        
-        max_attempts = 100
-        attempt_count = 0
+                # 开局库中直接抽取先手必胜的局面，无需现场求解
+                start_coins = take_coins_solver.sample_winning_start(min_n, max_n)
+                num_positions = len(start_coins) if start_coins else random.randint(min_n, max_n)
         
-        while attempt_count < max_attempts:
-            attempt_count += 1
-            self.coins = [random.randint(1, 3) for _ in range(num_positions)]
-            self.update_valid_positions()
-            
-            if self.valid_positions:
-                if self.game_mode == "PVE":
-                    if self.judge_win():
-                        break
-                else:
-                    break
-        
-        if attempt_count >= max_attempts:
+        if self.game_mode == "PVE":
+            if start_coins is None:
+                # 没有开局库时只求解一次：必败局面退回一步即为必胜局面
+                start_coins = take_coins_solver.construct_winning_start(num_positions)
+            self.coins = start_coins
+        else:
+            # 每个位置至少1枚硬币，3个以上位置时总有合法走法
             self.coins = [random.randint(1, 3) for _ in range(num_positions)]
-            self.update_valid_positions()
-            while not self.valid_positions:
-                self.coins = [random.randint(1, 3) for _ in range(num_positions)]
-                self.update_valid_positions()
         
         self.selected_position = None
         self.game_over = False
@@ -217,6 +163,7 @@ class TakeCoinsLogic:
             self.auto_player = TakeCoinsAutoPlayer(self.coins)
         
         self.update_valid_positions()
+        self.version += 1
         
         if self.game_mode == "PVP":
             mode_info = " (Player vs Player)"
@@ -224,7 +171,8 @@ class TakeCoinsLogic:
             difficulty_names = ["Easy", "Normal", "Hard", "Insane"]
             mode_info = f" (Player vs AI - {difficulty_names[self.difficulty-1]})"
         
-        is_winning = self.judge_win()
+        # PvE开局按构造就是先手必胜，不必再求解一次
+        is_winning = True if self.game_mode == "PVE" else self.judge_win()
         position_state = "winning" if is_winning else "losing"
         self.message = f"Game Started! {len(self.coins)} positions. {self.current_player} is in a {position_state} position.{mode_info}"
         
@@ -272,6 +220,7 @@ class TakeCoinsLogic:
             self.message = f"Invalid position: {position}. Please select a valid position."
         return False
     
+    @record_move(lambda logic: logic.selected_position)
     def make_move(self):
         """执行移动"""
         if self.selected_position is None or self.selected_position not in self.valid_positions:
@@ -291,6 +240,7 @@ class TakeCoinsLogic:
         self.coins[i] += 1
         self.coins[i-1] -= 1
         self.coins[i+1] -= 1
+        self.version += 1
         
         self.message = f"{self.current_player} moved at position {i}."
         
@@ -321,6 +271,7 @@ class TakeCoinsLogic:
             self.current_player = "Player 2" if self.current_player == "Player 1" else "Player 1"
             self.message += f" {self.current_player}'s turn."
     
+    @record_ai_turn
     def ai_make_move(self):
         """AI移动"""
         if self.game_mode == "PVE" and self.current_player == "AI" and not self.game_over:
@@ -415,6 +366,10 @@ class TakeCoinsLogic:
         # Winning/losing state
         is_winning = self.judge_win()
         analysis += f"• Current position: {'WINNING' if is_winning else 'LOSING'}\n"
+        analysis += f"• Winning moves: {len(take_coins_solver.winning_moves(self.coins))}\n"
+        depth = take_coins_solver.depth_to_end(self.coins)
+        if depth is not None:
+            analysis += f"• Moves left with perfect play: {depth}\n"
         
         # Selected position info
         if self.selected_position is not None:
@@ -0,0 +1,589 @@
+"""
+Take Coins Sprague-Grundy Solver
+"""
+
+import itertools
+import os
+import random
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from utils.bounded_cache import BoundedCache
+from utils.opening_book import get_book
+from utils.position_analysis import DepthSearch, MoveAnalysis, PositionAnalysis, analysis_cache
+
+# Upper bound on memoised segment values; keeps memory flat over long sessions
+SEGMENT_CACHE_SIZE = 1 << 16
+
+# Precomputed retrograde table shipped with the game
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', '..', '..', 'assets', 'tables', 'take_coins_segments.bin')
+TABLE_MAGIC = b'TCSG'
+TABLE_VERSION = 1
+
+# Segments covered by the shipped table: every line of up to 8 positions with
+# 0-3 coins each (the PvE boards start with 1-3 coins per position), plus
+# everything reachable from them
+DEFAULT_TABLE_LENGTH = 8
+DEFAULT_TABLE_COINS = 3
+
+# Opening book of PvE starts (1-3 coins per position); records are the coins
+# (zero padded) and a winning move. Lengths with at most BOOK_ENUMERATE_LIMIT
+# boards are stored in full. Longer ones (3^10 boards and up, each taking
+# milliseconds to a second to solve) keep BOOK_SAMPLES distinct boards drawn
+# with a fixed seed so rebuilds are reproducible; that is still far more
+# starts per length than a player sees, and boards are mirrored at random
+# when drawn.
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         '..', '..', '..', 'assets', 'tables', 'take_coins_book.bin')
+BOOK_MAX_LENGTH = 15
+BOOK_FORMAT = f'<{BOOK_MAX_LENGTH}sB'
+BOOK_ENUMERATE_LIMIT = 3 ** 9
+BOOK_SAMPLES = 1024
+NO_MOVE = 0xFF
+
+# Boards expanded per depth-to-end search (shared by all moves of an analysed
+# position); longer games report no depth
+DEPTH_SEARCH_NODES = 4000
+
+
+def _board_children(coins):
+    """Boards one move away, mirror images folded together"""
+    coins = list(coins)
+    children = []
+    for i in range(1, len(coins) - 1):
+        if coins[i-1] >= 1 and coins[i+1] >= 1:
+            coins[i-1] -= 1
+            coins[i] += 1
+            coins[i+1] -= 1
+            child = tuple(coins)
+            children.append(min(child, child[::-1]))
+            coins[i-1] += 1
+            coins[i] -= 1
+            coins[i+1] += 1
+    return children
+
+
+class TakeCoinsSolver:
+    """
+    Shared analysis engine for Take Coins.
+
+    A zero that can never be refilled cuts the line in two: that happens for
+    zeros on either end of a segment (the end position cannot be selected) and
+    for runs of two or more zeros (each blocks the only move that could refill
+    the other). The pieces between such cuts are independent games whose ends
+    act as boundaries, so a position is the nim-sum of its segments' values.
+
+    Every move removes exactly one coin, so all evaluation runs on explicit
+    stacks (or level by level over the total coin count) and never recurses.
+    """
+
+    def __init__(self, cache_size: int = SEGMENT_CACHE_SIZE):
+        self.grundy_cache = BoundedCache(cache_size)
+        self.outcome_cache = BoundedCache(cache_size)
+        self.table: Dict[Tuple[int, ...], int] = {}  # Read-only precomputed values
+        self.analyses = analysis_cache()
+        self.depths = DepthSearch(_board_children, max_nodes=DEPTH_SEARCH_NODES)
+
+    # ---------- Segments ----------
+
+    def split_segments(self, coins) -> List[Tuple[int, ...]]:
+        """Split a coin line into independent segments that still hold a move"""
+        segments = []
+        n = len(coins)
+        start = 0
+        i = 0
+        while i < n:
+            if coins[i] != 0:
+                i += 1
+                continue
+            end = i
+            while end < n and coins[end] == 0:
+                end += 1
+            if end - i >= 2 or i == start or end == n:
+                if i - start >= 3:
+                    segments.append(tuple(coins[start:i]))
+                start = end
+            i = end
+        if n - start >= 3:
+            segments.append(tuple(coins[start:n]))
+        return segments
+
+    def canonical_segment(self, segment) -> Tuple[int, ...]:
+        """Segments and their mirror images share one cache entry"""
+        segment = tuple(segment)
+        mirrored = segment[::-1]
+        return mirrored if mirrored < segment else segment
+
+    def child_segments(self, coins, i) -> List[Tuple[int, ...]]:
+        """
+        Canonical segments left after the move at `i` (already applied to `coins`).
+
+        Segments never hold a permanent zero, and a move only empties its two
+        neighbours, so the line can only be cut right next to the move.
+        """
+        last = len(coins) - 1
+        cut = ((coins[i-1] == 0 and (i == 1 or coins[i-2] == 0)) or
+               (coins[i+1] == 0 and (i + 1 == last or coins[i+2] == 0)))
+        if not cut:
+            return [self.canonical_segment(coins)]
+        return [self.canonical_segment(piece) for piece in self.split_segments(coins)]
+
+    def segment_options(self, segment) -> List[List[Tuple[int, ...]]]:
+        """The pieces left by every legal move in a segment"""
+        return list(self._iter_options(segment))
+
+    def _iter_options(self, segment) -> Iterator[List[Tuple[int, ...]]]:
+        """segment_options() one move at a time, so a search can stop early"""
+        coins = list(segment)
+        for i in range(1, len(coins) - 1):
+            if coins[i-1] >= 1 and coins[i+1] >= 1:
+                coins[i-1] -= 1
+                coins[i] += 1
+                coins[i+1] -= 1
+                pieces = self.child_segments(coins, i)
+                coins[i-1] += 1
+                coins[i] -= 1
+                coins[i+1] += 1
+                yield pieces
+
+    # ---------- Grundy values ----------
+
+    def _known_grundy(self, segment) -> Optional[int]:
+        """Grundy value from the precomputed table or the shared cache"""
+        value = self.table.get(segment)
+        if value is not None:
+            return value
+        return self.grundy_cache.get(segment)
+
+    def grundy(self, segment) -> int:
+        """Grundy value of a single segment (ends are boundaries)"""
+        root = self.canonical_segment(segment)
+        value = self._known_grundy(root)
+        if value is not None:
+            return value
+
+        # Post-order walk on an explicit stack; `solved` pins this query's
+        # results so cache evictions can never undo progress
+        solved = {}
+        stack = [root]
+        while stack:
+            segment = stack[-1]
+            if segment in solved:
+                stack.pop()
+                continue
+
+            pending = []
+            reachable = set()
+            for pieces in self.segment_options(segment):
+                value = 0
+                for piece in pieces:
+                    piece_value = solved.get(piece)
+                    if piece_value is None:
+                        piece_value = self._known_grundy(piece)
+                    if piece_value is None:
+                        pending.append(piece)
+                        break
+                    value ^= piece_value
+                else:
+                    reachable.add(value)
+
+            if pending:
+                stack.extend(pending)
+                continue
+
+            mex = 0
+            while mex in reachable:
+                mex += 1
+            solved[segment] = mex
+            self.grundy_cache.put(segment, mex)
+            stack.pop()
+
+        return solved[root]
+
+    def position_grundy(self, coins) -> int:
+        """Nim-sum of the Grundy values of all independent segments"""
+        value = 0
+        for segment in self.split_segments(coins):
+            value ^= self.grundy(segment)
+        return value
+
+    # ---------- Win / loss ----------
+
+    def _known_outcome(self, segment) -> Optional[bool]:
+        """Win/loss of a segment from the precomputed table or the shared cache"""
+        value = self.table.get(segment)
+        if value is not None:
+            return value != 0
+        return self.outcome_cache.get(segment)
+
+    def _open_frame(self, segment) -> list:
+        """Search frame [segment, unsolved unsplit children, next child]; children None = already won"""
+        # The hot loop of every cold solve: moves, cuts and mirroring are
+        # inlined here instead of going through _iter_options()
+        table_get = self.table.get
+        cached = self.outcome_cache.get
+        coins = list(segment)
+        last = len(coins) - 1
+        unsplit = []
+        for i in range(1, last):
+            left = coins[i-1]
+            right = coins[i+1]
+            if not (left and right):
+                continue
+            coins[i-1] = left - 1
+            coins[i] += 1
+            coins[i+1] = right - 1
+            if ((left == 1 and (i == 1 or coins[i-2] == 0)) or
+                    (right == 1 and (i + 1 == last or coins[i+2] == 0))):
+                pieces = [self.canonical_segment(piece) for piece in self.split_segments(coins)]
+            else:
+                pieces = None
+                child = tuple(coins)
+                mirrored = child[::-1]
+                if mirrored < child:
+                    child = mirrored
+            coins[i-1] = left
+            coins[i] -= 1
+            coins[i+1] = right
+
+            if pieces is not None:
+                if len(pieces) != 1:
+                    # Moves that cut the segment only need small Grundy values
+                    value = 0
+                    for piece in pieces:
+                        value ^= self.grundy(piece)
+                    if value == 0:
+                        return [segment, None, 0]
+                    continue
+                child = pieces[0]
+
+            # Settle already known children now; only unknown ones need a frame
+            value = table_get(child)
+            if value is None:
+                outcome = cached(child)
+                if outcome is None:
+                    # Replies that empty a neighbour leave the opponent fewer moves
+                    # and are the likeliest wins, so they are searched first
+                    unsplit.append(((left == 1) + (right == 1), child))
+                    continue
+            else:
+                outcome = value != 0
+            if not outcome:
+                return [segment, None, 0]
+        if len(unsplit) > 1:
+            unsplit.sort(key=lambda entry: -entry[0])
+        return [segment, [child for _, child in unsplit], 0]
+
+    def segment_outcome(self, segment) -> bool:
+        """True if the player to move wins a single segment"""
+        root = self.canonical_segment(segment)
+        known = self._known_outcome(root)
+        if known is not None:
+            return known
+
+        # Depth-first search that stops at the first winning reply. Children
+        # were checked against the table and cache when their frame opened, so
+        # only this search's own results can have settled them since
+        solved = {}
+        frames = [self._open_frame(root)]
+        while frames:
+            frame = frames[-1]
+            segment, unsplit, index = frame
+            result = unsplit is None
+            pending = None
+            if not result:
+                while index < len(unsplit):
+                    child = unsplit[index]
+                    outcome = solved.get(child)
+                    if outcome is None:
+                        pending = child
+                        break
+                    if not outcome:
+                        result = True
+                        break
+                    index += 1
+                frame[2] = index
+
+            if pending is not None:
+                frames.append(self._open_frame(pending))
+                continue
+
+            solved[segment] = result
+            self.outcome_cache.put(segment, result)
+            frames.pop()
+
+        return solved[root]
+
+    def is_losing(self, coins) -> bool:
+        """True if the player to move loses against perfect play (zero nim-sum)"""
+        segments = self.split_segments(coins)
+        if not segments:
+            return True
+        if len(segments) == 1:
+            # A lone segment only needs its win/loss outcome, which can stop
+            # at the first winning reply instead of computing a full mex
+            return not self.segment_outcome(segments[0])
+        value = 0
+        for segment in segments:
+            value ^= self.grundy(segment)
+        return value == 0
+
+    def is_winning(self, coins) -> bool:
+        """True if the player to move can force a win"""
+        return not self.is_losing(coins)
+
+    def winning_moves(self, coins) -> List[int]:
+        """All positions whose move leaves the opponent a zero nim-sum"""
+        coins = list(coins)
+        moves = []
+        for i in range(1, len(coins) - 1):
+            if coins[i-1] >= 1 and coins[i+1] >= 1:
+                coins[i-1] -= 1
+                coins[i] += 1
+                coins[i+1] -= 1
+                if self.is_losing(coins):
+                    moves.append(i)
+                coins[i-1] += 1
+                coins[i] -= 1
+                coins[i+1] += 1
+        return moves
+
+    def first_winning_move(self, coins) -> Optional[int]:
+        """The leftmost winning move, without solving the moves after it"""
+        coins = list(coins)
+        for i in range(1, len(coins) - 1):
+            if coins[i-1] >= 1 and coins[i+1] >= 1:
+                coins[i-1] -= 1
+                coins[i] += 1
+                coins[i+1] -= 1
+                losing = self.is_losing(coins)
+                coins[i-1] += 1
+                coins[i] -= 1
+                coins[i+1] += 1
+                if losing:
+                    return i
+        return None
+
+    # ---------- Move analysis ----------
+
+    def depth_to_end(self, coins) -> Optional[int]:
+        """Moves left under perfect play, or None if the game is too long to search"""
+        coins = tuple(coins)
+        return self.depths.depth(min(coins, coins[::-1]))
+
+    def analyze_position(self, coins) -> PositionAnalysis:
+        """Every valid position's move, with the opponent's winning replies and the depth left"""
+        key = tuple(coins)
+        analysis = self.analyses.get(key)
+        if analysis is not None:
+            return analysis
+
+        coins = list(coins)
+        moves = []
+        children = []
+        for i in range(1, len(coins) - 1):
+            if coins[i-1] >= 1 and coins[i+1] >= 1:
+                coins[i-1] -= 1
+                coins[i] += 1
+                coins[i+1] -= 1
+                moves.append(i)
+                children.append(tuple(coins))
+                coins[i-1] += 1
+                coins[i] -= 1
+                coins[i+1] += 1
+        # One node budget for the whole position: long boards get None depths instead of stalling
+        depths = self.depths.depths(min(child, child[::-1]) for child in children)
+        results = []
+        for move, child, depth in zip(moves, children, depths):
+            # A losing board leaves no winning replies; skip solving its children
+            replies = 0 if self.is_losing(child) else len(self.winning_moves(child))
+            results.append(MoveAnalysis(move, replies == 0, replies, depth))
+        analysis = PositionAnalysis(tuple(results))
+        self.analyses.put(key, analysis)
+        return analysis
+
+    # ---------- Opening book ----------
+
+    def build_book(self, lengths, samples: int = BOOK_SAMPLES, seed: int = 0,
+                   progress=None) -> Dict[int, tuple]:
+        """
+        Book groups per length: every board of 1-3 coins when there are at most
+        BOOK_ENUMERATE_LIMIT of them, otherwise `samples` distinct random ones
+        """
+        rng = random.Random(seed)
+        groups = {}
+        for length in lengths:
+            if 3 ** length <= BOOK_ENUMERATE_LIMIT:
+                boards = itertools.product((1, 2, 3), repeat=length)
+            else:
+                seen = set()
+                while len(seen) < min(samples, 3 ** length):
+                    seen.add(tuple(rng.randint(1, 3) for _ in range(length)))
+                boards = sorted(seen)
+            winning, losing = [], []
+            for coins in boards:
+                move = self.first_winning_move(coins)
+                if move is None:
+                    losing.append((bytes(coins), NO_MOVE))
+                else:
+                    winning.append((bytes(coins), move))
+            groups[length] = (winning, losing)
+            if progress:
+                progress(f"take_coins: length {length}: {len(winning)} winning / {len(losing)} losing")
+        return groups
+
+    def construct_winning_start(self, length: int, rng=random) -> List[int]:
+        """
+        First-player-win board of 1-3 coins per position, found with a single
+        solve per attempt: a random board that turns out losing is walked one
+        move backwards (the middle coin of a random triple split onto its
+        neighbours), and any board with a move into a losing one is a win.
+        Only triples that stay within 1-3 coins are walked back; a losing
+        board without one is redrawn.
+        """
+        while True:
+            coins = [rng.randint(1, 3) for _ in range(length)]
+            if length < 3 or not self.is_losing(coins):
+                return coins
+            triples = [i for i in range(1, length - 1)
+                       if coins[i] >= 2 and coins[i-1] <= 2 and coins[i+1] <= 2]
+            if triples:
+                i = rng.choice(triples)
+                coins[i-1] += 1
+                coins[i] -= 1
+                coins[i+1] += 1
+                return coins
+
+    def sample_winning_start(self, min_length: int, max_length: int) -> Optional[List[int]]:
+        """Random first-player-win board from the opening book (None without a book)"""
+        book = get_book(BOOK_PATH)
+        if book is None:
+            return None
+        # Pick the length first, as the unbooked setup does: short lengths are
+        # stored in full and would otherwise outweigh the sampled long ones
+        lengths = [n for n in range(min_length, max_length + 1) if book.winning_count(n)]
+        if not lengths:
+            return None
+        hit = book.random_winning([random.choice(lengths)])
+        length, (coins, _) = hit
+        coins = list(coins[:length])
+        # A board's mirror image is just as winning, which doubles the variety of sampled starts
+        if random.random() < 0.5:
+            coins.reverse()
+        return coins
+
+    # ---------- Retrograde table ----------
+
+    def build_table(self, max_length: int = DEFAULT_TABLE_LENGTH,
+                    max_coins: int = DEFAULT_TABLE_COINS) -> Dict[Tuple[int, ...], int]:
+        """
+        Retrograde analysis of every segment of up to `max_length` positions
+        with at most `max_coins` coins each, plus everything reachable from
+        them. A move removes exactly one coin, so solving the segments level
+        by level in increasing total coin count always finds the children
+        already solved.
+        """
+        seen = set()
+        frontier = []
+        for length in range(3, max_length + 1):
+            for coins in itertools.product(range(max_coins + 1), repeat=length):
+                segments = self.split_segments(coins)
+                if len(segments) != 1 or len(segments[0]) != length:
+                    continue
+                segment = self.canonical_segment(coins)
+                if segment not in seen:
+                    seen.add(segment)
+                    frontier.append(segment)
+
+        # Close the set under moves, bucketing by total coin count
+        levels: Dict[int, List[Tuple[int, ...]]] = {}
+        children = {}
+        while frontier:
+            segment = frontier.pop()
+            levels.setdefault(sum(segment), []).append(segment)
+            options = self.segment_options(segment)
+            children[segment] = options
+            for pieces in options:
+                for piece in pieces:
+                    if piece not in seen:
+                        seen.add(piece)
+                        frontier.append(piece)
+
+        table = {}
+        for total in sorted(levels):
+            for segment in levels[total]:
+                reachable = set()
+                for pieces in children.pop(segment):
+                    value = 0
+                    for piece in pieces:
+                        value ^= table[piece]
+                    reachable.add(value)
+                mex = 0
+                while mex in reachable:
+                    mex += 1
+                table[segment] = mex
+        return table
+
+    def save_table(self, table: Dict[Tuple[int, ...], int], path: str = TABLE_PATH):
+        """Write a table as packed records: length, coins..., Grundy value (one byte each)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(TABLE_MAGIC)
+            f.write(struct.pack('<BI', TABLE_VERSION, len(table)))
+            for segment in sorted(table, key=lambda s: (len(s), s)):
+                f.write(bytes((len(segment),) + segment + (table[segment],)))
+
+    def load_table(self, path: str = TABLE_PATH) -> bool:
+        """Load a table written by save_table; returns False if it is missing or invalid"""
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Error loading Take Coins table {path}: {e}")
+            return False
+
+        if data[:len(TABLE_MAGIC)] != TABLE_MAGIC:
+            print(f"Warning: {path} is not a Take Coins table")
+            return False
+        version, count = struct.unpack_from('<BI', data, len(TABLE_MAGIC))
+        if version != TABLE_VERSION:
+            print(f"Warning: unsupported Take Coins table version {version}")
+            return False
+
+        table = {}
+        offset = len(TABLE_MAGIC) + struct.calcsize('<BI')
+        for _ in range(count):
+            length = data[offset]
+            table[tuple(data[offset + 1:offset + 1 + length])] = data[offset + 1 + length]
+            offset += length + 2
+        self.table = table
+        return True
+
+    def precompute_table(self, max_length: int = DEFAULT_TABLE_LENGTH,
+                         max_coins: int = DEFAULT_TABLE_COINS, path: str = TABLE_PATH) -> int:
+        """Build, persist and install the retrograde table; returns its size"""
+        table = self.build_table(max_length, max_coins)
+        self.save_table(table, path)
+        self.table = table
+        return len(table)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get segment cache statistics"""
+        return {
+            'table_segments': len(self.table),
+            'depths': self.depths.get_stats(),
+            'grundy': self.grundy_cache.get_stats(),
+            'outcome': self.outcome_cache.get_stats()
+        }
+
+
+# Global solver instance shared by TakeCoinsLogic and TakeCoinsAutoPlayer
+take_coins_solver = TakeCoinsSolver()
+take_coins_solver.load_table()
+
+
+if __name__ == "__main__":
+    size = take_coins_solver.precompute_table()
+    print(f"Wrote {size} segments to {os.path.normpath(TABLE_PATH)}")
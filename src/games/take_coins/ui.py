@@ -2,9 +2,93 @@ import pygame
 import math
 from ui.components.buttons import GameButton
 from utils.constants import *
+from utils.background_layers import background_layers
 from utils.helpers import wrap_text
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.sprite_atlas import sprite_atlas
+from utils.optimization_tools import render_optimizer
 from ui.components.scrollables import ScrollablePanel
 
+# Coin stack sprites
+MAX_DISPLAY_COINS = 8
+COIN_RADIUS = 12
+COIN_SPACING = 6
+COIN_SPRITE_MARGIN = 2
+
+# Colours of pieces drawn into the sprite atlas (alpha dropped: the screen never used it)
+PLATE_COLORS = {
+    'selected': ((80, 100, 120), HIGHLIGHT_COLOR),      # 有效选中的底座
+    'selected_invalid': ((100, 80, 80), LOSE_COLOR),    # 无效选中的底座
+    'valid': ((60, 80, 100), (100, 140, 200)),
+    'invalid': ((40, 50, 60), (60, 70, 80)),
+}
+COIN_COLORS = {  # coin, border, highlight
+    'invalid': ((70, 70, 80), (50, 50, 60), (90, 90, 100)),
+    'selected': ((255, 225, 50), (218, 165, 32), (255, 255, 255)),
+    'normal': ((255, 200, 50), (184, 134, 11), (255, 255, 255)),
+}
+
+
+def _build_plate_sprite(surface, plate):
+    """Position base"""
+    base_color, border_color = PLATE_COLORS[plate]
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, base_color, rect, border_radius=6)
+    pygame.draw.rect(surface, border_color, rect, 2, border_radius=6)
+
+
+def _build_empty_sprite(surface, is_selected, is_valid):
+    """Empty position marker (40x40)"""
+    empty_circle = surface.get_rect()
+    if is_selected:
+        if is_valid:
+            pygame.draw.ellipse(surface, (255, 225, 50), empty_circle)
+            pygame.draw.ellipse(surface, HIGHLIGHT_COLOR, empty_circle, 3)
+        else:
+            pygame.draw.ellipse(surface, (255, 100, 100), empty_circle)
+            pygame.draw.ellipse(surface, LOSE_COLOR, empty_circle, 3)
+    elif is_valid:
+        pygame.draw.ellipse(surface, (80, 80, 100), empty_circle, 2)
+    else:
+        pygame.draw.ellipse(surface, (50, 50, 60), empty_circle, 2)
+
+
+def _coin_stack_geometry(display_count):
+    """(width, height, y of the bottom coin's centre) of a coin stack sprite"""
+    center_y = (display_count - 1) * COIN_SPACING + COIN_RADIUS + COIN_SPRITE_MARGIN
+    width = 2 * (COIN_RADIUS + COIN_SPRITE_MARGIN) + 1
+    return width, center_y + COIN_RADIUS + COIN_SPRITE_MARGIN + 1, center_y
+
+
+def _build_coin_stack_sprite(surface, display_count, look):
+    """A stack of display_count coins, bottom coin first"""
+    coin_color, border_color, highlight_color = COIN_COLORS[look]
+    _, _, base_y = _coin_stack_geometry(display_count)
+    x = COIN_RADIUS + COIN_SPRITE_MARGIN
+    for i in range(display_count):
+        coin_y = base_y - i * COIN_SPACING
+        
+        # draw shadow of coins
+        shadow_rect = (x - COIN_RADIUS + 1, coin_y - COIN_RADIUS + 1, 
+                       COIN_RADIUS * 2, COIN_RADIUS * 2)
+        pygame.draw.ellipse(surface, (0, 0, 0), shadow_rect)
+        
+        # draw coins
+        pygame.draw.circle(surface, coin_color, (x, coin_y), COIN_RADIUS)
+        pygame.draw.circle(surface, border_color, (x, coin_y), COIN_RADIUS, 2)
+        
+        # add high light
+        highlight_pos = (x - COIN_RADIUS//2, coin_y - COIN_RADIUS//2)
+        pygame.draw.circle(surface, highlight_color, highlight_pos, COIN_RADIUS//3)
+
+
+def _build_frame_sprite(surface, is_valid):
+    """Selection frame around a stack"""
+    color = HIGHLIGHT_COLOR if is_valid else LOSE_COLOR
+    pygame.draw.rect(surface, color, surface.get_rect(), 3, border_radius=8)
+
+
 class TakeCoinsUI:
     """Take Coins UI with dark display for invalid positions and hint support"""
     
@@ -26,13 +110,8 @@ class TakeCoinsUI:
     
     def draw_background(self):
         """Draw clean background"""
-        self.screen.fill(BACKGROUND_COLOR)
-        
-        # Subtle grid pattern
-        for x in range(0, SCREEN_WIDTH, 50):
-            pygame.draw.line(self.screen, (40, 50, 65), (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, 50):
-            pygame.draw.line(self.screen, (40, 50, 65), (0, y), (SCREEN_WIDTH, y), 1)
+        # Subtle grid pattern, pre-rendered once as a static layer
+        self.screen.blit(background_layers.grid(self.screen.get_size(), 50, (40, 50, 65), BACKGROUND_COLOR), (0, 0))
     
     def draw_game_info(self, game_logic):
         """Draw game information panel"""
@@ -42,7 +121,7 @@ class TakeCoinsUI:
         pygame.draw.line(self.screen, ACCENT_COLOR, (0, 180), (SCREEN_WIDTH, 180), 3)
         
         # Game title
-        title = self.font_manager.large.render("Take Coins Game", True, TEXT_COLOR)
+        title = text_cache.render(self.font_manager.large, "Take Coins Game", True, TEXT_COLOR)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 20))
         
         # Game mode info
@@ -54,8 +133,8 @@ class TakeCoinsUI:
             mode_text = f"Mode: Player vs AI - {difficulty_names[game_logic.difficulty-1]}"
         
         positions_text = f"Positions: {len(game_logic.coins)}"
-        mode_info = self.font_manager.small.render(mode_text, True, ACCENT_COLOR)
-        positions_info = self.font_manager.small.render(positions_text, True, ACCENT_COLOR)
+        mode_info = text_cache.render(self.font_manager.small, mode_text, True, ACCENT_COLOR)
+        positions_info = text_cache.render(self.font_manager.small, positions_text, True, ACCENT_COLOR)
         
         self.screen.blit(mode_info, (20, 80))
         self.screen.blit(positions_info, (20, 105))
@@ -68,7 +147,7 @@ class TakeCoinsUI:
         }
         player_color = player_colors.get(game_logic.current_player, TEXT_COLOR)
         
-        player_text = self.font_manager.medium.render(
+        player_text = text_cache.render(self.font_manager.medium,
             f"Current Player: {game_logic.current_player}", True, player_color
         )
         self.screen.blit(player_text, (SCREEN_WIDTH - player_text.get_width() - 20, 80))
@@ -82,19 +161,19 @@ class TakeCoinsUI:
         
         message_lines = wrap_text(game_logic.message, self.font_manager.medium, SCREEN_WIDTH - 100)
         for i, line in enumerate(message_lines):
-            message_text = self.font_manager.medium.render(line, True, message_color)
+            message_text = text_cache.render(self.font_manager.medium, line, True, message_color)
             self.screen.blit(message_text, (SCREEN_WIDTH//2 - message_text.get_width()//2, 130 + i * 25))
         
         # Game state indicator
         if not game_logic.game_over:
             game_state = "Winning Position" if game_logic.judge_win() else "Losing Position"
             state_color = WIN_COLOR if game_logic.judge_win() else LOSE_COLOR
-            state_text = self.font_manager.small.render(game_state, True, state_color)
+            state_text = text_cache.render(self.font_manager.small, game_state, True, state_color)
             self.screen.blit(state_text, (SCREEN_WIDTH//2 - state_text.get_width()//2, 160))
         
         # Winning hints indicator
         if hasattr(game_logic, 'winning_hints_enabled') and game_logic.winning_hints_enabled:
-            hint_indicator = self.font_manager.small.render("Winning Hints: ON", True, (100, 200, 255))
+            hint_indicator = text_cache.render(self.font_manager.small, "Winning Hints: ON", True, (100, 200, 255))
             self.screen.blit(hint_indicator, (SCREEN_WIDTH - hint_indicator.get_width() - 20, 105))
     
     def draw_coin_stacks(self, game_logic, position_buttons, scroll_buttons):
@@ -111,7 +190,7 @@ class TakeCoinsUI:
         else:
             scroll_info = f" ({total_positions} positions)"
             
-        title_text = self.font_manager.medium.render(f"Select a Position to Add Coin:{scroll_info}", True, TEXT_COLOR)
+        title_text = text_cache.render(self.font_manager.medium, f"Select a Position to Add Coin:{scroll_info}", True, TEXT_COLOR)
         self.screen.blit(title_text, (SCREEN_WIDTH//2 - title_text.get_width()//2, 215))
         
         # Draw scroll buttons if needed
@@ -119,30 +198,32 @@ class TakeCoinsUI:
             for button in scroll_buttons:
                 button.draw(self.screen)
         
-        # Draw visible position buttons
+        # Draw visible position buttons (one blits batch for the whole board)
+        batch = []
         for button in position_buttons:
             if (button.position_index >= self.scroll_offset and 
                 button.position_index < self.scroll_offset + self.visible_positions):
                 visible_index = button.position_index - self.scroll_offset
-                self._draw_single_coin_stack(button, visible_index, game_logic)
+                self._draw_single_coin_stack(button, visible_index, game_logic, batch)
+        self.screen.blits(batch, doreturn=False)
         
         # Selected position info
         if game_logic.selected_position is not None:
             i = game_logic.selected_position
             if i in game_logic.valid_positions:
                 info_text = f"Selected: Position {i} (Add 1 coin, neighbors lose 1 each)"
-                result_text = self.font_manager.small.render(info_text, True, HIGHLIGHT_COLOR)
+                result_text = text_cache.render(self.font_manager.small, info_text, True, HIGHLIGHT_COLOR)
             else:
                 info_text = f"Selected: Position {i} (Invalid - cannot move here)"
-                result_text = self.font_manager.small.render(info_text, True, LOSE_COLOR)
+                result_text = text_cache.render(self.font_manager.small, info_text, True, LOSE_COLOR)
             self.screen.blit(result_text, (SCREEN_WIDTH//2 - result_text.get_width()//2, 420))
         
         # Draw hint tooltip if visible
         if self.is_hint_tooltip_visible and self.hint_tooltip_text:
             self._draw_hint_tooltip()
     
-    def _draw_single_coin_stack(self, button, visible_index, game_logic):
-        """Draw a single coin stack at the correct scroll position"""
+    def _draw_single_coin_stack(self, button, visible_index, game_logic, batch=None):
+        """Draw a single coin stack at the correct scroll position (queued on `batch` if given)"""
         position_width = 80
         spacing = 20
         total_visible_width = self.visible_positions * position_width + (self.visible_positions - 1) * spacing
@@ -150,26 +231,16 @@ class TakeCoinsUI:
         base_y = 350
         
         x = start_x + visible_index * (position_width + spacing)
+        items = [] if batch is None else batch
         
         # Position base - 根据是否有效改变颜色
-        base_rect = pygame.Rect(x, base_y - 10, position_width, 20)
-        
         if button.selected:
-            if button.enabled:
-                base_color = (80, 100, 120)  # 有效选中的底座
-                border_color = HIGHLIGHT_COLOR
-            else:
-                base_color = (100, 80, 80)   # 无效选中的底座
-                border_color = LOSE_COLOR
-        elif button.enabled:
-            base_color = (60, 80, 100)
-            border_color = (100, 140, 200)
+            plate = 'selected' if button.enabled else 'selected_invalid'
         else:
-            base_color = (40, 50, 60)
-            border_color = (60, 70, 80)
-        
-        pygame.draw.rect(self.screen, base_color, base_rect, border_radius=6)
-        pygame.draw.rect(self.screen, border_color, base_rect, 2, border_radius=6)
+            plate = 'valid' if button.enabled else 'invalid'
+        items.append(sprite_atlas.item(('tc_plate', position_width, plate), (position_width, 20),
+                                       lambda surface: _build_plate_sprite(surface, plate),
+                                       (x, base_y - 10)))
         
         # Position number
         if button.selected:
@@ -177,93 +248,64 @@ class TakeCoinsUI:
         else:
             pos_text_color = TEXT_COLOR if button.enabled else (100, 110, 120)
         
-        pos_text = self.font_manager.small.render(f"Pos {button.position_index}", True, pos_text_color)
-        self.screen.blit(pos_text, (x + position_width//2 - pos_text.get_width()//2, base_y - 10))
+        pos_text = text_cache.render(self.font_manager.small, f"Pos {button.position_index}", True, pos_text_color)
+        items.append((pos_text, (x + position_width//2 - pos_text.get_width()//2, base_y - 10)))
         
         # Draw coin stack or empty indicator
         self._draw_coin_graphics(x + position_width//2, base_y - 40, button.coin_count,
-                               button.enabled, button.selected)
+                               button.enabled, button.selected, items)
+        
+        if batch is None:
+            self.screen.blits(items, doreturn=False)
     
-    def _draw_coin_graphics(self, x, base_y, coin_count, is_valid, is_selected):
-        """Draw coin graphics with dark colors for invalid positions"""
-        max_display_coins = 8
-        coin_radius = 12
-        coin_spacing = 6
+    def _draw_coin_graphics(self, x, base_y, coin_count, is_valid, is_selected, batch=None):
+        """Draw coin graphics with dark colors for invalid positions (queued on `batch` if given)"""
+        items = [] if batch is None else batch
         
         if coin_count == 0:
             # 空位置
-            empty_circle = pygame.Rect(x - 20, base_y - 20, 40, 40)
-            
             if is_selected:
                 if is_valid:
-                    pygame.draw.ellipse(self.screen, (255, 225, 50, 100), empty_circle)
-                    pygame.draw.ellipse(self.screen, HIGHLIGHT_COLOR, empty_circle, 3)
-                    empty_text = self.font_manager.small.render("Empty", True, HIGHLIGHT_COLOR)
+                    empty_text = text_cache.render(self.font_manager.small, "Empty", True, HIGHLIGHT_COLOR)
                 else:
-                    pygame.draw.ellipse(self.screen, (255, 100, 100, 100), empty_circle)
-                    pygame.draw.ellipse(self.screen, LOSE_COLOR, empty_circle, 3)
-                    empty_text = self.font_manager.small.render("Empty", True, LOSE_COLOR)
+                    empty_text = text_cache.render(self.font_manager.small, "Empty", True, LOSE_COLOR)
             else:
                 if is_valid:
-                    pygame.draw.ellipse(self.screen, (80, 80, 100, 100), empty_circle, 2)
-                    empty_text = self.font_manager.small.render("Empty", True, (180, 180, 200))
+                    empty_text = text_cache.render(self.font_manager.small, "Empty", True, (180, 180, 200))
                 else:
-                    pygame.draw.ellipse(self.screen, (50, 50, 60, 100), empty_circle, 2)
-                    empty_text = self.font_manager.small.render("Empty", True, (100, 100, 110))
+                    empty_text = text_cache.render(self.font_manager.small, "Empty", True, (100, 100, 110))
             
-            self.screen.blit(empty_text, (x - empty_text.get_width()//2, base_y - 8))
-            return
-        
-        # position with coins
-        if not is_valid:
-            coin_color = (70, 70, 80)
-            border_color = (50, 50, 60)
-            highlight_color = (90, 90, 100, 100)
-        elif is_selected:
-            coin_color = (255, 225, 50)
-            border_color = (218, 165, 32)
-            highlight_color = (255, 255, 255, 150)
+            items.append(sprite_atlas.item(('tc_empty', is_selected, is_valid), (40, 40),
+                                           lambda surface: _build_empty_sprite(surface, is_selected, is_valid),
+                                           (x - 20, base_y - 20)))
+            items.append((empty_text, (x - empty_text.get_width()//2, base_y - 8)))
         else:
-            coin_color = (255, 200, 50)
-            border_color = (184, 134, 11)
-            highlight_color = (255, 255, 255, 150)
-        
-        display_count = min(coin_count, max_display_coins)
-        for i in range(display_count):
-            coin_y = base_y - i * coin_spacing
-            
-            # draw shadow of coins
-            shadow_rect = (x - coin_radius + 1, coin_y - coin_radius + 1, 
-                         coin_radius * 2, coin_radius * 2)
-            pygame.draw.ellipse(self.screen, (0, 0, 0, 100), shadow_rect)
-            
-            # draw coins
-            pygame.draw.circle(self.screen, coin_color, (x, coin_y), coin_radius)
-            pygame.draw.circle(self.screen, border_color, (x, coin_y), coin_radius, 2)
+            # position with coins
+            look = 'invalid' if not is_valid else 'selected' if is_selected else 'normal'
+            display_count = min(coin_count, MAX_DISPLAY_COINS)
+            width, height, center_y = _coin_stack_geometry(display_count)
+            items.append(sprite_atlas.item(('tc_coins', display_count, look), (width, height),
+                                           lambda surface: _build_coin_stack_sprite(surface, display_count, look),
+                                           (x - COIN_RADIUS - COIN_SPRITE_MARGIN, base_y - center_y)))
             
-            # add high light
-            highlight_pos = (x - coin_radius//2, coin_y - coin_radius//2)
-            pygame.draw.circle(self.screen, highlight_color, highlight_pos, coin_radius//3)
-        
-        # if too much coin, display number
-        if coin_count > max_display_coins:
-            count_color = TEXT_COLOR if is_valid else (100, 100, 110)
-            count_text = self.font_manager.small.render(f"+{coin_count - max_display_coins}", 
-                                                      True, count_color)
-            self.screen.blit(count_text, 
-                           (x - count_text.get_width()//2, 
-                            base_y - (display_count * coin_spacing) - 15))
-        
-        # high light chosen position
-        if is_selected:
-            highlight_height = 60 if coin_count == 0 else 50
-            highlight_y = base_y - (display_count * coin_spacing) - 25
-            highlight_rect = pygame.Rect(x - 25, highlight_y, 50, highlight_height)
+            # if too much coin, display number
+            if coin_count > MAX_DISPLAY_COINS:
+                count_color = TEXT_COLOR if is_valid else (100, 100, 110)
+                count_text = text_cache.render(self.font_manager.small, f"+{coin_count - MAX_DISPLAY_COINS}", 
+                                                          True, count_color)
+                items.append((count_text, 
+                              (x - count_text.get_width()//2, 
+                               base_y - (display_count * COIN_SPACING) - 15)))
             
-            if is_valid:
-                pygame.draw.rect(self.screen, HIGHLIGHT_COLOR, highlight_rect, 3, border_radius=8)
-            else:
-                pygame.draw.rect(self.screen, LOSE_COLOR, highlight_rect, 3, border_radius=8)
+            # high light chosen position
+            if is_selected:
+                highlight_y = base_y - (display_count * COIN_SPACING) - 25
+                items.append(sprite_atlas.item(('tc_frame', is_valid), (50, 50),
+                                               lambda surface: _build_frame_sprite(surface, is_valid),
+                                               (x - 25, highlight_y)))
+        
+        if batch is None:
+            self.screen.blits(items, doreturn=False)
     
     def draw_control_panel(self, buttons, game_logic):
         """Draw control panel"""
@@ -288,8 +330,8 @@ class TakeCoinsUI:
             status = "Select a position"
             status_color = TEXT_COLOR
         
-        pos_text = self.font_manager.medium.render(pos_display, True, TEXT_COLOR)
-        status_text = self.font_manager.small.render(status, True, status_color)
+        pos_text = text_cache.render(self.font_manager.medium, pos_display, True, TEXT_COLOR)
+        status_text = text_cache.render(self.font_manager.small, status, True, status_color)
         
         self.screen.blit(pos_text, (SCREEN_WIDTH//2 - pos_text.get_width()//2, control_y + 20))
         self.screen.blit(status_text, (SCREEN_WIDTH//2 - status_text.get_width()//2, control_y + 50))
@@ -311,7 +353,7 @@ class TakeCoinsUI:
         ]
 
         for i, hint in enumerate(hints):
-            hint_text = self.font_manager.small.render(hint, True, (150, 170, 190))
+            hint_text = text_cache.render(self.font_manager.small, hint, True, (150, 170, 190))
             self.screen.blit(hint_text, (SCREEN_WIDTH//2 - hint_text.get_width()//2, hint_y + i * 20))
     
     def create_buttons(self):
@@ -441,7 +483,7 @@ class TakeCoinsUI:
         pygame.draw.rect(self.screen, (100, 180, 255), tooltip_rect, 2, border_radius=8)
         
         # Draw title
-        title = self.font_manager.medium.render("Winning Hint", True, (100, 200, 255))
+        title = text_cache.render(self.font_manager.medium, "Winning Hint", True, (100, 200, 255))
         title_x = tooltip_x + (tooltip_width - title.get_width()) // 2
         self.screen.blit(title, (title_x, tooltip_y + padding))
         
@@ -452,7 +494,7 @@ class TakeCoinsUI:
         
         # Draw text lines
         for i, line in enumerate(lines):
-            line_text = self.font_manager.small.render(line, True, (220, 240, 255))
+            line_text = text_cache.render(self.font_manager.small, line, True, (220, 240, 255))
             self.screen.blit(line_text, (tooltip_x + padding, 
                                        tooltip_y + padding + title.get_height() + 10 + i * line_height))
     
@@ -488,7 +530,7 @@ class TakeCoinsUI:
         pygame.draw.rect(self.screen, (100, 180, 255), self.hint_window_rect, 2, border_radius=10)
         
         # Draw window title
-        title_text = self.font_manager.medium.render("Winning Hint", True, (100, 200, 255))
+        title_text = text_cache.render(self.font_manager.medium, "Winning Hint", True, (100, 200, 255))
         title_rect = title_text.get_rect(center=(window_x + window_width//2, window_y + 25))
         self.screen.blit(title_text, title_rect)
         
@@ -517,15 +559,15 @@ class TakeCoinsUI:
                     self.hovered = False
                 
                 def update_hover(self, mouse_pos):
-                    self.hovered = self.rect.collidepoint(mouse_pos)
+                    render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos))
                 
                 def draw(self, screen):
                     color = (255, 100, 100) if self.hovered else (200, 80, 80)
                     pygame.draw.rect(screen, color, self.rect, border_radius=4)
                     pygame.draw.rect(screen, (255, 200, 200), self.rect, 1, border_radius=4)
                     
-                    font = pygame.font.SysFont('Arial', 20, bold=True)
-                    text_surface = font.render(self.text, True, (255, 255, 255))
+                    font = resource_cache.get_sys_font('Arial', 20, bold=True)
+                    text_surface = text_cache.render(font, self.text, True, (255, 255, 255))
                     text_rect = text_surface.get_rect(center=self.rect.center)
                     screen.blit(text_surface, text_rect)
             
@@ -662,14 +704,14 @@ class ScrollButton:
         
         # Draw arrow
         arrow_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        arrow_font = pygame.font.SysFont('Arial', 20, bold=True)
-        arrow_text = arrow_font.render(self.text, True, arrow_color)
+        arrow_font = resource_cache.get_sys_font('Arial', 20, bold=True)
+        arrow_text = text_cache.render(arrow_font, self.text, True, arrow_color)
         arrow_rect = arrow_text.get_rect(center=self.rect.center)
         surface.blit(arrow_text, arrow_rect)
     
     def update_hover(self, mouse_pos):
         """Update hover state"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """Check if button was clicked"""
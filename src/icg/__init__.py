@@ -0,0 +1,3 @@
+"""
+Headless command-line tools for ICG Games (run from src/, e.g. ``python -m icg.simulate``)
+"""
@@ -0,0 +1,81 @@
+"""
+Opening book generator
+
+Solves the PvE start positions offline and writes them to the memory-mapped
+books under assets/tables, so starting a game is a table lookup.
+
+    python -m icg.build_books --game take_coins --samples 1024
+"""
+
+import argparse
+import sys
+import time
+
+from utils.constants import DIFFICULTY_POSITION_RANGES_FOR_DAWSON_KAYLES
+from utils.opening_book import forget_book, get_book, write_book
+
+# Take Coins PvE board lengths (TakeCoinsLogic.initialize_game)
+TAKE_COINS_LENGTHS = range(8, 15)
+# Subtract Factor PvE starting values (SubtractFactorLogic.initialize_game)
+SUBTRACT_FACTOR_RANGE = (120, 500)
+
+
+def build_dawson_kayles(args):
+    from games.dawson_kayles import solver
+    max_towers = max(high for _, high in DIFFICULTY_POSITION_RANGES_FOR_DAWSON_KAYLES.values())
+    groups = solver.dawson_kayles_solver.build_book(max_towers)
+    return solver.BOOK_PATH, solver.BOOK_FORMAT, groups
+
+
+def build_take_coins(args):
+    from games.take_coins import solver
+    groups = solver.take_coins_solver.build_book(TAKE_COINS_LENGTHS, args.samples, args.seed,
+                                                 progress=print)
+    return solver.BOOK_PATH, solver.BOOK_FORMAT, groups
+
+
+def build_subtract_factor(args):
+    from games.subtract_factor import solver
+    from games.subtract_factor.logic import SubtractFactorLogic
+    groups = solver.subtract_factor_solver.build_book(*SUBTRACT_FACTOR_RANGE,
+                                                      SubtractFactorLogic()._threshold_range)
+    return solver.BOOK_PATH, solver.BOOK_FORMAT, groups
+
+
+BUILDERS = {
+    'dawson_kayles': build_dawson_kayles,
+    'take_coins': build_take_coins,
+    'subtract_factor': build_subtract_factor,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m icg.build_books", description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--game', choices=sorted(BUILDERS), action='append',
+                        help="book to rebuild (repeatable; default: all)")
+    parser.add_argument('--samples', type=int, default=1024,
+                        help="Take Coins boards solved per length too long to enumerate")
+    parser.add_argument('--seed', type=int, default=0, help="Take Coins sampling seed")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    for game in args.game or sorted(BUILDERS):
+        started = time.perf_counter()
+        path, record_format, groups = BUILDERS[game](args)
+        forget_book(path)
+        write_book(path, record_format, groups)
+
+        book = get_book(path)
+        if book is None:
+            print(f"❌ {game}: could not read back {path}")
+            return 1
+        stats = book.get_stats()
+        print(f"✅ {game}: {stats['records']} positions ({stats['winning']} winning) "
+              f"in {stats['bytes']} bytes, {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
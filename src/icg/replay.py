@@ -0,0 +1,88 @@
+"""
+Fast-forward replayer for recorded games
+
+Re-executes replay logs headlessly, checks that every recorded AI decision is
+reproduced under its seed and that each game ends with the recorded winner,
+and lists the slowest AI positions.
+
+    python -m icg.replay ../replays --slowest 10
+"""
+
+import argparse
+import heapq
+import sys
+import time
+from typing import List
+
+from core.engine import iter_log_files, read_logs, replay_log
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m icg.replay", description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help="replay .jsonl files or directories of them")
+    parser.add_argument('--game', help="only replay this game id")
+    parser.add_argument('--no-verify', action='store_true',
+                        help="apply the recorded moves without re-running the AI")
+    parser.add_argument('--slowest', type=int, default=0,
+                        help="list the N slowest AI decisions")
+    parser.add_argument('--max-failures', type=int, default=20,
+                        help="failing games to describe in detail")
+    return parser.parse_args(argv)
+
+
+def describe_failure(result) -> List[str]:
+    """Readable lines for a game that did not replay cleanly"""
+    log = result.log
+    lines = [f"✗ {log.game} seed={log.seed} ({log.source})"]
+    for ply, move, ai_position in result.ai_mismatches:
+        lines.append(f"    ply {ply}: recorded AI move {move}, replayed AI reached {ai_position}")
+    if result.illegal_ply is not None:
+        lines.append(f"    ply {result.illegal_ply}: recorded move is illegal on replay")
+    if log.finished and result.winner != log.winner:
+        lines.append(f"    winner: recorded seat {log.winner}, replay seat {result.winner}")
+    return lines
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    games = plies = ai_checked = failures = 0
+    slowest = []  # min-heap of (seconds, game, source, ply, position)
+
+    started = time.perf_counter()
+    for path in iter_log_files(args.paths):
+        for log in read_logs(path):
+            if args.game and log.game != args.game:
+                continue
+            result = replay_log(log, verify_ai=not args.no_verify)
+            games += 1
+            plies += result.plies
+            ai_checked += result.ai_checked
+
+            if not result.ok:
+                failures += 1
+                if failures <= args.max_failures:
+                    print("\n".join(describe_failure(result)))
+
+            for seconds, ply, position in result.ai_timings:
+                entry = (seconds, log.game, log.source, ply, repr(position))
+                if len(slowest) < args.slowest:
+                    heapq.heappush(slowest, entry)
+                elif slowest and seconds > slowest[0][0]:
+                    heapq.heapreplace(slowest, entry)
+    elapsed = time.perf_counter() - started
+
+    print(f"Replayed {games} games ({plies} moves) in {elapsed:.2f}s "
+          f"({games / elapsed if elapsed > 0 else 0:.1f} games/s)")
+    if not args.no_verify:
+        print(f"AI decisions verified: {ai_checked}")
+    print(f"Games that diverged from their log: {failures}")
+
+    if slowest:
+        print("\nSlowest AI decisions:")
+        for seconds, game, source, ply, position in sorted(slowest, reverse=True):
+            print(f"  {seconds * 1000:8.3f}ms  {game} ply {ply}  {position}  ({source})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Batch self-play simulator
+
+Plays AI-vs-AI or AI-vs-random matches through the headless engines in a
+process pool, streams one record per game to JSONL or CSV and prints
+throughput, win rates and average game length.
+
+    python -m icg.simulate --game dawson_kayles --difficulty 3 --games 100000 --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.engine import ENGINES, create_engine
+
+RESULT_FIELDS = ['index', 'seed', 'game', 'difficulty', 'opponent', 'mode',
+                 'winner', 'plies', 'start', 'duration_ms']
+
+# Safety net against a game that never terminates
+MAX_PLIES = 10000
+
+
+def choose_move(engine, player: str, difficulty: int) -> Any:
+    """Move for the side to move: the game's AI (with a legal fallback) or a random move"""
+    if player == 'ai':
+        move = engine.ai_move(difficulty)
+        if move is not None and move in engine.legal_moves():
+            return move
+    return engine.random_move()
+
+
+def play_game(game_id: str, difficulty: int, opponent: str, mode: str,
+              index: int, seed: int) -> Dict[str, Any]:
+    """Play one game; seat 0 is the AI, seat 1 is `opponent`"""
+    started = time.perf_counter()
+    random.seed(seed)
+    engine = create_engine(game_id, difficulty, mode)
+    start = engine.position()
+    players = ('ai', opponent)
+
+    while not engine.is_terminal() and engine.ply() < MAX_PLIES:
+        move = choose_move(engine, players[engine.to_move()], difficulty)
+        if move is None or not engine.apply(move):
+            break
+
+    return {
+        'index': index,
+        'seed': seed,
+        'game': game_id,
+        'difficulty': difficulty,
+        'opponent': opponent,
+        'mode': mode,
+        'winner': engine.outcome(),
+        'plies': engine.ply(),
+        'start': json.dumps(start),
+        'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+    }
+
+
+def _play_chunk(args) -> List[Dict[str, Any]]:
+    """Pool worker: play a contiguous block of games"""
+    game_id, difficulty, opponent, mode, base_seed, first, count = args
+    return [play_game(game_id, difficulty, opponent, mode, index, base_seed + index)
+            for index in range(first, first + count)]
+
+
+def iter_results(game_id: str, difficulty: int, opponent: str, mode: str, games: int,
+                 workers: int, seed: int, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield results as chunks finish (in completion order)"""
+    chunks = [(game_id, difficulty, opponent, mode, seed, first, min(chunk_size, games - first))
+              for first in range(0, games, chunk_size)]
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _play_chunk(chunk)
+        return
+    with Pool(workers) as pool:
+        for results in pool.imap_unordered(_play_chunk, chunks):
+            yield from results
+
+
+class ResultWriter:
+    """Streams per-game records to a .jsonl or .csv file (or nowhere)"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._file = None
+        self._csv = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            if path.lower().endswith('.csv'):
+                self._csv = csv.DictWriter(self._file, fieldnames=RESULT_FIELDS)
+                self._csv.writeheader()
+
+    def write(self, result: Dict[str, Any]):
+        if self._file is None:
+            return
+        if self._csv is not None:
+            self._csv.writerow(result)
+        else:
+            self._file.write(json.dumps(result) + '\n')
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def summarize(results_count: int, wins: List[int], unfinished: int, total_plies: int,
+              elapsed: float) -> str:
+    """Human-readable summary of a run"""
+    lines = [f"Games played: {results_count} in {elapsed:.2f}s "
+             f"({results_count / elapsed if elapsed > 0 else 0:.1f} games/s)"]
+    if results_count:
+        lines.append(f"AI (first player) win rate: {wins[0] / results_count:.2%}")
+        lines.append(f"Opponent win rate: {wins[1] / results_count:.2%}")
+        if unfinished:
+            lines.append(f"Unfinished games: {unfinished}")
+        lines.append(f"Average game length: {total_plies / results_count:.2f} moves")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m icg.simulate", description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--game', required=True, choices=sorted(ENGINES))
+    parser.add_argument('--difficulty', type=int, default=3, choices=[1, 2, 3, 4])
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--opponent', choices=['ai', 'random'], default='ai',
+                        help="who plays the second seat (the first seat is always the AI)")
+    parser.add_argument('--mode', choices=['PVE', 'PVP'], default='PVE',
+                        help="start positions: PVE deals the first player a winning position")
+    parser.add_argument('--seed', type=int, default=0, help="game i is seeded with seed + i")
+    parser.add_argument('--chunk-size', type=int, default=250)
+    parser.add_argument('--output', help="stream per-game results to a .jsonl or .csv file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    writer = ResultWriter(args.output)
+    wins = [0, 0]
+    unfinished = 0
+    total_plies = 0
+    count = 0
+
+    started = time.perf_counter()
+    try:
+        for result in iter_results(args.game, args.difficulty, args.opponent, args.mode,
+                                   args.games, args.workers, args.seed, max(1, args.chunk_size)):
+            writer.write(result)
+            count += 1
+            total_plies += result['plies']
+            if result['winner'] is None:
+                unfinished += 1
+            else:
+                wins[result['winner']] += 1
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+
+    print(summarize(count, wins, unfinished, total_plies, elapsed))
+    if args.output:
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -170,6 +170,18 @@ def initialize_performance_monitoring():
         print(f"⚠️ Performance modules not available: {e}")
         return False
 
+def initialize_replay_recording():
+    """Record every game to replays/ when the record_replays preference is on"""
+    try:
+        from utils.config_manager import config_manager
+        from utils.replay_recorder import replay_recorder
+
+        if config_manager.get_user_preferences().record_replays:
+            replay_recorder.enable()
+            print(f"✅ Replay recording enabled ({replay_recorder.directory}/)")
+    except Exception as e:
+        print(f"⚠️ Replay recording not available: {e}")
+
 def check_font_support(font_manager):
     """检查字体支持情况"""
     test_chars = ['\n', '\t', '→', '←', '↑', '↓']
@@ -216,6 +228,7 @@ def main():
         
         # Initialize performance monitoring
         perf_monitoring_available = initialize_performance_monitoring()
+        initialize_replay_recording()
         
         # Register games
         if not register_games():
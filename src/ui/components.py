@@ -4,6 +4,7 @@ Additional UI components
 
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class CardPosition:
     """Represents a card position with a stack of cards"""
@@ -53,7 +54,7 @@ class CardPosition:
                                 border_radius=2)
             
             # Display card count with background
-            count_text = self.font_manager.medium.render(str(self.card_count), True, TEXT_COLOR)
+            count_text = text_cache.render(self.font_manager.medium, str(self.card_count), True, TEXT_COLOR)
             count_bg = pygame.Rect(x - 20, y - CARD_HEIGHT//2 - 15, 40, 30)
             pygame.draw.rect(surface, SHADOW_COLOR, count_bg.move(2, 2), border_radius=8)
             pygame.draw.rect(surface, (40, 60, 80), count_bg, border_radius=8)
@@ -65,7 +66,7 @@ class CardPosition:
                                CARD_WIDTH + 20, CARD_HEIGHT + 80)
         
         # Draw position number with background
-        pos_text = self.font_manager.small.render(f"Pos {self.index + 1}", True, TEXT_COLOR)
+        pos_text = text_cache.render(self.font_manager.small, f"Pos {self.index + 1}", True, TEXT_COLOR)
         pos_bg = pygame.Rect(x - pos_text.get_width()//2 - 6, y + 45,
                             pos_text.get_width() + 12, pos_text.get_height() + 6)
         pygame.draw.rect(surface, SHADOW_COLOR, pos_bg.move(2, 2), border_radius=6)
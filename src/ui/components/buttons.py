@@ -8,6 +8,9 @@ from abc import ABC, abstractmethod
 from utils.constants import *
 from utils.icon_renderer import IconRenderer
 from utils.font_helper import FontHelper
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.optimization_tools import render_optimizer
 
 class BaseButton(ABC):
     """Base button class"""
@@ -28,7 +31,7 @@ class BaseButton(ABC):
     
     def update_hover(self, mouse_pos):
         """Update hover state based on mouse position"""
-        self.hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos) and self.enabled)
     
     def is_clicked(self, event):
         """Check if button was clicked"""
@@ -44,8 +47,8 @@ class BaseButton(ABC):
         
         self.tooltip_timer += 1
         if self.tooltip_timer > 20:  # Show after 0.5 seconds
-            tooltip_font = pygame.font.SysFont('Arial', 14)
-            tooltip_text = tooltip_font.render(self.tooltip, True, (255, 255, 255))
+            tooltip_font = resource_cache.get_sys_font('Arial', 14)
+            tooltip_text = text_cache.render(tooltip_font, self.tooltip, True, (255, 255, 255))
             tooltip_rect = tooltip_text.get_rect()
             
             tooltip_x = self.rect.centerx - tooltip_rect.width // 2
@@ -158,7 +161,7 @@ class GameButton(BaseButton):
             # 如果是字体对象，计算小号字体
             small_font = pygame.font.Font(None, 20)  # 创建小号字体
         else:
-            small_font = pygame.font.SysFont(None, 20)
+            small_font = resource_cache.get_sys_font(None, 20)
 
         # Calculate positions
         total_height = self.icon_surface.get_height() + small_font.get_height() + 5
@@ -170,14 +173,14 @@ class GameButton(BaseButton):
 
         # Draw text
         text_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        text_surface = small_font.render(self.text, True, text_color)
+        text_surface = text_cache.render(small_font, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=(self.rect.centerx, 
                                                 icon_y + self.icon_surface.get_height() + 
                                                 small_font.get_height()//2 + 5))
 
         # Text shadow
         if self.enabled:
-            shadow_surface = small_font.render(self.text, True, (0, 0, 0, 100))
+            shadow_surface = text_cache.render(small_font, self.text, True, (0, 0, 0, 100))
             shadow_rect = text_rect.move(1, 1)
             surface.blit(shadow_surface, shadow_rect)
 
@@ -205,14 +208,14 @@ class GameButton(BaseButton):
             font = self.font_manager
         else:
             # 回退到系统字体
-            font = pygame.font.SysFont(None, 32)
+            font = resource_cache.get_sys_font(None, 32)
 
-        text_surface = font.render(self.text, True, text_color)
+        text_surface = text_cache.render(font, self.text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
 
         # Text shadow
         if self.enabled:
-            shadow_surface = font.render(self.text, True, (0, 0, 0, 100))
+            shadow_surface = text_cache.render(font, self.text, True, (0, 0, 0, 100))
             shadow_rect = text_rect.move(2, 2)
             surface.blit(shadow_surface, shadow_rect)
 
@@ -371,11 +374,11 @@ class IconButton(GameButton):
         
         for i, line in enumerate(lines):
             text_color = (255, 255, 255) if self.enabled else (180, 180, 180)
-            text_surface = self.font_manager.small.render(line, True, text_color)
+            text_surface = text_cache.render(self.font_manager.small, line, True, text_color)
             text_rect = text_surface.get_rect(center=(self.rect.centerx, start_y + i * 18))
             
             if self.enabled:
-                shadow_surface = self.font_manager.small.render(line, True, (0, 0, 0, 150))
+                shadow_surface = text_cache.render(self.font_manager.small, line, True, (0, 0, 0, 150))
                 shadow_rect = text_rect.move(1, 1)
                 surface.blit(shadow_surface, shadow_rect)
             
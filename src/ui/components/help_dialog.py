@@ -8,6 +8,7 @@ from .scrollables import ScrollablePanel
 from .buttons import GameButton
 from utils.constants import *
 from utils.game_help_content import get_game_help, get_controls_help
+from utils.text_cache import text_cache
 
 class HelpDialog:
     """Help dialog with full keyboard navigation support"""
@@ -495,7 +496,7 @@ class HelpDialog:
                         2, border_radius=15)
         
         # Title
-        title = self.font_manager.large.render("Game Help & Guide", True, (220, 220, 255))
+        title = text_cache.render(self.font_manager.large, "Game Help & Guide", True, (220, 220, 255))
         screen.blit(title, (self.x + 20, self.y + 30))
         
         # Draw tab buttons with keyboard highlight
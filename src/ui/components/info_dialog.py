@@ -4,6 +4,7 @@ Information Dialog Component
 
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class InfoDialog:
     """Game instructions dialog"""
@@ -125,7 +126,7 @@ class InfoDialog:
         pygame.draw.rect(self.screen, (45, 55, 75), header_rect, border_top_left_radius=15, border_top_right_radius=15)
         
         # Draw title
-        title = self.font_manager.large.render(f"{self.game_name} - Instructions", True, TEXT_COLOR)
+        title = text_cache.render(self.font_manager.large, f"{self.game_name} - Instructions", True, TEXT_COLOR)
         title_rect = title.get_rect(center=(self.rect.centerx, self.rect.top + 30))
         self.screen.blit(title, title_rect)
         
@@ -180,7 +181,7 @@ class InfoDialog:
             # Draw each line
             for line in lines:
                 if y < content_rect.bottom and y > self.rect.top + 80 - 30:
-                    text_surface = self.font_manager.small.render(line, True, (220, 230, 240))
+                    text_surface = text_cache.render(self.font_manager.small, line, True, (220, 230, 240))
                     text_rect = text_surface.get_rect(topleft=(content_rect.left + 10, y))
                     self.screen.blit(text_surface, text_rect)
                 y += 25
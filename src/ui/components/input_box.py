@@ -2,6 +2,8 @@
 
 import pygame
 from utils.constants import *
+from utils.optimization_tools import render_optimizer
+from utils.text_cache import text_cache
 
 class InputBox:
     """通用文本输入框组件"""
@@ -44,8 +46,8 @@ class InputBox:
         
         # 光标状态
         self.cursor_visible = True
-        self.cursor_timer = 0
-        self.cursor_blink_rate = 30  # 光标闪烁速度
+        self.cursor_timer = 0  # 上次切换的时间（毫秒）
+        self.cursor_blink_rate = 30  # 光标闪烁速度（按60帧计）
         
         # 文本渲染
         self.text_surface = None
@@ -204,17 +206,20 @@ class InputBox:
     
     def _update_text_surface(self):
         """更新文本表面"""
-        self.text_surface = self.font_manager.medium.render(
+        self.text_surface = text_cache.render(self.font_manager.medium,
             self.value, True, self.text_color
         )
     
     def update(self):
         """更新状态（光标闪烁）"""
         if self.active:
-            self.cursor_timer += 1
-            if self.cursor_timer >= self.cursor_blink_rate:
-                self.cursor_timer = 0
+            # 按时间闪烁，空闲时降低帧率也不会变慢
+            now = pygame.time.get_ticks()
+            if now - self.cursor_timer >= self.cursor_blink_rate * 1000 // 60:
+                self.cursor_timer = now
                 self.cursor_visible = not self.cursor_visible
+                # 只需重绘输入框区域
+                render_optimizer.mark_dirty(self.rect)
     
     def draw(self, screen):
         """绘制输入框"""
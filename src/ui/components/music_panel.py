@@ -6,6 +6,7 @@ Music Panel Component for Music Selection
 import pygame
 import os
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class MusicPanel:
     """Music selection panel overlay"""
@@ -166,12 +167,12 @@ class MusicPanel:
         pygame.draw.rect(self.screen, (30, 40, 60), header_rect, border_radius=15)
         
         # Panel title
-        title = self.font_manager.large.render("MUSIC SELECTION", True, (100, 200, 255))
+        title = text_cache.render(self.font_manager.large, "MUSIC SELECTION", True, (100, 200, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, self.panel_y + 30))
         self.screen.blit(title, title_rect)
         
         # Instructions
-        instructions = self.font_manager.small.render(
+        instructions = text_cache.render(self.font_manager.small,
             "Use UP/DOWN arrows to navigate, ENTER to select", 
             True, (180, 200, 220))
         inst_rect = instructions.get_rect(center=(SCREEN_WIDTH//2, self.panel_y + 70))
@@ -184,7 +185,7 @@ class MusicPanel:
         # Draw currently playing indicator
         current_music = self.music_manager.get_current_music()
         if current_music:
-            playing_text = self.font_manager.small.render(
+            playing_text = text_cache.render(self.font_manager.small,
                 f"Now Playing: {current_music['name']}", 
                 True, (100, 255, 100))
             playing_rect = playing_text.get_rect(center=(SCREEN_WIDTH//2, self.panel_y + self.panel_height - 30))
@@ -234,13 +235,13 @@ class MusicButton:
             
             # Music name
             name_font = self.font_manager.medium
-            name_text = name_font.render(self.music["name"], True, text_color)
+            name_text = text_cache.render(name_font, self.music["name"], True, text_color)
             name_rect = name_text.get_rect(left=self.rect.left + 10, centery=self.rect.centery - 8)
             surface.blit(name_text, name_rect)
             
             # Artist
             artist_font = self.font_manager.small
-            artist_text = artist_font.render(f"by {self.music['artist']}", True, text_color)
+            artist_text = text_cache.render(artist_font, f"by {self.music['artist']}", True, text_color)
             artist_rect = artist_text.get_rect(left=self.rect.left + 10, centery=self.rect.centery + 12)
             surface.blit(artist_text, artist_rect)
         else:
@@ -249,13 +250,13 @@ class MusicButton:
             
             # Music name (locked)
             name_font = self.font_manager.medium
-            name_text = name_font.render(self.music["name"], True, locked_color)
+            name_text = text_cache.render(name_font, self.music["name"], True, locked_color)
             name_rect = name_text.get_rect(left=self.rect.left + 10, centery=self.rect.centery - 8)
             surface.blit(name_text, name_rect)
             
             # Locked message
             locked_font = self.font_manager.small
-            locked_text = locked_font.render("Locked - Complete achievements to unlock", True, (200, 100, 100))
+            locked_text = text_cache.render(locked_font, "Locked - Complete achievements to unlock", True, (200, 100, 100))
             locked_rect = locked_text.get_rect(left=self.rect.left + 10, centery=self.rect.centery + 12)
             surface.blit(locked_text, locked_rect)
         
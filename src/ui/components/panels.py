@@ -5,6 +5,7 @@ UI Panel Components
 import pygame
 from abc import ABC, abstractmethod
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class Panel(ABC):
     """Base panel class"""
@@ -58,7 +59,7 @@ class InfoPanel(Panel):
         # Draw title
         if self.title:
             title_font = getattr(self.font_manager, 'large', self.font_manager.medium)
-            title_text = title_font.render(self.title, True, TEXT_COLOR)
+            title_text = text_cache.render(title_font, self.title, True, TEXT_COLOR)
             title_rect = title_text.get_rect(center=(self.rect.centerx, self.rect.top + 30))
             surface.blit(title_text, title_rect)
         
@@ -66,7 +67,7 @@ class InfoPanel(Panel):
         y_offset = self.rect.top + 60 if self.title else self.rect.top + 20
         for item in self.content:
             font = getattr(self.font_manager, item['font_size'], self.font_manager.small)
-            text_surface = font.render(item['text'], True, item['color'])
+            text_surface = text_cache.render(font, item['text'], True, item['color'])
             text_rect = text_surface.get_rect(midleft=(self.rect.left + 20, y_offset))
             surface.blit(text_surface, text_rect)
             y_offset += 25
@@ -103,14 +104,14 @@ class ControlPanel(Panel):
         
         # Draw title
         if self.title:
-            title_text = self.font_manager.medium.render(self.title, True, TEXT_COLOR)
+            title_text = text_cache.render(self.font_manager.medium, self.title, True, TEXT_COLOR)
             title_rect = title_text.get_rect(center=(self.rect.centerx, self.rect.top + 25))
             surface.blit(title_text, title_rect)
         
         # Draw labels
         for label in self.labels:
             font = getattr(self.font_manager, label['font_size'], self.font_manager.small)
-            text_surface = font.render(label['text'], True, label['color'])
+            text_surface = text_cache.render(font, label['text'], True, label['color'])
             surface.blit(text_surface, (label['x'], label['y']))
         
         # Draw buttons
@@ -3,6 +3,7 @@ Redeem CDKEY Dialog Component
 """
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class RedeemDialog:
     """Dialog for redeeming CDKEY"""
@@ -145,12 +146,12 @@ class RedeemDialog:
         pygame.draw.rect(self.screen, ACCENT_COLOR, dialog_rect, 2, border_radius=15)
         
         # Draw title
-        title = self.font_manager.large.render("Redeem CDKEY", True, (220, 220, 255))
+        title = text_cache.render(self.font_manager.large, "Redeem CDKEY", True, (220, 220, 255))
         title_rect = title.get_rect(center=(self.x + self.width // 2, self.y + 50))
         self.screen.blit(title, title_rect)
         
         # Draw instruction
-        instruction = self.font_manager.small.render("Input your CDKEY:", True, (180, 200, 220))
+        instruction = text_cache.render(self.font_manager.small, "Input your CDKEY:", True, (180, 200, 220))
         inst_rect = instruction.get_rect(center=(self.x + self.width // 2, self.y + 90))
         self.screen.blit(instruction, inst_rect)
         
@@ -161,7 +162,7 @@ class RedeemDialog:
         
         # Draw input text
         if self.input_text:
-            text_surface = self.font_manager.medium.render(self.input_text, True, (255, 255, 255))
+            text_surface = text_cache.render(self.font_manager.medium, self.input_text, True, (255, 255, 255))
             text_rect = text_surface.get_rect(midleft=(self.input_box.left + 10, self.input_box.centery))
             self.screen.blit(text_surface, text_rect)
         
@@ -183,13 +184,13 @@ class RedeemDialog:
         pygame.draw.rect(self.screen, submit_color, self.submit_button, border_radius=8)
         pygame.draw.rect(self.screen, ACCENT_COLOR, self.submit_button, 2, border_radius=8)
         
-        submit_text = self.font_manager.small.render("Submit", True, (255, 255, 255))
+        submit_text = text_cache.render(self.font_manager.small, "Submit", True, (255, 255, 255))
         submit_rect = submit_text.get_rect(center=self.submit_button.center)
         self.screen.blit(submit_text, submit_rect)
         
         # Draw message
         if self.message:
-            message_surface = self.font_manager.small.render(self.message, True, self.message_color)
+            message_surface = text_cache.render(self.font_manager.small, self.message, True, self.message_color)
             message_rect = message_surface.get_rect(center=(self.x + self.width // 2, self.y + 230))
             self.screen.blit(message_surface, message_rect)
         
@@ -4,6 +4,7 @@ Scrollable UI Components
 
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class ScrollableList:
     """Scrollable list component"""
@@ -383,7 +384,7 @@ class ScrollablePanel:
                 else:
                     # 绘制文本行
                     font = self._get_font(line['font_size'])
-                    text_surface = font.render(line['text'], True, line['color'])
+                    text_surface = text_cache.render(font, line['text'], True, line['color'])
                     
                     if line['centered']:
                         text_x = self.rect.x + (self.rect.width - text_surface.get_width()) // 2
@@ -6,6 +6,7 @@ import pygame
 import webbrowser
 from utils.constants import *
 from utils.config_manager import config_manager
+from utils.text_cache import text_cache
 
 class SettingsPanel:
     """Settings panel overlay for game configuration"""
@@ -244,7 +245,7 @@ class SettingsPanel:
                         2, border_top_left_radius=15, border_top_right_radius=15)
         
         # Panel title
-        title = self.font_manager.large.render("SETTINGS", True, (0, 255, 220))
+        title = text_cache.render(self.font_manager.large, "SETTINGS", True, (0, 255, 220))
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, self.panel_y + 40))
         self.screen.blit(title, title_rect)
         
@@ -267,13 +268,13 @@ class SettingsPanel:
                         2, border_radius=8)
         
         # Button text
-        back_text = self.font_manager.small.render("Back", True, (255, 255, 255))
+        back_text = text_cache.render(self.font_manager.small, "Back", True, (255, 255, 255))
         text_rect = back_text.get_rect(center=self.back_button_rect.center)
         self.screen.blit(back_text, text_rect)
         
         # Tooltip on hover
         if is_hovered:
-            tooltip = self.font_manager.small.render("Return to sidebar", 
+            tooltip = text_cache.render(self.font_manager.small, "Return to sidebar", 
                                                     True, (200, 220, 255))
             tooltip_rect = tooltip.get_rect(midleft=(self.back_button_rect.right + 10, 
                                                     self.back_button_rect.centery))
@@ -308,13 +309,13 @@ class SettingsPanel:
         
         for i, (label, description) in enumerate(zip(setting_labels, setting_descriptions)):
             # Label
-            label_text = self.font_manager.medium.render(label, True, (220, 240, 255))
+            label_text = text_cache.render(self.font_manager.medium, label, True, (220, 240, 255))
             label_x = self.panel_x + 40
             label_y = start_y + i * row_spacing
             self.screen.blit(label_text, (label_x, label_y))
             
             # Description
-            desc_text = self.font_manager.small.render(description, True, (150, 170, 190))
+            desc_text = text_cache.render(self.font_manager.small, description, True, (150, 170, 190))
             self.screen.blit(desc_text, (label_x, label_y + 30))
             
             # Draw button
@@ -339,13 +340,13 @@ class SettingsPanel:
         pygame.draw.rect(self.screen, (200, 255, 200), button_rect, 2, border_radius=8)
         
         # GO text
-        go_text = self.font_manager.small.render("GO", True, (255, 255, 255))
+        go_text = text_cache.render(self.font_manager.small, "GO", True, (255, 255, 255))
         go_rect = go_text.get_rect(center=button_rect.center)
         self.screen.blit(go_text, go_rect)
         
         # URL hint
         if is_hovered:
-            url_text = self.font_manager.small.render(self.sponsor_url, 
+            url_text = text_cache.render(self.font_manager.small, self.sponsor_url, 
                                                      True, (150, 200, 150))
             url_rect = url_text.get_rect(midright=(button_rect.right + 30, 
                                                  button_rect.centery - 40))
@@ -450,7 +451,7 @@ class ToggleButton:
         # Draw ON/OFF text
         state_text = "ON" if self.is_on else "OFF"
         text_color = (255, 255, 255)
-        text_surface = self.font_manager.small.render(state_text, True, text_color)
+        text_surface = text_cache.render(self.font_manager.small, state_text, True, text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
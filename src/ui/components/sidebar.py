@@ -4,6 +4,9 @@ Sidebar Component with toggle functionality
 
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
+from utils.optimization_tools import render_optimizer
 from ui.components.settings_panel import SettingsPanel
 from ui.components.music_panel import MusicPanel
 
@@ -32,6 +35,7 @@ class Sidebar:
             10, 20,  # x=10 向右移动了10像素，y=20 距离顶部20像素
             40, 40  # 增加了切换按钮大小
         )
+        self.hovered = False  # 鼠标停在切换按钮上（随鼠标移动事件更新）
 
         # Buttons (only visible when expanded)
         self.buttons = []
@@ -207,6 +211,8 @@ class Sidebar:
         if event.type == pygame.MOUSEMOTION:
             for button in self.buttons:
                 button.update_hover(mouse_pos)
+            render_optimizer.set_hovered(self, self.toggle_button_rect.collidepoint(mouse_pos),
+                                         self.toggle_button_rect)
 
         return None
     
@@ -236,8 +242,8 @@ class Sidebar:
                 
                 # Draw sidebar title
                 if self.current_width >= 120:
-                    title_font = pygame.font.SysFont('Arial', 18, bold=True)
-                    title_text = title_font.render("NAVIGATION", True, ACCENT_COLOR)
+                    title_font = resource_cache.get_sys_font('Arial', 18, bold=True)
+                    title_text = text_cache.render(title_font, "NAVIGATION", True, ACCENT_COLOR)
                     title_rect = title_text.get_rect(center=(self.current_width // 2, 50))
                     self.screen.blit(title_text, title_rect)
         
@@ -246,8 +252,7 @@ class Sidebar:
     def _draw_toggle_button(self):
         """Draw the toggle button"""
         # Button background (always display)
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovered = self.toggle_button_rect.collidepoint(mouse_pos)
+        is_hovered = self.hovered
         
         # Button background with shadow effect
         if is_hovered:
@@ -339,7 +344,7 @@ class SidebarButton:
     
     def update_hover(self, mouse_pos):
         """Update hover state"""
-        self.hovered = self.visible and self.rect.collidepoint(mouse_pos)
+        render_optimizer.set_hovered(self, self.visible and self.rect.collidepoint(mouse_pos))
     
     def is_clicked(self, event):
         """Check if button was clicked"""
@@ -373,9 +378,9 @@ class SidebarButton:
 
         text_surface = None
         if hasattr(self.font_manager, 'medium'):
-            text_surface = self.font_manager.medium.render(self.display_text, True, text_color)
+            text_surface = text_cache.render(self.font_manager.medium, self.display_text, True, text_color)
         else:
-            text_surface = pygame.font.SysFont('Arial', 18, bold=True).render(self.display_text, True, text_color)
+            text_surface = text_cache.render(resource_cache.get_sys_font('Arial', 18, bold=True), self.display_text, True, text_color)
 
         if text_surface is not None:
             text_rect = text_surface.get_rect(center=self.rect.center)
@@ -384,9 +389,9 @@ class SidebarButton:
                 shadow_color = (50, 70, 100)
                 shadow_surface = None
                 if hasattr(self.font_manager, 'medium'):
-                    shadow_surface = self.font_manager.medium.render(self.display_text, True, shadow_color)
+                    shadow_surface = text_cache.render(self.font_manager.medium, self.display_text, True, shadow_color)
                 else:
-                    shadow_surface = pygame.font.SysFont('Arial', 18, bold=True).render(self.display_text, True, shadow_color)
+                    shadow_surface = text_cache.render(resource_cache.get_sys_font('Arial', 18, bold=True), self.display_text, True, shadow_color)
 
                 if shadow_surface is not None:
                     shadow_rect = text_rect.move(1, 1)
@@ -401,8 +406,8 @@ class SidebarButton:
         
         self.tooltip_timer += 1
         if self.tooltip_timer > 20:  # Show after 0.5 seconds
-            tooltip_font = pygame.font.SysFont('Arial', 14)
-            tooltip_text = tooltip_font.render(self.tooltip, True, (255, 255, 255))
+            tooltip_font = resource_cache.get_sys_font('Arial', 14)
+            tooltip_text = text_cache.render(tooltip_font, self.tooltip, True, (255, 255, 255))
             tooltip_rect = tooltip_text.get_rect()
             
             tooltip_x = self.rect.right + 10
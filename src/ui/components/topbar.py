@@ -5,6 +5,7 @@ TopBar Component for Main Menu
 
 import pygame
 from utils.constants import *
+from utils.text_cache import text_cache
 
 class TopBar:
     """顶部工具栏，显示在主菜单左上角"""
@@ -101,14 +102,14 @@ class TopBar:
         self._draw_gear_icon(gear_center_x, gear_center_y)
         
         # 绘制"Settings"文字
-        settings_text = self.font_manager.small.render("Settings", True, (255, 255, 255))
+        settings_text = text_cache.render(self.font_manager.small, "Settings", True, (255, 255, 255))
         text_x = self.settings_button_rect.left + 45
         text_y = self.settings_button_rect.centery - settings_text.get_height() // 2
         self.screen.blit(settings_text, (text_x, text_y))
         
         # 悬停提示
         if is_hovered:
-            tooltip = self.font_manager.small.render("Game settings", True, (200, 220, 255))
+            tooltip = text_cache.render(self.font_manager.small, "Game settings", True, (200, 220, 255))
             tooltip_rect = tooltip.get_rect(midleft=(self.settings_button_rect.right + 10, 
                                                     self.settings_button_rect.centery))
             pygame.draw.rect(self.screen, (40, 50, 70), 
@@ -168,7 +169,7 @@ class TopBar:
         # 悬停提示
         if is_hovered:
             status = "ON" if (self.music_manager and self.music_manager.is_music_enabled()) else "OFF"
-            tooltip = self.font_manager.small.render(f"Click to toggle music ({status})", 
+            tooltip = text_cache.render(self.font_manager.small, f"Click to toggle music ({status})", 
                                                     True, (200, 220, 255))
             tooltip_rect = tooltip.get_rect(midleft=(self.music_indicator_rect.right + 10, 
                                                     self.music_indicator_rect.centery))
@@ -211,7 +212,7 @@ class TopBar:
     
     def _draw_title(self):
         """绘制标题"""
-        title_text = self.font_manager.large.render("ICG GAMES", True, (0, 200, 255))
+        title_text = text_cache.render(self.font_manager.large, "ICG GAMES", True, (0, 200, 255))
         title_x = SCREEN_WIDTH // 2 - title_text.get_width() // 2
         title_y = self.height // 2 - title_text.get_height() // 2
         self.screen.blit(title_text, (title_x, title_y))
\ No newline at end of file
@@ -13,8 +13,10 @@ from utils.constants import *
 from utils.helpers import FontManager
 from utils.error_handler import handle_game_errors, log_resource_error, error_reporter
 from utils.resource_cache import resource_cache
+from utils.background_layers import background_layers
 from utils.performance_monitor import performance_monitor, PerformanceProfiler
-from utils.optimization_tools import optimize_game_performance, memory_optimizer
+from utils.optimization_tools import optimize_game_performance, memory_optimizer, render_optimizer
+from utils.text_cache import text_cache
 from ui.components.help_dialog import HelpDialog
 from ui.components.settings_panel import SettingsPanel
 from ui.components.music_panel import MusicPanel
@@ -268,6 +270,7 @@ class MainMenu:
             self.perf_stats['cache_hits'] = cache_stats.get('cache_hits', 0)
             self.perf_stats['cache_misses'] = cache_stats.get('cache_misses', 0)
             self.perf_stats['cache_hit_rate'] = cache_stats.get('hit_rate', 0)
+            self.perf_stats['text_hit_rate'] = cache_stats.get('text_hit_rate', 0)
             
             # Get memory usage if available
             if hasattr(memory_optimizer, 'get_memory_usage_mb'):
@@ -287,26 +290,20 @@ class MainMenu:
         """Draw background with gradient effect"""
         # Start frame profiling
         with PerformanceProfiler("menu_draw_background", performance_monitor):
-            self.screen.fill(BACKGROUND_COLOR)
-            
-            # Subtle grid pattern (only if performance allows)
-            if self.perf_stats['fps'] > 45:  # Only draw grid if we have good FPS
-                for x in range(0, SCREEN_WIDTH, 40):
-                    pygame.draw.line(self.screen, (35, 45, 55), (x, 0), (x, SCREEN_HEIGHT), 1)
-                for y in range(0, SCREEN_HEIGHT, 40):
-                    pygame.draw.line(self.screen, (35, 45, 55), (0, y), (SCREEN_WIDTH, y), 1)
+            # The grid is a pre-rendered layer, so it costs one blit at any FPS
+            self.screen.blit(background_layers.grid(self.screen.get_size(), 40, (35, 45, 55), BACKGROUND_COLOR), (0, 0))
     
     @handle_game_errors
     def draw_title(self):
         """Draw game title"""
         with PerformanceProfiler("menu_draw_title", performance_monitor):
-            title = self.font_manager.large.render("ICG GAMES", True, TEXT_COLOR)
-            subtitle = self.font_manager.medium.render("Interactive Card Games", True, ACCENT_COLOR)
+            title = text_cache.render(self.font_manager.large, "ICG GAMES", True, TEXT_COLOR)
+            subtitle = text_cache.render(self.font_manager.medium, "Interactive Card Games", True, ACCENT_COLOR)
             
             # Only draw shadows if performance is good
             if self.perf_stats['fps'] > 40:
-                title_shadow = self.font_manager.large.render("ICG GAMES", True, SHADOW_COLOR)
-                subtitle_shadow = self.font_manager.medium.render("Interactive Card Games", True, SHADOW_COLOR)
+                title_shadow = text_cache.render(self.font_manager.large, "ICG GAMES", True, SHADOW_COLOR)
+                subtitle_shadow = text_cache.render(self.font_manager.medium, "Interactive Card Games", True, SHADOW_COLOR)
                 
                 self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 3, 83))
                 self.screen.blit(subtitle_shadow, (SCREEN_WIDTH//2 - subtitle.get_width()//2 + 2, 143))
@@ -521,21 +518,16 @@ class MainMenu:
     @handle_game_errors
     def draw_background(self):
         """Draw background with gradient effect"""
-        self.screen.fill(BACKGROUND_COLOR)
-        
-        # Subtle grid pattern
-        for x in range(0, SCREEN_WIDTH, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (x, 0), (x, SCREEN_HEIGHT), 1)
-        for y in range(0, SCREEN_HEIGHT, 40):
-            pygame.draw.line(self.screen, (35, 45, 55), (0, y), (SCREEN_WIDTH, y), 1)
+        # Subtle grid pattern, pre-rendered once as a static layer
+        self.screen.blit(background_layers.grid(self.screen.get_size(), 40, (35, 45, 55), BACKGROUND_COLOR), (0, 0))
     
     def draw_title(self):
         """Draw game title"""
-        title = self.font_manager.large.render("ICG GAMES", True, TEXT_COLOR)
-        subtitle = self.font_manager.medium.render("Interactive Card Games", True, ACCENT_COLOR)
+        title = text_cache.render(self.font_manager.large, "ICG GAMES", True, TEXT_COLOR)
+        subtitle = text_cache.render(self.font_manager.medium, "Interactive Card Games", True, ACCENT_COLOR)
         
-        title_shadow = self.font_manager.large.render("ICG GAMES", True, SHADOW_COLOR)
-        subtitle_shadow = self.font_manager.medium.render("Interactive Card Games", True, SHADOW_COLOR)
+        title_shadow = text_cache.render(self.font_manager.large, "ICG GAMES", True, SHADOW_COLOR)
+        subtitle_shadow = text_cache.render(self.font_manager.medium, "Interactive Card Games", True, SHADOW_COLOR)
         
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 3, 103))
         self.screen.blit(subtitle_shadow, (SCREEN_WIDTH//2 - subtitle.get_width()//2 + 2, 153))
@@ -581,14 +573,14 @@ class MainMenu:
         self.draw_error_message()
 
         # Draw footer
-        footer_text = self.font_manager.small.render(
+        footer_text = text_cache.render(self.font_manager.small,
             f"© 2025 ICG Games - Interactive Card Games Collection | S: Settings | H: Help | M: Music | ESC: Quit", 
             True, (150, 170, 190))
         self.screen.blit(footer_text, 
                         (SCREEN_WIDTH//2 - footer_text.get_width()//2, 
                          SCREEN_HEIGHT - 40))
 
-        pygame.display.flip()
+        render_optimizer.present()
     @handle_game_errors
     def draw_error_message(self):
         """Draw error message if any"""
@@ -619,13 +611,18 @@ class MainMenu:
             
             # Draw error text
             for i, line in enumerate(error_lines):
-                error_text = self.font_manager.small.render(line, True, (255, 255, 255, alpha))
+                error_text = text_cache.render(self.font_manager.small, line, True, (255, 255, 255, alpha))
                 text_rect = error_text.get_rect(center=(
                     error_bg.centerx,
                     error_bg.top + 15 + i * 25
                 ))
                 self.screen.blit(error_text, text_rect)
     
+    def tracks_pointer(self):
+        """True while a dialog or panel that draws its hover from the mouse position is open"""
+        return (self.help_dialog.visible or self.settings_panel.visible or
+                self.music_panel.visible or self.redeem_dialog.visible)
+    
     def run(self):
         """Run the main menu loop with error handling and performance monitoring"""
         self.running = True
@@ -641,6 +638,7 @@ class MainMenu:
         print("   M: Open music panel")
         print("   ESC: Exit")
         
+        render_optimizer.mark_dirty()
         while self.running:
             try:
                 # Start frame timing
@@ -649,10 +647,21 @@ class MainMenu:
                 # Update performance statistics
                 self.update_performance_stats()
                 
+                # Keys, clicks and window events redraw the menu; pointer motion
+                # only damages the buttons whose hover it changes
+                render_optimizer.mark_input(self.tracks_pointer())
+                
                 # Handle events
                 self.running = self.handle_events()
                 
+                # Idle menu: skip drawing and sleep until input arrives
+                if not render_optimizer.needs_redraw(self.error_timer > 0 or self.show_perf_overlay):
+                    performance_monitor.end_frame()
+                    render_optimizer.wait_for_input()
+                    continue
+                
                 # Draw
+                render_optimizer.begin_frame(self.screen)
                 self.draw()
                 
                 # End frame timing
@@ -782,12 +791,12 @@ class GameModeSelector:
             self.screen.fill((25, 25, 40))
             
             # Draw title
-            title = self.font_manager.large.render("Select Game Mode", True, (220, 220, 255))
+            title = text_cache.render(self.font_manager.large, "Select Game Mode", True, (220, 220, 255))
             title_rect = title.get_rect(center=(self.screen.get_width()//2, 100))
             self.screen.blit(title, title_rect)
             
             # Draw description
-            desc = self.font_manager.medium.render("Choose your preferred game mode", True, (180, 180, 200))
+            desc = text_cache.render(self.font_manager.medium, "Choose your preferred game mode", True, (180, 180, 200))
             desc_rect = desc.get_rect(center=(self.screen.get_width()//2, 150))
             self.screen.blit(desc, desc_rect)
             
@@ -800,11 +809,11 @@ class GameModeSelector:
             
             # Draw performance overlay if enabled
             if self.show_perf_overlay:
-                fps_text = self.font_manager.small.render(f"FPS: {pygame.time.Clock().get_fps():.1f}", 
+                fps_text = text_cache.render(self.font_manager.small, f"FPS: {pygame.time.Clock().get_fps():.1f}", 
                                                         True, (255, 255, 255))
                 self.screen.blit(fps_text, (self.screen.get_width() - 100, 10))
             
-            pygame.display.flip()
+            render_optimizer.present()
     
     def draw_difficulty_selection(self):
         """Draw the difficulty selection screen with performance optimization"""
@@ -812,7 +821,7 @@ class GameModeSelector:
             self.screen.fill((25, 25, 40))
             
             # Draw title
-            title = self.font_manager.large.render("Select Difficulty", True, (220, 220, 255))
+            title = text_cache.render(self.font_manager.large, "Select Difficulty", True, (220, 220, 255))
             title_rect = title.get_rect(center=(self.screen.get_width()//2, 100))
             self.screen.blit(title, title_rect)
             
@@ -825,11 +834,11 @@ class GameModeSelector:
             
             # Draw performance overlay if enabled
             if self.show_perf_overlay:
-                fps_text = self.font_manager.small.render(f"FPS: {pygame.time.Clock().get_fps():.1f}", 
+                fps_text = text_cache.render(self.font_manager.small, f"FPS: {pygame.time.Clock().get_fps():.1f}", 
                                                         True, (255, 255, 255))
                 self.screen.blit(fps_text, (self.screen.get_width() - 100, 10))
             
-            pygame.display.flip()
+            render_optimizer.present()
     
     def handle_mode_events(self):
         """Handle game mode selection events with performance monitoring"""
@@ -901,17 +910,28 @@ class GameModeSelector:
     def get_game_mode(self):
         """Run the game mode selector and return selected mode with performance monitoring"""
         clock = pygame.time.Clock()
+        render_optimizer.mark_dirty()
         
         while self.selected_mode is None:
             # Performance monitoring
             performance_monitor.start_frame()
             
+            # Keys, clicks and window events redraw the selector; pointer motion
+            # only damages the buttons whose hover it changes
+            render_optimizer.mark_input()
+            
             result = self.handle_mode_events()
             if result == "back":
                 return "back"
             elif not result:
                 return "PVE"
             
+            if not render_optimizer.needs_redraw(self.error_timer > 0 or self.show_perf_overlay):
+                performance_monitor.end_frame()
+                render_optimizer.wait_for_input()
+                continue
+            
+            render_optimizer.begin_frame(self.screen)
             self.draw_mode_selection()
             
             # End performance monitoring
@@ -926,17 +946,28 @@ class GameModeSelector:
             return None
             
         clock = pygame.time.Clock()
+        render_optimizer.mark_dirty()
         
         while self.selected_difficulty is None:
             # Performance monitoring
             performance_monitor.start_frame()
             
+            # Keys, clicks and window events redraw the selector; pointer motion
+            # only damages the buttons whose hover it changes
+            render_optimizer.mark_input()
+            
             result = self.handle_difficulty_events()
             if result == "back":
                 return "back"
             elif not result:
                 return 2
             
+            if not render_optimizer.needs_redraw(self.error_timer > 0 or self.show_perf_overlay):
+                performance_monitor.end_frame()
+                render_optimizer.wait_for_input()
+                continue
+            
+            render_optimizer.begin_frame(self.screen)
             self.draw_difficulty_selection()
             
             # End performance monitoring
@@ -963,7 +994,26 @@ class ModeButton:
         self._text_surface_needs_update = True
     
     def update_hover(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
+        render_optimizer.set_hovered(self, self.rect.collidepoint(mouse_pos), self.damage_rect())
+    
+    def _tooltip_layout(self):
+        """Rendered tooltip text, its position and its background rect"""
+        tooltip_font = resource_cache.get_sys_font('Arial', 14)
+        tooltip_text = text_cache.render(tooltip_font, self.tooltip, True, (255, 255, 255))
+        tooltip_rect = tooltip_text.get_rect()
+        
+        tooltip_x = self.rect.centerx - tooltip_rect.width // 2
+        tooltip_y = self.rect.top - tooltip_rect.height - 8
+        
+        tooltip_bg = pygame.Rect(tooltip_x - 6, tooltip_y - 4,
+                               tooltip_rect.width + 12, tooltip_rect.height + 8)
+        return tooltip_text, (tooltip_x, tooltip_y), tooltip_bg
+    
+    def damage_rect(self):
+        """Screen area the button can change: itself and its tooltip"""
+        if not self.tooltip:
+            return self.rect
+        return self.rect.union(self._tooltip_layout()[2])
     
     def draw(self, surface):
         with PerformanceProfiler("mode_button_draw", performance_monitor):
@@ -972,7 +1022,7 @@ class ModeButton:
             
             # Cache text surface for performance
             if self._text_surface_needs_update or self._text_surface is None:
-                self._text_surface = self.font_manager.large.render(self.text, True, (255, 255, 255))
+                self._text_surface = text_cache.render(self.font_manager.large, self.text, True, (255, 255, 255))
                 self._text_surface_needs_update = False
             
             text_rect = self._text_surface.get_rect(center=self.rect.center)
@@ -981,19 +1031,14 @@ class ModeButton:
             # Draw tooltip (only if performance allows)
             if self.hovered and self.tooltip and performance_monitor.get_performance_stats().get('fps', 60) > 30:
                 self.tooltip_timer += 1
-                if self.tooltip_timer > 30:
-                    tooltip_font = pygame.font.SysFont('Arial', 14)
-                    tooltip_text = tooltip_font.render(self.tooltip, True, (255, 255, 255))
-                    tooltip_rect = tooltip_text.get_rect()
-                    
-                    tooltip_x = self.rect.centerx - tooltip_rect.width // 2
-                    tooltip_y = self.rect.top - tooltip_rect.height - 8
-                    
-                    tooltip_bg = pygame.Rect(tooltip_x - 6, tooltip_y - 4,
-                                           tooltip_rect.width + 12, tooltip_rect.height + 8)
+                if self.tooltip_timer <= 30:
+                    # 等待显示期间没有输入，保持重绘按钮和提示区域以便计时继续
+                    render_optimizer.mark_dirty(self.damage_rect())
+                else:
+                    tooltip_text, tooltip_pos, tooltip_bg = self._tooltip_layout()
                     pygame.draw.rect(surface, (40, 40, 60), tooltip_bg, border_radius=6)
                     pygame.draw.rect(surface, ACCENT_COLOR, tooltip_bg, 1, border_radius=6)
-                    surface.blit(tooltip_text, (tooltip_x, tooltip_y))
+                    surface.blit(tooltip_text, tooltip_pos)
             else:
                 self.tooltip_timer = 0
 
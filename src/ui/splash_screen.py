@@ -8,6 +8,7 @@ import os
 import time
 import math
 import random
+from utils.text_cache import text_cache
 
 class PygameSplash:
     """Startup animation window using Pygame"""
@@ -76,12 +77,12 @@ class PygameSplash:
             small_font = pygame.font.Font(pygame.font.get_default_font(), 16)
         
         # Title
-        title_text = title_font.render("ICG Games", True, text_color)
+        title_text = text_cache.render(title_font, "ICG Games", True, text_color)
         title_rect = title_text.get_rect(center=(width//2, 60))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = subtitle_font.render("Impartial Combinatorial Games Collection", True, accent_color)
+        subtitle_text = text_cache.render(subtitle_font, "Impartial Combinatorial Games Collection", True, accent_color)
         subtitle_rect = subtitle_text.get_rect(center=(width//2, 100))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -114,7 +115,7 @@ class PygameSplash:
                     point_angle += math.pi * 2 / 3
                 
                 # Game name (gray)
-                name_text = small_font.render(name, True, gray_color)
+                name_text = text_cache.render(small_font, name, True, gray_color)
                 name_rect = name_text.get_rect(center=(x, icon_y + 40))
                 self.screen.blit(name_text, name_rect)
             else:
@@ -128,7 +129,7 @@ class PygameSplash:
                                (x - 2, icon_y + 4), (x + 8, icon_y - 8), 3)
                 
                 # Game name (green)
-                name_text = small_font.render(name, True, success_color)
+                name_text = text_cache.render(small_font, name, True, success_color)
                 name_rect = name_text.get_rect(center=(x, icon_y + 40))
                 self.screen.blit(name_text, name_rect)
         
@@ -152,24 +153,24 @@ class PygameSplash:
             pygame.draw.rect(self.screen, bar_color, (50, progress_y, bar_width, 20), border_radius=10)
         
         # Progress text
-        progress_text = status_font.render(f"Progress: {int(self.progress)}%", True, accent_color)
+        progress_text = text_cache.render(status_font, f"Progress: {int(self.progress)}%", True, accent_color)
         progress_rect = progress_text.get_rect(center=(width//2, progress_y + 35))
         self.screen.blit(progress_text, progress_rect)
         
         # Status text
-        status_text = status_font.render(self.status, True, text_color)
+        status_text = text_cache.render(status_font, self.status, True, text_color)
         status_rect = status_text.get_rect(center=(width//2, progress_y + 55))
         self.screen.blit(status_text, status_rect)
         
         # Bottom info
-        version_text = small_font.render("Version 1.0.0 | © 2025 ICG Games", True, gray_color)
+        version_text = text_cache.render(small_font, "Version 1.0.0 | © 2025 ICG Games", True, gray_color)
         self.screen.blit(version_text, (20, height - 40))
         
         # Loading tips
         tips = ["Optimizing game performance...", "Preparing game resources...", 
                 "Initializing AI opponent...", "Setting game rules..."]
         tip_index = int(self.animation_time * 0.5) % len(tips)
-        tip_text = small_font.render(f"Tip: {tips[tip_index]}", True, (149, 165, 166))
+        tip_text = text_cache.render(small_font, f"Tip: {tips[tip_index]}", True, (149, 165, 166))
         tip_rect = tip_text.get_rect(right=width - 20, bottom=height - 40)
         self.screen.blit(tip_text, tip_rect)
         
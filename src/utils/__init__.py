@@ -3,8 +3,6 @@ Utilities package
 """
 
 from .constants import *
-from .helpers import wrap_text, FontManager
-from .key_repeat import KeyRepeatManager
 from .config import GameConfig, ConfigManager
 from .error_handler import (
     GameError, ResourceError, LogicError, UIError,
@@ -12,26 +10,33 @@ from .error_handler import (
     error_reporter, log_resource_error, log_logic_error, 
     log_ui_error, log_warning
 )
-from .resource_cache import resource_cache
-from .config_manager import (
-    GameConfig as EnhancedGameConfig,
-    UserPreferences,
-    config_manager
-)
-from .performance_monitor import (
-    PerformanceMonitor,
-    PerformanceProfiler,
-    performance_monitor
-)
-from .optimization_tools import (
-    MemoryOptimizer,
-    RenderOptimizer,
-    AssetOptimizer,
-    memory_optimizer,
-    render_optimizer,
-    asset_optimizer,
-    optimize_game_performance
-)
+from .lazy_imports import install
+
+# pygame-backed helpers (and config_manager, which writes configs/ into the
+# working directory when created) are imported on first access (PEP 562), so
+# headless code such as core.engine can import utils.constants without side effects
+install(globals(), {
+    'EnhancedGameConfig': ('.config_manager', 'GameConfig'),
+    'UserPreferences': '.config_manager',
+    'config_manager': '.config_manager',
+    'wrap_text': '.helpers',
+    'FontManager': '.helpers',
+    'KeyRepeatManager': '.key_repeat',
+    'resource_cache': '.resource_cache',
+    'background_layers': '.background_layers',
+    'text_cache': '.text_cache',
+    'sprite_atlas': '.sprite_atlas',
+    'PerformanceMonitor': '.performance_monitor',
+    'PerformanceProfiler': '.performance_monitor',
+    'performance_monitor': '.performance_monitor',
+    'MemoryOptimizer': '.optimization_tools',
+    'RenderOptimizer': '.optimization_tools',
+    'AssetOptimizer': '.optimization_tools',
+    'memory_optimizer': '.optimization_tools',
+    'render_optimizer': '.optimization_tools',
+    'asset_optimizer': '.optimization_tools',
+    'optimize_game_performance': '.optimization_tools',
+})
 
 __all__ = [
     'wrap_text', 'FontManager', 'KeyRepeatManager',
@@ -40,7 +45,7 @@ __all__ = [
     'handle_game_errors', 'safe_execute',
     'error_reporter', 'log_resource_error', 'log_logic_error',
     'log_ui_error', 'log_warning',
-    'resource_cache',
+    'resource_cache', 'background_layers', 'text_cache', 'sprite_atlas',
     'EnhancedGameConfig', 'UserPreferences', 'config_manager',
     'PerformanceMonitor', 'PerformanceProfiler', 'performance_monitor',
     'MemoryOptimizer', 'RenderOptimizer', 'AssetOptimizer',
@@ -0,0 +1,69 @@
+"""
+Background layers - static screen art rendered once and blitted every frame
+
+Layers are keyed by name, size and the theme preference, so a resize or a
+theme change rebuilds them on next use instead of invalidating anything by hand.
+"""
+
+import pygame
+from typing import Callable, Dict, Tuple
+from utils.bounded_cache import BoundedCache
+from utils.config_manager import config_manager
+
+# Layers kept at once: every screen's backgrounds plus small sprites such as stars
+LAYER_CACHE_SIZE = 128
+
+
+class BackgroundLayers:
+    """Cache of pre-rendered background surfaces shared by all screens"""
+
+    def __init__(self, max_layers: int = LAYER_CACHE_SIZE):
+        self.layers = BoundedCache(max_layers)
+
+    def current_theme(self) -> str:
+        return config_manager.get_user_preferences().theme
+
+    def get(self, name: str, size: Tuple[int, int],
+            builder: Callable[[pygame.Surface], None], alpha: bool = False) -> pygame.Surface:
+        """The layer `name` at `size`, drawn by builder(surface) the first time it is needed"""
+        key = (name, tuple(size), alpha, self.current_theme())
+        layer = self.layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+            builder(layer)
+            self.layers.put(key, layer)
+        return layer
+
+    def grid(self, size: Tuple[int, int], spacing: int, color, background,
+             left: int = 0) -> pygame.Surface:
+        """Background fill with grid lines every `spacing` pixels from x = `left`"""
+        def build(surface):
+            width, height = surface.get_size()
+            surface.fill(background)
+            for x in range(left, width, spacing):
+                pygame.draw.line(surface, color, (x, 0), (x, height), 1)
+            for y in range(0, height, spacing):
+                pygame.draw.line(surface, color, (left, y), (width, y), 1)
+        return self.get(('grid', spacing, tuple(color), tuple(background), left), size, build)
+
+    def scrolling_grid(self, screen: pygame.Surface, spacing: int, color, background,
+                       offset: float):
+        """
+        Grid moving diagonally by `offset` (0 <= offset < spacing): one tile a
+        cell larger than the screen, blitted shifted instead of redrawn
+        """
+        width, height = screen.get_size()
+        tile = self.grid((width + spacing, height + spacing), spacing, color, background)
+        shift = int(offset) - spacing
+        screen.blit(tile, (shift, shift))
+
+    def invalidate(self):
+        """Drop every layer (they are rebuilt on next use)"""
+        self.layers.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return self.layers.get_stats()
+
+
+# Global instance
+background_layers = BackgroundLayers()
@@ -59,6 +59,7 @@ class UserPreferences:
     music_enabled: bool = True  # 新增：背景音乐开关
     selected_music: int = 0  # 新增：当前选中的音乐索引
     unlocked_music: List[int] = field(default_factory=lambda: [0, 1, 2])  # 新增：已解锁的音乐列表
+    record_replays: bool = False  # 将对局记录到 replays/ 供 python -m icg.replay 重放
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -0,0 +1,34 @@
+"""
+Lazy package exports (PEP 562)
+
+Packages whose exports need pygame (or have import-time side effects) list
+them in a mapping and call install(globals(), mapping) from their __init__:
+each export is imported on first attribute access, so headless code can
+import the package without loading them.
+"""
+
+import importlib
+from typing import Any, Dict, Tuple, Union
+
+# Export name -> '.module' (same attribute name) or ('.module', attribute)
+LazyTarget = Union[str, Tuple[str, str]]
+
+
+def install(namespace: Dict[str, Any], mapping: Dict[str, LazyTarget]):
+    """Give the package owning `namespace` a __getattr__ and __dir__ that resolve `mapping` lazily"""
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        target = mapping.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, attribute = target if isinstance(target, tuple) else (target, name)
+        value = getattr(importlib.import_module(module_name, package), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(mapping))
+
+    namespace['__getattr__'] = __getattr__
+    namespace['__dir__'] = __dir__
@@ -0,0 +1,165 @@
+"""
+Opening books - precomputed start positions in memory-mapped binary files
+
+A book holds fixed-size records (one struct format per book) split into
+groups by an integer key, e.g. the board length. Within a group the winning
+positions come first, so drawing a random winning start is a single index
+into the mapped file.
+
+Layout (little-endian):
+    magic b'ICGB', version u16, format length u16, format (ascii), group count u32
+    per group: key u32, first record u32, record count u32, winning count u32
+    records
+"""
+
+import mmap
+import os
+import random
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+BOOK_MAGIC = b'ICGB'
+BOOK_VERSION = 1
+_GROUP = '<IIII'
+
+# Books opened so far, by path (None for missing or unreadable files)
+_books: Dict[str, Optional["OpeningBook"]] = {}
+
+
+def write_book(path: str, record_format: str,
+               groups: Dict[int, Tuple[Sequence[tuple], Sequence[tuple]]]):
+    """Write a book; `groups` maps key -> (winning records, losing records)"""
+    record = struct.Struct(record_format)
+    fmt = record_format.encode('ascii')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    table = []
+    first = 0
+    for key in sorted(groups):
+        winning, losing = groups[key]
+        table.append((key, first, len(winning) + len(losing), len(winning)))
+        first += len(winning) + len(losing)
+
+    with open(path, 'wb') as f:
+        f.write(BOOK_MAGIC)
+        f.write(struct.pack('<HH', BOOK_VERSION, len(fmt)))
+        f.write(fmt)
+        f.write(struct.pack('<I', len(table)))
+        for entry in table:
+            f.write(struct.pack(_GROUP, *entry))
+        for key in sorted(groups):
+            winning, losing = groups[key]
+            for values in list(winning) + list(losing):
+                f.write(record.pack(*values))
+
+
+class OpeningBook:
+    """Read-only view of a book file, memory-mapped so nothing is parsed up front"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        data = self._map
+
+        if data[:len(BOOK_MAGIC)] != BOOK_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an opening book")
+        offset = len(BOOK_MAGIC)
+        version, fmt_length = struct.unpack_from('<HH', data, offset)
+        if version != BOOK_VERSION:
+            self.close()
+            raise ValueError(f"unsupported opening book version {version}")
+        offset += 4
+        self.record = struct.Struct(data[offset:offset + fmt_length].decode('ascii'))
+        offset += fmt_length
+        (group_count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+
+        # 组表很小，直接读入；记录本身留在映射里按需解包
+        self.groups: Dict[int, Tuple[int, int, int]] = {}
+        for _ in range(group_count):
+            key, first, count, winning = struct.unpack_from(_GROUP, data, offset)
+            self.groups[key] = (first, count, winning)
+            offset += struct.calcsize(_GROUP)
+        self._records_offset = offset
+
+    @classmethod
+    def open(cls, path: str) -> Optional["OpeningBook"]:
+        """Open a book, or None (with a warning for broken files) if it cannot be used"""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: ignoring opening book {path}: {e}")
+            return None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    # ---------- Queries ----------
+
+    def keys(self) -> List[int]:
+        return sorted(self.groups)
+
+    def count(self, key: int) -> int:
+        """Number of positions stored under `key`"""
+        group = self.groups.get(key)
+        return group[1] if group else 0
+
+    def winning_count(self, key: int) -> int:
+        """Number of winning positions stored under `key`"""
+        group = self.groups.get(key)
+        return group[2] if group else 0
+
+    def record_at(self, key: int, index: int) -> tuple:
+        """Unpacked record `index` of group `key` (winning records first)"""
+        first, count, _ = self.groups[key]
+        if not 0 <= index < count:
+            raise IndexError(index)
+        return self.record.unpack_from(self._map, self._records_offset + (first + index) * self.record.size)
+
+    def iter_records(self, key: int, winning: Optional[bool] = None) -> Iterable[tuple]:
+        """Records of a group, optionally only the winning or only the losing ones"""
+        first, count, wins = self.groups.get(key, (0, 0, 0))
+        start, stop = {None: (0, count), True: (0, wins), False: (wins, count)}[winning]
+        for index in range(start, stop):
+            yield self.record_at(key, index)
+
+    def random_winning(self, keys: Sequence[int], rng=random) -> Optional[Tuple[int, tuple]]:
+        """(key, record) for a winning position drawn uniformly over all winning records of `keys`"""
+        pick = rng.randrange(sum(self.winning_count(key) for key in keys) or 1)
+        for key in keys:
+            if pick < self.winning_count(key):
+                return key, self.record_at(key, pick)
+            pick -= self.winning_count(key)
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'groups': len(self.groups),
+            'records': sum(count for _, count, _ in self.groups.values()),
+            'winning': sum(wins for _, _, wins in self.groups.values()),
+            'bytes': len(self._map),
+        }
+
+
+def get_book(path: str) -> Optional[OpeningBook]:
+    """Shared, lazily opened book for `path`, or None if there is no usable file"""
+    path = os.path.normpath(path)
+    if path not in _books:
+        _books[path] = OpeningBook.open(path)
+    return _books[path]
+
+
+def forget_book(path: str):
+    """Close and drop a cached book, e.g. after regenerating the file"""
+    book = _books.pop(os.path.normpath(path), None)
+    if book is not None:
+        book.close()
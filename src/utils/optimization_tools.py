@@ -64,33 +64,109 @@ class MemoryOptimizer:
             for key in keys_to_remove:
                 del surface_cache[key]
 
+# Frame pacing for screens that are waiting for input
+IDLE_WAIT_MS = 100   # longest sleep on the event queue between idle frames
+HOVER_MARGIN = 12    # hover damage also covers a component's shadow and glow
+
+# Input that may change anything on screen. Pointer motion is not listed: the
+# components under the pointer mark their own rects when their hover changes
+REDRAW_EVENTS = [
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.ACTIVEEVENT,
+    pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED, pygame.USEREVENT,
+]
+
 class RenderOptimizer:
-    """Optimize rendering performance"""
+    """
+    Dirty-region renderer shared by every screen loop.
+
+    Components mark the rects they damage (hover, blinking cursor, pending
+    tooltip); key presses, clicks, window events, layout and game-state
+    changes mark the whole screen. A frame with no damage is not drawn at all
+    (the loop sleeps on the event queue instead), and a frame whose damage is
+    a few rects is drawn clipped to them and presented with
+    pygame.display.update(rects) instead of a full flip.
+    """
     
     def __init__(self):
         self.render_calls = 0
         self.batch_render = True
-        self.use_dirty_rects = False
+        self.use_dirty_rects = True
         self.dirty_rects = []
+        self.full_redraw = True
+        self.was_animating = False
+        self.frame_rects = None  # damage being drawn this frame; None = whole screen
+        self.last_present = 0
+        self.frames_drawn = 0
+        self.frames_partial = 0
+        self.frames_skipped = 0
     
-    def begin_frame(self):
-        """Begin a new render frame"""
+    def begin_frame(self, surface: pygame.Surface = None):
+        """
+        Begin a new render frame; partial damage clips drawing to the damaged area.
+        Damage marked while drawing is kept for the next frame.
+        """
         self.render_calls = 0
-        if self.use_dirty_rects:
-            self.dirty_rects = []
+        if self.use_dirty_rects and not self.full_redraw and self.dirty_rects:
+            self.frame_rects = self.get_dirty_rects()
+            if surface is not None:
+                surface.set_clip(self.frame_rects[0].unionall(self.frame_rects[1:]))
+        else:
+            self.frame_rects = None
+        self.dirty_rects = []
+        self.full_redraw = False
+    
+    def mark_dirty(self, rect=None):
+        """Register a damaged screen region (None: the whole screen)"""
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(pygame.Rect(rect))
+    
+    def mark_input(self, pointer: bool = False):
+        """
+        Damage from queued input: anything but pointer motion redraws the whole
+        screen. `pointer` also redraws it on motion, for overlays that draw
+        straight from the mouse position instead of marking their own rects.
+        """
+        if pygame.event.peek(REDRAW_EVENTS) or (pointer and pygame.event.peek(pygame.MOUSEMOTION)):
+            self.full_redraw = True
+    
+    def set_hovered(self, component, hovered: bool, rect=None):
+        """Update a component's hover flag, marking its rect (default: component.rect) when it flips"""
+        hovered = bool(hovered)
+        if component.hovered != hovered:
+            component.hovered = hovered
+            rect = component.rect if rect is None else pygame.Rect(rect)
+            self.mark_dirty(rect.inflate(HOVER_MARGIN, HOVER_MARGIN))
     
     def track_render_call(self, rect: pygame.Rect = None):
         """Track a render call for optimization"""
         self.render_calls += 1
         
         if self.use_dirty_rects and rect:
-            self.dirty_rects.append(rect)
+            self.dirty_rects.append(pygame.Rect(rect))
     
     def should_use_dirty_rects(self, avg_fps: float) -> bool:
         """Determine if dirty rects should be used based on FPS"""
         # Use dirty rects if FPS is low
         return avg_fps < 30
     
+    def needs_redraw(self, animating: bool = False, ambient_ms: int = None) -> bool:
+        """
+        Whether this frame has to be drawn. Animating screens redraw everything,
+        plus one frame after they stop so the final state is shown; `ambient_ms`
+        keeps decorative backgrounds moving at a low rate while otherwise idle.
+        """
+        if animating or self.was_animating:
+            self.full_redraw = True
+        elif ambient_ms is not None and pygame.time.get_ticks() - self.last_present >= ambient_ms:
+            self.full_redraw = True
+        self.was_animating = animating
+        return self.full_redraw or bool(self.dirty_rects)
+    
     def get_dirty_rects(self) -> List[pygame.Rect]:
         """Get dirty rectangles for update"""
         if not self.dirty_rects:
@@ -110,6 +186,38 @@ class RenderOptimizer:
                 merged_rects.append(rect)
         
         return merged_rects
+    
+    def present(self):
+        """Show the frame: only the merged dirty rects when just those changed, else a full flip"""
+        surface = pygame.display.get_surface()
+        if surface is not None:
+            surface.set_clip(None)
+        
+        if self.frame_rects:
+            pygame.display.update(self.frame_rects)
+            self.frames_partial += 1
+        else:
+            pygame.display.flip()
+        
+        self.frames_drawn += 1
+        self.frame_rects = None
+        self.last_present = pygame.time.get_ticks()
+    
+    def wait_for_input(self, timeout_ms: int = IDLE_WAIT_MS):
+        """Idle frame: sleep on the event queue instead of drawing; an arriving event stays queued"""
+        self.frames_skipped += 1
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get frame statistics"""
+        return {
+            'frames_drawn': self.frames_drawn,
+            'frames_partial': self.frames_partial,
+            'frames_skipped': self.frames_skipped,
+            'using_dirty_rects': self.use_dirty_rects
+        }
 
 class AssetOptimizer:
     """Optimize asset loading and usage"""
@@ -177,12 +285,6 @@ def optimize_game_performance():
     from .performance_monitor import performance_monitor
     stats = performance_monitor.get_performance_stats()
     
-    # Adjust rendering strategy based on performance
-    if stats.get('fps', 60) < 30:
-        render_optimizer.use_dirty_rects = True
-    else:
-        render_optimizer.use_dirty_rects = False
-    
     return {
         'memory_mb': memory_usage,
         'fps': stats.get('fps', 0),
@@ -6,6 +6,8 @@ import time
 import pygame
 from typing import Dict, List, Optional
 from collections import deque
+from utils.text_cache import text_cache
+from utils.resource_cache import resource_cache
 
 class PerformanceMonitor:
     """Monitor game performance and FPS"""
@@ -145,16 +147,16 @@ class PerformanceMonitor:
         ]
         
         for line in lines:
-            text = font.render(line, True, (255, 255, 255))
+            text = text_cache.render(font, line, True, (255, 255, 255))
             overlay.blit(text, (10, y_pos))
             y_pos += 15
         
         # Draw warnings
         if warnings:
             y_pos += 5
-            warning_font = pygame.font.SysFont('Arial', 12)
+            warning_font = resource_cache.get_sys_font('Arial', 12)
             for warning in warnings:
-                text = warning_font.render(warning, True, (255, 200, 100))
+                text = text_cache.render(warning_font, warning, True, (255, 200, 100))
                 overlay.blit(text, (10, y_pos))
                 y_pos += 15
         
@@ -0,0 +1,151 @@
+"""
+Position analysis shared by the game solvers
+
+A solver's analyze_position() looks at every move once and reports, per move,
+whether it wins, how many winning replies the opponent keeps and how many
+plies remain under perfect play. Hints, position analysis and the AI read the
+same cached result instead of re-solving the children themselves.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+from utils.bounded_cache import BoundedCache
+
+# Positions whose analysis is kept per solver
+ANALYSIS_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class MoveAnalysis:
+    """One move of an analysed position"""
+    move: Any
+    winning: bool                  # leaves the opponent in a losing position
+    opponent_winning_replies: int  # winning moves the opponent has afterwards
+    depth: Optional[int]           # plies left after the move with perfect play (None: not searched)
+
+
+@dataclass(frozen=True)
+class PositionAnalysis:
+    """Every move of a position, in the game's own move order"""
+    moves: Tuple[MoveAnalysis, ...]
+
+    @property
+    def winning(self) -> bool:
+        return any(move.winning for move in self.moves)
+
+    @property
+    def winning_moves(self) -> List[Any]:
+        return [move.move for move in self.moves if move.winning]
+
+    @property
+    def depth(self) -> Optional[int]:
+        """Plies to the end: the winner takes the fastest win, the loser the slowest loss"""
+        if not self.moves:
+            return 0
+        candidates = [move.depth for move in self.moves if move.winning == self.winning]
+        if any(depth is None for depth in candidates):
+            return None
+        return 1 + (min(candidates) if self.winning else max(candidates))
+
+    def get(self, move) -> Optional[MoveAnalysis]:
+        for analysis in self.moves:
+            if analysis.move == move:
+                return analysis
+        return None
+
+    def best(self) -> Optional[MoveAnalysis]:
+        """
+        The fastest winning move; in a losing position the move that leaves
+        the opponent the fewest winning replies, then the longest game
+        """
+        if not self.moves:
+            return None
+        if self.winning:
+            return min((move for move in self.moves if move.winning),
+                       key=lambda move: (move.depth is None, move.depth or 0))
+        return min(self.moves, key=lambda move: (move.opponent_winning_replies, -(move.depth or 0)))
+
+
+def analysis_cache() -> BoundedCache:
+    """Cache for one solver's analyses, keyed by exact position"""
+    return BoundedCache(max_entries=ANALYSIS_CACHE_SIZE)
+
+
+class DepthSearch:
+    """
+    Depth-to-end of positions under perfect play, by exhaustive search.
+
+    `children` maps a position key to the keys reachable in one move. Results
+    are memoised across calls; a search that would expand more than
+    `max_nodes` new positions gives up and returns None (whatever it finished
+    stays memoised, so the next call starts further along).
+    """
+
+    def __init__(self, children: Callable[[Hashable], Iterable[Hashable]],
+                 max_nodes: int = 20000, max_entries: int = 1 << 16):
+        self.children = children
+        self.max_nodes = max_nodes
+        self.table = BoundedCache(max_entries=max_entries)
+
+    def solve(self, key: Hashable) -> Optional[Tuple[bool, int]]:
+        """(player to move wins, plies to the end), or None if over budget"""
+        return self._solve(key, self.max_nodes)[0]
+
+    def _solve(self, key: Hashable, max_nodes: int):
+        """(solve result, new positions expanded) with at most max_nodes expansions"""
+        entry = self.table.get(key)
+        if entry is not None or max_nodes <= 0:
+            return entry, 0
+
+        nodes = 0
+        # Explicit stack: games like Subtract Factor can run hundreds of plies deep
+        # frame = [key, children, next child, fastest win, slowest loss]
+        stack = [[key, list(self.children(key)), 0, None, 0]]
+        while True:
+            frame = stack[-1]
+            if frame[2] < len(frame[1]):
+                child = frame[1][frame[2]]
+                entry = self.table.get(child)
+                if entry is None:
+                    nodes += 1
+                    if nodes > max_nodes:
+                        return None, nodes
+                    stack.append([child, list(self.children(child)), 0, None, 0])
+                    continue
+            else:
+                stack.pop()
+                entry = (True, frame[3]) if frame[3] is not None else (False, frame[4])
+                self.table.put(frame[0], entry)
+                if not stack:
+                    return entry, nodes
+                frame = stack[-1]
+
+            # Fold a solved child into its parent
+            child_winning, child_depth = entry
+            if not child_winning:
+                frame[3] = child_depth + 1 if frame[3] is None else min(frame[3], child_depth + 1)
+            else:
+                frame[4] = max(frame[4], child_depth + 1)
+            frame[2] += 1
+
+    def depth(self, key: Hashable) -> Optional[int]:
+        """Plies to the end under perfect play, or None if over budget"""
+        entry = self.solve(key)
+        return entry[1] if entry else None
+
+    def depths(self, keys: Iterable[Hashable]) -> List[Optional[int]]:
+        """
+        Depth of every key, sharing one `max_nodes` budget across all of them:
+        once it runs out, keys not already memoised get None
+        """
+        budget = self.max_nodes
+        results = []
+        for key in keys:
+            entry, nodes = self._solve(key, budget)
+            budget -= nodes
+            results.append(entry[1] if entry else None)
+        return results
+
+    def get_stats(self):
+        return self.table.get_stats()
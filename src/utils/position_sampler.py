@@ -0,0 +1,155 @@
+"""
+Outcome-indexed position samplers for game setup
+
+Instead of drawing random positions until one has the wanted outcome, the
+setup code asks a sampler for a winning (N) or losing (P) position directly:
+
+    PositionIndex       every position enumerated once, split by outcome
+    NimPositionSampler  Nim positions built pile by pile from XOR counts
+
+Both draw a position of the requested class in time that does not depend on
+how rare that class is. The board size (key or pile count) is picked first,
+uniformly among the sizes that have such a position, as the unindexed setup
+code does; larger boards would otherwise crowd out the small ones.
+"""
+
+import bisect
+import random
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+class PositionIndex:
+    """Positions grouped by a key (e.g. board size) and by outcome"""
+
+    def __init__(self):
+        self.groups: Dict[Hashable, Tuple[List[Any], List[Any]]] = {}
+
+    @classmethod
+    def build(cls, keys: Iterable[Hashable], positions: Callable[[Hashable], Iterable[Any]],
+              is_winning: Callable[[Any], bool]) -> "PositionIndex":
+        """Enumerate positions(key) for every key and classify each with is_winning"""
+        index = cls()
+        for key in keys:
+            index.groups.setdefault(key, ([], []))
+            for position in positions(key):
+                index.add(key, position, is_winning(position))
+        return index
+
+    def add(self, key: Hashable, position: Any, winning: bool):
+        winning_list, losing_list = self.groups.setdefault(key, ([], []))
+        (winning_list if winning else losing_list).append(position)
+
+    def count(self, winning: bool, keys: Optional[Iterable[Hashable]] = None) -> int:
+        """Number of indexed positions of one class"""
+        keys = self.groups if keys is None else keys
+        return sum(len(self.groups[key][0 if winning else 1]) for key in keys if key in self.groups)
+
+    def sample(self, winning: bool, keys: Optional[Sequence[Hashable]] = None,
+               rng=random) -> Optional[Tuple[Hashable, Any]]:
+        """(key, position) drawn uniformly from the class over `keys` (default all); None if empty"""
+        keys = list(self.groups) if keys is None else [key for key in keys if key in self.groups]
+        side = 0 if winning else 1
+        cumulative = []
+        total = 0
+        for key in keys:
+            total += len(self.groups[key][side])
+            cumulative.append(total)
+        if not total:
+            return None
+        pick = rng.randrange(total)
+        slot = bisect.bisect_right(cumulative, pick)
+        positions = self.groups[keys[slot]][side]
+        return keys[slot], positions[pick - (cumulative[slot] - len(positions))]
+
+    def sample_by_key(self, winning: bool, keys: Optional[Sequence[Hashable]] = None,
+                      rng=random) -> Optional[Tuple[Hashable, Any]]:
+        """(key, position): a key uniform over those of `keys` holding the class, then a position of it"""
+        keys = list(self.groups) if keys is None else keys
+        side = 0 if winning else 1
+        keys = [key for key in keys if key in self.groups and self.groups[key][side]]
+        if not keys:
+            return None
+        key = rng.choice(keys)
+        return key, rng.choice(self.groups[key][side])
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'keys': len(self.groups),
+            'winning': self.count(True),
+            'losing': self.count(False),
+        }
+
+
+class NimPositionSampler:
+    """
+    Random Nim positions of min_piles..max_piles piles holding 1..max_cards cards.
+
+    ways[r][x] counts the ways r more piles can XOR to x. A position is drawn
+    pile by pile, each pile value weighted by how many completions still reach
+    the wanted nim-sum, so every draw succeeds on the first try. A position is
+    losing exactly when its nim-sum is zero.
+    """
+
+    def __init__(self, min_piles: int, max_piles: int, max_cards: int):
+        self.min_piles = min_piles
+        self.max_piles = max_piles
+        self.max_cards = max_cards
+        self.width = 1 << max_cards.bit_length()
+
+        ways = [[0] * self.width]
+        ways[0][0] = 1
+        for _ in range(max_piles):
+            previous = ways[-1]
+            current = [0] * self.width
+            for x, count in enumerate(previous):
+                if count:
+                    for card in range(1, max_cards + 1):
+                        current[x ^ card] += count
+            ways.append(current)
+        self.ways = ways
+
+    def count(self, piles: int, winning: bool) -> int:
+        """Number of positions with `piles` piles in the class"""
+        row = self.ways[piles]
+        return sum(row) - row[0] if winning else row[0]
+
+    def sample(self, winning: bool, rng=random) -> Optional[List[int]]:
+        """
+        Random position of the class: the pile count is uniform over the counts
+        in range that have one, the position uniform among those; None if empty
+        """
+        counts = [piles for piles in range(self.min_piles, self.max_piles + 1) if self.count(piles, winning)]
+        if not counts:
+            return None
+        piles = rng.choice(counts)
+
+        # Fix the final nim-sum first, then build the piles that reach it
+        if winning:
+            row = self.ways[piles]
+            pick = rng.randrange(self.count(piles, True))
+            target = 1
+            while pick >= row[target]:
+                pick -= row[target]
+                target += 1
+        else:
+            target = 0
+
+        positions = []
+        for remaining in range(piles - 1, -1, -1):
+            row = self.ways[remaining]
+            options = [(card, row[target ^ card]) for card in range(1, self.max_cards + 1)]
+            pick = rng.randrange(sum(count for _, count in options))
+            for card, count in options:
+                if pick < count:
+                    break
+                pick -= count
+            positions.append(card)
+            target ^= card
+        return positions
+
+    def get_stats(self) -> Dict[str, int]:
+        piles = range(self.min_piles, self.max_piles + 1)
+        return {
+            'winning': sum(self.count(n, True) for n in piles),
+            'losing': sum(self.count(n, False) for n in piles),
+        }
@@ -0,0 +1,184 @@
+"""
+Replay recorder - seeded move logs for every game
+
+A log is one JSON object per line: a "start" record with the game id, a seed
+and the starting position (core.engine export_state), one "move" record per
+move and an "end" record with the winner. Lines are flushed as they are
+written, so a crash keeps everything up to the last move. Before each AI turn
+the global RNG is reseeded from (seed, ply), which lets the replayer
+(core.engine.replay) reproduce the AI's decisions exactly.
+"""
+
+import json
+import os
+import random
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+REPLAY_FORMAT_VERSION = 1
+DEFAULT_REPLAY_DIR = "replays"
+
+
+def ai_seed(seed: int, ply: int) -> int:
+    """RNG seed for the AI turn at `ply` of a recorded game"""
+    return seed * 1000003 + ply
+
+
+class ReplayRecorder:
+    """Writes the games played on logic objects to a session log"""
+
+    def __init__(self, directory: str = DEFAULT_REPLAY_DIR):
+        self.directory = directory
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.games_recorded = 0
+        self._file = None
+        self._logic = None
+        self._engine = None
+        self._seed = 0
+        self._ply = 0
+        self._ai_turn = False
+
+    def enable(self, directory: Optional[str] = None):
+        """Start recording; the session file is created with the first game"""
+        if directory is not None and directory != self.directory:
+            self.close()
+            self.directory = directory
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording and close the session file"""
+        self.enabled = False
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._logic = None
+        self._engine = None
+
+    # ---------- Hooks called by the logic classes ----------
+
+    def start_game(self, game_id: str, logic):
+        """A logic object has just been initialised with a new game"""
+        # 延迟导入：core.engine 依赖各游戏的 logic 模块
+        from core.engine import ENGINES
+
+        engine_class = ENGINES.get(game_id)
+        if engine_class is None:
+            print(f"⚠️ Replay recorder: unknown game {game_id}")
+            return
+        self._logic = logic
+        self._engine = engine_class(logic)
+        self._seed = random.randrange(2 ** 31)
+        self._ply = 0
+        self._ai_turn = False
+        self.games_recorded += 1
+        self._write({
+            'type': 'start',
+            'version': REPLAY_FORMAT_VERSION,
+            'game': game_id,
+            'seed': self._seed,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'state': self._engine.export_state(),
+        })
+
+    def begin_ai_turn(self, logic) -> bool:
+        """Reseed the RNG for the AI turn about to be played on `logic`"""
+        if logic is not self._logic:
+            return False
+        random.seed(ai_seed(self._seed, self._ply))
+        self._ai_turn = True
+        return True
+
+    def end_ai_turn(self):
+        self._ai_turn = False
+
+    def record_move(self, logic, move: Any, player: str):
+        """A move played by `player` succeeded on `logic`"""
+        if logic is not self._logic:
+            return
+        record = {'type': 'move', 'ply': self._ply, 'seat': self._engine.seat(player), 'move': move}
+        if self._ai_turn:
+            record['ai'] = True
+        self._write(record)
+        self._ply += 1
+
+        if logic.game_over:
+            winner = None if logic.winner is None else self._engine.seat(logic.winner)
+            self._write({'type': 'end', 'plies': self._ply, 'winner': winner})
+            self._logic = None
+            self._engine = None
+
+    # ---------- Output ----------
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, time.strftime('session-%Y%m%d-%H%M%S.jsonl'))
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def _write(self, record):
+        try:
+            if self._file is None:
+                self._open()
+            self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+            self._file.flush()
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Replay recording disabled: {e}")
+            self.disable()
+
+
+# Global replay recorder instance
+replay_recorder = ReplayRecorder()
+
+
+# ---------- Decorators for the logic classes ----------
+
+def record_game_start(game_id: str) -> Callable:
+    """Decorator for initialize_game: log the new starting position"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(logic, *args, **kwargs):
+            result = func(logic, *args, **kwargs)
+            if replay_recorder.enabled:
+                replay_recorder.start_game(game_id, logic)
+            return result
+        return wrapper
+    return decorator
+
+
+def record_move(encode: Callable[..., Any]) -> Callable:
+    """
+    Decorator for make_move: log the move when it succeeds
+
+    `encode` gets make_move's arguments (logic first) and returns the move in
+    the JSON form the game's engine accepts.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(logic, *args, **kwargs):
+            if not replay_recorder.enabled:
+                return func(logic, *args, **kwargs)
+            move = encode(logic, *args, **kwargs)
+            player = logic.current_player
+            result = func(logic, *args, **kwargs)
+            if result and replay_recorder.enabled:
+                replay_recorder.record_move(logic, move, player)
+            return result
+        return wrapper
+    return decorator
+
+
+def record_ai_turn(func: Callable) -> Callable:
+    """Decorator for ai_make_move: seed the AI so replays can reproduce its choice"""
+    @wraps(func)
+    def wrapper(logic, *args, **kwargs):
+        if not (replay_recorder.enabled and replay_recorder.begin_ai_turn(logic)):
+            return func(logic, *args, **kwargs)
+        try:
+            return func(logic, *args, **kwargs)
+        finally:
+            replay_recorder.end_ai_turn()
+    return wrapper
@@ -5,6 +5,7 @@ Resource caching system for efficient asset loading
 import pygame
 import os
 from typing import Dict, Any, Optional
+from utils.text_cache import text_cache
 
 class ResourceCache:
     """Singleton resource cache for images, fonts, and other assets"""
@@ -48,6 +49,16 @@ class ResourceCache:
             print(f"Error loading image {path}: {e}")
             return None
     
+    def get_sys_font(self, name: Optional[str], size: int, bold: bool = False,
+                     italic: bool = False) -> pygame.font.Font:
+        """Get a system font from cache or create it (one object per font keeps text_cache hits)"""
+        key = f"sys:{name}:{size}:{int(bold)}{int(italic)}"
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self.fonts[key] = font
+        return font
+    
     def preload_images(self, image_paths: Dict[str, str]):
         """Preload multiple images"""
         for key, path in image_paths.items():
@@ -61,6 +72,7 @@ class ResourceCache:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        text_stats = text_cache.get_stats()
         return {
             'images_cached': len(self.images),
             'sounds_cached': len(self.sounds),
@@ -68,7 +80,11 @@ class ResourceCache:
             'cache_hits': self.cache_hits,
             'cache_misses': self.cache_misses,
             'hit_rate': self.cache_hits / (self.cache_hits + self.cache_misses) 
-                       if (self.cache_hits + self.cache_misses) > 0 else 0
+                       if (self.cache_hits + self.cache_misses) > 0 else 0,
+            'text_surfaces_cached': text_stats['entries'],
+            'text_cache_hits': text_stats['cache_hits'],
+            'text_cache_misses': text_stats['cache_misses'],
+            'text_hit_rate': text_stats['hit_rate']
         }
     
     def optimize_memory(self, max_images: int = 50):
@@ -0,0 +1,100 @@
+"""
+Sprite atlas - game pieces pre-rendered once into shared texture pages
+
+Each visual state of a piece (a tower per owner, a coin stack per height, a
+card pile per size bucket...) is drawn the first time it is needed into a free
+region of a large SRCALPHA page. Boards are then drawn by handing the
+(page, dest, area) items of all their pieces to one Surface.blits() call.
+
+Sprites are drawn on transparent pixels, so builders should use opaque colours
+(the alpha of a colour drawn straight onto the screen was ignored anyway) and
+leave text to text_cache, blitted in the same batch.
+"""
+
+import pygame
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+from utils.bounded_cache import BoundedCache
+
+ATLAS_PAGE_SIZE = 1024   # width and height of one texture page
+ATLAS_MAX_PAGES = 8      # the atlas starts over when it would need more
+
+# One item of a Surface.blits() batch: (source, dest, area)
+BlitItem = Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]
+
+
+class SpriteAtlas:
+    """Shelf-packed texture pages holding every pre-rendered sprite state"""
+
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE, max_pages: int = ATLAS_MAX_PAGES):
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # key -> (page, area); the counters come from the cache, eviction never triggers
+        self.sprites = BoundedCache(max_entries=1 << 20)
+        self.pages: List[pygame.Surface] = []
+        self.page = None       # page the shelves are being filled on
+        self.shelf_x = 0       # next free x on the current shelf
+        self.shelf_y = 0       # top of the current shelf
+        self.shelf_height = 0  # tallest sprite on the current shelf
+
+    def _allocate(self, width: int, height: int) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Reserve a width x height region, opening a new shelf or page when needed"""
+        if width > self.page_size or height > self.page_size:
+            # Oversized sprites get a page of their own
+            page = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.pages.append(page)
+            return page, pygame.Rect(0, 0, width, height)
+
+        if self.page is not None and self.shelf_x + width > self.page_size:
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height
+            self.shelf_height = 0
+        if self.page is None or self.shelf_y + height > self.page_size:
+            if len(self.pages) >= self.max_pages:
+                self.clear()
+            self.page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+            self.pages.append(self.page)
+            self.shelf_x = self.shelf_y = self.shelf_height = 0
+
+        area = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return self.page, area
+
+    def get(self, key: Hashable, size: Tuple[int, int],
+            builder: Callable[[pygame.Surface], None]) -> Tuple[pygame.Surface, pygame.Rect]:
+        """The sprite `key` as (page, area), drawn by builder(surface) on first use"""
+        entry = self.sprites.get(key)
+        if entry is None:
+            width, height = max(1, int(size[0])), max(1, int(size[1]))
+            page, area = self._allocate(width, height)
+            builder(page.subsurface(area))
+            entry = (page, area)
+            self.sprites.put(key, entry)
+        return entry
+
+    def item(self, key: Hashable, size: Tuple[int, int],
+             builder: Callable[[pygame.Surface], None], dest: Tuple[int, int]) -> BlitItem:
+        """A Surface.blits() item drawing the sprite `key` at `dest`"""
+        page, area = self.get(key, size, builder)
+        return page, dest, area
+
+    def clear(self):
+        """Drop every page (sprites are rebuilt on next use)"""
+        self.sprites.clear()
+        self.pages = []
+        self.page = None
+        self.shelf_x = self.shelf_y = self.shelf_height = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.sprites.get_stats()
+        return {
+            'sprites': stats['entries'],
+            'pages': len(self.pages),
+            'cache_hits': stats['cache_hits'],
+            'cache_misses': stats['cache_misses'],
+            'hit_rate': stats['hit_rate']
+        }
+
+
+# Global instance
+sprite_atlas = SpriteAtlas()
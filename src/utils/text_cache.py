@@ -0,0 +1,52 @@
+"""
+Text cache - rendered text surfaces shared by all UI code
+
+Most labels are the same string in the same font and colour every frame, so
+text_cache.render() rasterizes each one once and hands back the stored surface
+afterwards. Cached surfaces are shared: blit them, never draw on them.
+"""
+
+import pygame
+from typing import Any, Dict
+from utils.bounded_cache import BoundedCache
+
+# Text surfaces kept at once: every static label plus a few screens of changing numbers
+TEXT_CACHE_SIZE = 1024
+
+
+def _color_key(color):
+    """Hashable form of a colour (tuples, lists, pygame.Color or a colour name)"""
+    if color is None or isinstance(color, str):
+        return color
+    return tuple(color)
+
+
+class TextCache:
+    """LRU cache of font.render() results keyed by (font, text, antialias, color, background)"""
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.surfaces = BoundedCache(max_entries)
+
+    def render(self, font: pygame.font.Font, text: str, antialias, color,
+               background=None) -> pygame.Surface:
+        """Same arguments and result as font.render(), rasterized only on a cache miss"""
+        key = (font, text, bool(antialias), _color_key(color), _color_key(background))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if background is None:
+                surface = font.render(text, antialias, color)
+            else:
+                surface = font.render(text, antialias, color, background)
+            self.surfaces.put(key, surface)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.surfaces.get_stats()
+
+
+# Global instance
+text_cache = TextCache()